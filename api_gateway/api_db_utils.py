@@ -3,31 +3,88 @@
 API Database Utility Functions
 
 This module provides utility functions to query the PostgreSQL database containing
-the ConnectWise API endpoint information.
+the ConnectWise API endpoint information. Catalog lookups (categories, endpoint details,
+path/method resolution) are served from an in-memory EndpointCatalog that is reloaded
+when the database's build generation changes. Searches are planned by the SearchEngine
+as a single statement per call.
 """
 
 import json
 import re
+import time
+import logging
+import threading
 from typing import Dict, List, Any, Optional, Union, Tuple
 from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 from contextlib import contextmanager
+from api_gateway.catalog import EndpointCatalog, get_catalog_config
+from api_gateway.lru import BoundedLRU
+from api_gateway.search_engine import SearchEngine, extract_keywords, get_search_cache_config, normalize_query
+from api_gateway.search_terms import query_terms, tokenize
+from api_gateway.semantic_search import SemanticIndex, get_semantic_config, numpy_available
+
+# Modes accepted by search_by_natural_language
+SEARCH_MODES = ('auto', 'fulltext', 'semantic')
+
+# Reciprocal rank fusion constant used to merge full-text and semantic results
+RRF_K = 60
+
+# Set up logging
+logger = logging.getLogger("api_gateway.api_db")
+
+def _parse_body_documents(body: Dict[str, Any]) -> None:
+    """Parse a body row's schema and example in place if they arrive as text (pre-JSONB databases)."""
+    for key in ('schema', 'example'):
+        if isinstance(body.get(key), str) and body[key]:
+            try:
+                body[key] = json.loads(body[key])
+            except json.JSONDecodeError:
+                pass
 
 class APIDatabase:
     """Class to handle queries to the ConnectWise API PostgreSQL database."""
 
-    def __init__(self, database_url: str):
-        """Initialize the database connection."""
+    def __init__(self, database_url: str, **engine_kwargs):
+        """
+        Initialize the database connection.
+
+        Args:
+            database_url: PostgreSQL database URL
+            **engine_kwargs: Additional arguments for SQLAlchemy engine (e.g. pool sizing)
+        """
         self.database_url = database_url
         self.engine = None
         self.SessionLocal = None
-        self.connect()
-
-    def connect(self) -> None:
+        self.connect(**engine_kwargs)
+
+        self.catalog_config = get_catalog_config()
+        self._catalog: Optional[EndpointCatalog] = None
+        self._catalog_retry_at = 0.0
+        self._catalog_lock = threading.Lock()
+        self._generation: Optional[int] = None
+        self._generation_checked_at = 0.0
+        self._details_cache = BoundedLRU(self.catalog_config['details_cache_size'])
+        if self.catalog_config['enabled']:
+            self.get_catalog()
+
+        # Detect search capabilities once up front instead of on every search
+        self.search_engine = SearchEngine(self.get_session)
+        self.search_engine.capabilities(self._current_generation())
+        search_cache_config = get_search_cache_config()
+        self._search_cache = BoundedLRU(search_cache_config['max_entries'], search_cache_config['max_bytes'])
+
+        self.semantic_config = get_semantic_config()
+        self._semantic_index: Optional[SemanticIndex] = None
+        self._semantic_generation: Optional[int] = None
+        self._semantic_retry_at = 0.0
+        self._semantic_lock = threading.Lock()
+
+    def connect(self, **engine_kwargs) -> None:
         """Establish a connection to the PostgreSQL database."""
         try:
-            self.engine = create_engine(self.database_url)
+            self.engine = create_engine(self.database_url, **engine_kwargs)
             self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
         except Exception as e:
             raise Exception(f"Failed to connect to PostgreSQL database: {e}")
@@ -55,75 +112,300 @@ class APIDatabase:
             self.engine = None
             self.SessionLocal = None
 
-    def has_fulltext_search(self) -> bool:
-        """Check if full-text search features are available in the database."""
+    def get_catalog_generation(self) -> int:
+        """Get the current catalog build generation (0 if no build has been recorded)."""
         try:
             with self.get_session() as session:
-                # Check if search_vector column exists
-                result = session.execute(text("""
-                    SELECT column_name
-                    FROM information_schema.columns
-                    WHERE table_name = 'endpoints' AND column_name = 'search_vector'
-                """))
-                column_exists = result.fetchone() is not None
-
-                if not column_exists:
-                    return False
-
-                # Check if there's data in search_vector (not all NULL)
-                result = session.execute(text("""
-                    SELECT COUNT(*) as total, COUNT(search_vector) as with_vector
-                    FROM endpoints
-                    LIMIT 1
-                """))
-                row = result.fetchone()
-                return row is not None and row.total > 0 and row.with_vector > 0
+                result = session.execute(text('SELECT COALESCE(MAX(id), 0) AS generation FROM catalog_builds'))
+                return result.fetchone().generation
+        except SQLAlchemyError:
+            # Databases built before catalog_builds existed have a single generation
+            return 0
+
+    def _current_generation(self) -> int:
+        """Get the build generation, querying the database at most once per refresh interval."""
+        now = time.monotonic()
+        if self._generation is None or now - self._generation_checked_at >= self.catalog_config['refresh_interval']:
+            self._generation = self.get_catalog_generation()
+            self._generation_checked_at = now
+        return self._generation
+
+    def load_catalog(self, generation: Optional[int] = None) -> EndpointCatalog:
+        """
+        Read the whole endpoint catalog into memory.
 
-        except Exception:
-            return False
+        Args:
+            generation: Build generation being loaded (read from the database if omitted)
 
-    def search_endpoints(self, query: str) -> List[Dict[str, Any]]:
+        Returns:
+            The loaded catalog
         """
-        Search for API endpoints matching the query using full-text search.
+        if generation is None:
+            generation = self.get_catalog_generation()
+
+        start = time.perf_counter()
+        try:
+            with self.get_session() as session:
+                endpoints = [dict(row._mapping) for row in session.execute(text(
+                    'SELECT id, path, method, description, category, summary, tags, keywords FROM endpoints'
+                ))]
+                parameters = [dict(row._mapping) for row in session.execute(text('SELECT * FROM parameters ORDER BY id'))]
+                # Documents are read as text so identical ones are parsed once and shared;
+                # each distinct schema is read once and bodies reference it by id
+                schemas = dict(session.execute(text('SELECT id, document::text FROM schemas')).fetchall())
+                request_bodies = [dict(row._mapping) for row in session.execute(text(
+                    'SELECT id, endpoint_id, schema_id, example::text AS example FROM request_bodies'
+                ))]
+                response_bodies = [dict(row._mapping) for row in session.execute(text(
+                    'SELECT id, endpoint_id, status_code, description, schema_id, example::text AS example '
+                    'FROM response_bodies'
+                ))]
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error loading endpoint catalog: {e}")
+
+        for body in request_bodies + response_bodies:
+            body['schema'] = schemas.get(body.pop('schema_id'))
+
+        catalog = EndpointCatalog(endpoints, parameters, request_bodies, response_bodies, generation)
+        logger.info(
+            f"Loaded endpoint catalog generation {generation}: {len(catalog)} endpoints "
+            f"in {time.perf_counter() - start:.2f}s"
+        )
+        return catalog
+
+    def get_catalog(self) -> Optional[EndpointCatalog]:
+        """
+        Get the in-memory catalog, loading or reloading it when the build generation changes.
+
+        The generation is checked at most once per CATALOG_REFRESH_INTERVAL seconds.
+
+        Returns:
+            The catalog, or None if it is disabled or cannot be loaded (callers then query
+            the database directly)
+        """
+        if not self.catalog_config['enabled']:
+            return None
+
+        generation = self._current_generation()
+        catalog = self._catalog
+        if catalog is not None and catalog.generation == generation:
+            return catalog
+
+        with self._catalog_lock:
+            # Another thread may have reloaded the catalog while we waited
+            if self._catalog is not None and self._catalog.generation == generation:
+                return self._catalog
+            # After a failed load, keep serving the old catalog (or the database) for a while
+            if time.monotonic() < self._catalog_retry_at:
+                return self._catalog
+            try:
+                self._catalog = self.load_catalog(generation)
+            except Exception as e:
+                logger.error(f"Failed to load endpoint catalog: {e}")
+                self._catalog_retry_at = time.monotonic() + self.catalog_config['refresh_interval']
+            return self._catalog
+
+    def catalog_stats(self) -> Dict[str, Any]:
+        """Get metrics for the loaded catalog and the details cache without checking for a new generation."""
+        return {
+            'catalog': self._catalog.stats() if self._catalog is not None else None,
+            'details_cache': self._details_cache.stats(),
+            'search_cache': self._search_cache.stats(),
+            'semantic_index': self._semantic_index.stats() if self._semantic_index is not None else None
+        }
+
+    def load_semantic_index(self) -> Optional[SemanticIndex]:
+        """Read the latest semantic search index (None if the database has none)."""
+        try:
+            with self.get_session() as session:
+                row = session.execute(text('SELECT data FROM semantic_indexes ORDER BY id DESC LIMIT 1')).fetchone()
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error loading semantic index: {e}")
+        if row is None:
+            return None
+
+        index = SemanticIndex.from_bytes(bytes(row.data))
+        logger.info(f"Loaded semantic index: {index.stats()}")
+        return index
+
+    def get_semantic_index(self) -> Optional[SemanticIndex]:
+        """
+        Get the semantic search index, loading it again when the build generation changes.
+
+        Returns:
+            The index, or None if semantic search is disabled, numpy is not installed or
+            the database has no index
+        """
+        if not self.semantic_config['enabled'] or not numpy_available():
+            return None
+
+        generation = self._current_generation()
+        if self._semantic_generation == generation:
+            return self._semantic_index
+
+        with self._semantic_lock:
+            if self._semantic_generation == generation or time.monotonic() < self._semantic_retry_at:
+                return self._semantic_index
+            try:
+                self._semantic_index = self.load_semantic_index()
+                self._semantic_generation = generation
+            except Exception as e:
+                logger.error(f"Failed to load semantic index: {e}")
+                self._semantic_retry_at = time.monotonic() + self.catalog_config['refresh_interval']
+            return self._semantic_index
+
+    def semantic_search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search endpoints by meaning with the semantic index (one matrix-vector product).
 
         Args:
-            query: Search string (can match path, description, tags)
+            query: Natural language query
+            limit: Maximum number of results
 
         Returns:
-            List of matching endpoints ordered by relevance
+            List of matching endpoints, best first, with their cosine similarity as rank
         """
-        # Check if full-text search features are available
-        if self.has_fulltext_search():
+        index = self.get_semantic_index()
+        if index is None:
+            raise Exception("Semantic search is not available (no semantic index in the database, or numpy is not installed)")
+
+        matches = index.search(tokenize(query), limit, self.semantic_config['min_score'])
+        if not matches:
+            return []
+
+        catalog = self.get_catalog()
+        if catalog is not None:
+            endpoints = {endpoint_id: catalog.get(endpoint_id) for endpoint_id, _ in matches}
+        else:
             try:
                 with self.get_session() as session:
                     result = session.execute(text('''
-                    SELECT *, ts_rank(search_vector, websearch_to_tsquery('english', :query)) as rank
+                    SELECT id, path, method, description, category, tags, summary
                     FROM endpoints
-                    WHERE search_vector @@ websearch_to_tsquery('english', :query)
-                    ORDER BY rank DESC, category, path
-                    LIMIT 50
-                    '''), {"query": query})
-
-                    results = [dict(row._mapping) for row in result.fetchall()]
-                    if results:
-                        return results
-            except Exception:
-                pass
+                    WHERE id = ANY(:ids)
+                    '''), {"ids": [endpoint_id for endpoint_id, _ in matches]})
+                    endpoints = {row.id: dict(row._mapping) for row in result.fetchall()}
+            except SQLAlchemyError as e:
+                raise Exception(f"Database error in semantic search: {e}")
+
+        results = []
+        for endpoint_id, score in matches:
+            endpoint = endpoints.get(endpoint_id)
+            # Endpoints removed since the index was built are skipped
+            if endpoint:
+                endpoint['rank'] = score
+                results.append(endpoint)
+        return results
+
+    def get_endpoints_by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """
+        Get all endpoints carrying a tag.
+
+        Args:
+            tag: Tag name (case-insensitive)
+
+        Returns:
+            List of endpoints with the tag
+        """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.by_tag(tag)
 
-        # Fallback to pattern matching in separate session
         try:
             with self.get_session() as session:
-                search_pattern = f"%{query}%"
                 result = session.execute(text('''
                 SELECT * FROM endpoints
-                WHERE path ILIKE :pattern
-                OR description ILIKE :pattern
-                OR tags ILIKE :pattern
-                OR summary ILIKE :pattern
-                ORDER BY category, path
-                '''), {"pattern": search_pattern})
-
+                WHERE :tag = ANY(string_to_array(lower(tags), ','))
+                ORDER BY path
+                '''), {"tag": tag.strip().lower()})
                 return [dict(row._mapping) for row in result.fetchall()]
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting endpoints by tag: {e}")
+
+    def _cached_search(self, key: Tuple, run) -> Any:
+        """
+        Answer a search from the search result cache, running it on a miss.
+
+        Args:
+            key: (search name, normalized query, options...) cache key
+            run: Zero-argument function performing the search
+
+        Returns:
+            A copy of the cached or freshly computed results
+        """
+        self._search_cache.set_generation(self._current_generation())
+        results = self._search_cache.get(key)
+        if results is None:
+            results = run()
+            self._search_cache.set(key, results, len(json.dumps(results, default=str)))
+
+        if isinstance(results, dict):
+            return dict(results, items=[dict(item) for item in results['items']])
+        return [dict(item) for item in results]
+
+    def has_trigram_search(self) -> bool:
+        """Check if the pg_trgm extension is installed."""
+        return self.search_engine.capabilities(self._current_generation())['trigram']
+
+    def has_fulltext_search(self) -> bool:
+        """Check if full-text search features are available in the database."""
+        return self.search_engine.capabilities(self._current_generation())['fulltext']
+
+    def search_endpoints(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search for API endpoints matching the query using full-text search.
+
+        Full-text matches are returned when there are any, otherwise substring matches;
+        both are gathered in a single query.
+
+        Args:
+            query: Search string (can match path, description, tags)
+            limit: Maximum number of results (None for all matches)
+
+        Returns:
+            List of matching endpoints ordered by relevance
+        """
+        # Search for exactly the normalized query the results are cached under
+        query = normalize_query(query)
+        try:
+            return self._cached_search(
+                ('search_endpoints', query, limit),
+                lambda: self.search_engine.search(
+                    query, [query], limit, self._current_generation(),
+                    fulltext_rank='ts_rank', plain_fallback=False
+                )
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error searching endpoints: {e}")
+
+    def search_endpoints_page(
+        self,
+        query: str,
+        limit: int = 10,
+        offset: int = 0,
+        columns: Tuple[str, ...] = ('id', 'method', 'path', 'description')
+    ) -> Dict[str, Any]:
+        """
+        Get one page of search_endpoints results and the total number of matches.
+
+        Args:
+            query: Search string (can match path, description, tags)
+            limit: Page size
+            offset: Number of leading results to skip
+            columns: Endpoint columns to return
+
+        Returns:
+            Dictionary with the page's items and the total match count
+        """
+        query = normalize_query(query)
+        try:
+            return self._cached_search(
+                ('search_endpoints_page', query, limit, offset, columns),
+                lambda: self.search_engine.search_page(
+                    query, [query], limit, offset, self._current_generation(),
+                    fulltext_rank='ts_rank', plain_fallback=False, columns=columns
+                )
+            )
         except SQLAlchemyError as e:
             raise Exception(f"Database error searching endpoints: {e}")
 
@@ -131,69 +413,62 @@ class APIDatabase:
         """
         Get complete details for a specific endpoint.
 
+        Served from the in-memory catalog when it is loaded; otherwise from a cache of
+        parsed details (cleared when the build generation changes), falling back to a
+        single database query.
+
         Args:
             endpoint_id: The endpoint ID
 
         Returns:
             Dictionary containing complete endpoint details
         """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.details(endpoint_id)
+
+        self._details_cache.set_generation(self._current_generation())
+        endpoint = self._details_cache.get(endpoint_id)
+        if endpoint is None:
+            endpoint = self._fetch_endpoint_details(endpoint_id)
+            if not endpoint:
+                return {}
+            self._details_cache.set(endpoint_id, endpoint)
+
+        # Callers may annotate the result, so hand out a copy of the cached object
+        return dict(endpoint)
+
+    def _fetch_endpoint_details(self, endpoint_id: int) -> Dict[str, Any]:
+        """Fetch an endpoint with its parameters and bodies in one round trip."""
         try:
             with self.get_session() as session:
-                # Get basic endpoint info
-                result = session.execute(text('SELECT * FROM endpoints WHERE id = :id'), {"id": endpoint_id})
+                result = session.execute(text('''
+                SELECT e.id, e.path, e.method, e.description, e.category, e.summary, e.tags, e.keywords,
+                    COALESCE((SELECT json_agg(p ORDER BY p.id) FROM parameters p WHERE p.endpoint_id = e.id), '[]') AS parameters,
+                    (SELECT json_build_object('id', rb.id, 'endpoint_id', rb.endpoint_id, 'schema', s.document, 'example', rb.example)
+                     FROM request_bodies rb LEFT JOIN schemas s ON s.id = rb.schema_id
+                     WHERE rb.endpoint_id = e.id ORDER BY rb.id LIMIT 1) AS request_body,
+                    COALESCE((SELECT json_agg(json_build_object(
+                                'id', rs.id, 'endpoint_id', rs.endpoint_id, 'status_code', rs.status_code,
+                                'description', rs.description, 'schema', s.document, 'example', rs.example
+                              ) ORDER BY rs.id)
+                              FROM response_bodies rs LEFT JOIN schemas s ON s.id = rs.schema_id
+                              WHERE rs.endpoint_id = e.id), '[]') AS response_bodies
+                FROM endpoints e
+                WHERE e.id = :id
+                '''), {"id": endpoint_id})
                 endpoint_row = result.fetchone()
 
                 if not endpoint_row:
                     return {}
 
                 endpoint = dict(endpoint_row._mapping)
-
-                # Get parameters
-                params_result = session.execute(text('SELECT * FROM parameters WHERE endpoint_id = :id'), {"id": endpoint_id})
-                endpoint['parameters'] = [dict(row._mapping) for row in params_result.fetchall()]
-
-                # Get request body
-                request_result = session.execute(text('SELECT * FROM request_bodies WHERE endpoint_id = :id'), {"id": endpoint_id})
-                request_body_row = request_result.fetchone()
-
-                if request_body_row:
-                    endpoint['request_body'] = dict(request_body_row._mapping)
-                    # Parse the JSON schema
-                    if endpoint['request_body'].get('schema'):
-                        try:
-                            endpoint['request_body']['schema'] = json.loads(endpoint['request_body']['schema'])
-                        except json.JSONDecodeError:
-                            pass
-
-                    # Parse the JSON example
-                    if endpoint['request_body'].get('example'):
-                        try:
-                            endpoint['request_body']['example'] = json.loads(endpoint['request_body']['example'])
-                        except json.JSONDecodeError:
-                            pass
-
-                # Get response bodies
-                responses_result = session.execute(text('SELECT * FROM response_bodies WHERE endpoint_id = :id'), {"id": endpoint_id})
-                responses = []
-                for row in responses_result.fetchall():
-                    response = dict(row._mapping)
-                    # Parse the JSON schema
-                    if response.get('schema'):
-                        try:
-                            response['schema'] = json.loads(response['schema'])
-                        except json.JSONDecodeError:
-                            pass
-
-                    # Parse the JSON example
-                    if response.get('example'):
-                        try:
-                            response['example'] = json.loads(response['example'])
-                        except json.JSONDecodeError:
-                            pass
-                    responses.append(response)
-
-                endpoint['response_bodies'] = responses
-
+                if endpoint['request_body'] is None:
+                    del endpoint['request_body']
+                else:
+                    _parse_body_documents(endpoint['request_body'])
+                for response in endpoint['response_bodies']:
+                    _parse_body_documents(response)
                 return endpoint
 
         except SQLAlchemyError as e:
@@ -208,12 +483,29 @@ class APIDatabase:
             method: HTTP method (GET, POST, etc.)
 
         Returns:
-            Endpoint details or None if not found
+            Endpoint details or None if not found. When a concrete path is resolved to a
+            template (e.g. /service/tickets/123 -> /service/tickets/{id}), the extracted
+            values are included under 'path_params'.
         """
         try:
             # Normalize the input path for consistent searching
             normalized_path = self._normalize_path(path)
 
+            catalog = self.get_catalog()
+            if catalog is not None:
+                endpoint_id = catalog.find_id(normalized_path, method)
+                if endpoint_id is not None:
+                    return catalog.details(endpoint_id)
+
+                # Resolve concrete values (e.g. /service/tickets/123) against the path templates
+                routed = catalog.route(normalized_path, method)
+                if routed is None:
+                    return None
+                endpoint_id, path_params = routed
+                endpoint = catalog.details(endpoint_id)
+                endpoint['path_params'] = path_params
+                return endpoint
+
             with self.get_session() as session:
                 # Exact match (case-insensitive)
                 result = session.execute(text('''
@@ -257,6 +549,10 @@ class APIDatabase:
         Returns:
             List of category names
         """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.categories()
+
         try:
             with self.get_session() as session:
                 result = session.execute(text('SELECT DISTINCT category FROM endpoints ORDER BY category'))
@@ -275,6 +571,10 @@ class APIDatabase:
         Returns:
             List of endpoints in the category
         """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.by_category(category)
+
         try:
             with self.get_session() as session:
                 result = session.execute(text('''
@@ -288,6 +588,61 @@ class APIDatabase:
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting endpoints by category: {e}")
 
+    def get_endpoints_by_category_page(
+        self,
+        category: str,
+        limit: int = 20,
+        offset: int = 0,
+        columns: Tuple[str, ...] = ('id', 'method', 'path', 'summary')
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a category's endpoints and the category's total endpoint count.
+
+        Args:
+            category: Category name
+            limit: Page size
+            offset: Number of leading endpoints to skip
+            columns: Endpoint columns to return
+
+        Returns:
+            Dictionary with the page's items and the total endpoint count
+        """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            return catalog.category_page(category, limit, offset, columns)
+
+        try:
+            with self.get_session() as session:
+                # Joining the page onto the count keeps the total when the page is empty
+                result = session.execute(text(f'''
+                WITH total AS (
+                    SELECT COUNT(*) AS total_count FROM endpoints WHERE category = :category
+                ),
+                page AS (
+                    SELECT {', '.join(dict.fromkeys(('path', *columns)))}
+                    FROM endpoints
+                    WHERE category = :category
+                    ORDER BY path
+                    LIMIT :limit_val OFFSET :offset_val
+                )
+                SELECT page.*, total.total_count
+                FROM total
+                LEFT JOIN page ON true
+                ORDER BY page.path
+                '''), {"category": category, "limit_val": limit, "offset_val": offset})
+
+                items = []
+                total = 0
+                for row in result.fetchall():
+                    endpoint = dict(row._mapping)
+                    total = endpoint.pop('total_count')
+                    if endpoint['path'] is not None:
+                        items.append({column: endpoint[column] for column in columns})
+                return {'items': items, 'total': total}
+
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error getting endpoints by category: {e}")
+
     def get_parameter_details(self, endpoint_id: int, param_name: str) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific parameter of an endpoint.
@@ -299,6 +654,11 @@ class APIDatabase:
         Returns:
             Parameter details or None if not found
         """
+        catalog = self.get_catalog()
+        if catalog is not None:
+            parameters = catalog.details(endpoint_id).get('parameters', [])
+            return next((dict(param) for param in parameters if param.get('name') == param_name), None)
+
         try:
             with self.get_session() as session:
                 result = session.execute(text('''
@@ -312,112 +672,63 @@ class APIDatabase:
         except SQLAlchemyError as e:
             raise Exception(f"Database error getting parameter details: {e}")
 
-    def search_by_natural_language(self, query: str, limit: int = 100) -> List[Dict[str, Any]]:
+    def search_by_natural_language(self, query: str, limit: int = 100, mode: str = 'auto') -> List[Dict[str, Any]]:
         """
-        Search for endpoints using natural language queries with PostgreSQL full-text search.
+        Search for endpoints using natural language queries.
+
+        Full-text search tries websearch_to_tsquery, then plainto_tsquery, then keyword
+        matching, in a single query that only evaluates a fallback when the tiers before it
+        found nothing. Semantic search scores every endpoint against the offline semantic
+        index, which also finds paraphrases that share no words with the documentation.
 
         Args:
             query: Natural language query
             limit: Maximum number of results
+            mode: 'fulltext', 'semantic', or 'auto' to merge both (full-text only when
+                  no semantic index is available)
 
         Returns:
             List of matching endpoints ordered by relevance
         """
-        print(limit)
-        query_lower = query.lower().strip()
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"Unknown search mode '{mode}', expected one of: {', '.join(SEARCH_MODES)}")
+
+        query_lower = normalize_query(query)
         if not query_lower:
             return []
 
-        # Check if full-text search features are available
-        if self.has_fulltext_search():
-            # Try advanced full-text search first
-            try:
-                with self.get_session() as session:
-                    result = session.execute(text('''
-                    SELECT id, path, method, description, category, tags, summary,
-                           ts_rank_cd(search_vector, websearch_to_tsquery('english', :query)) as rank
-                    FROM endpoints
-                    WHERE search_vector @@ websearch_to_tsquery('english', :query)
-                    ORDER BY rank DESC
-                    LIMIT :limit_val
-                    '''), {"query": query_lower, "limit_val": limit})
-
-                    results = [dict(row._mapping) for row in result.fetchall()]
-                    if results:
-                        print("IS websearch_to_tsquery")
-                        return results
-            except Exception:
-                pass
+        if mode == 'auto' and self.get_semantic_index() is None:
+            mode = 'fulltext'
 
-            # Fall back to plainto_tsquery in separate session
-            try:
-                with self.get_session() as session:
-                    result = session.execute(text('''
-                    SELECT id, path, method, description, category, tags, summary,
-                           ts_rank(search_vector, plainto_tsquery('english', :query)) as rank
-                    FROM endpoints
-                    WHERE search_vector @@ plainto_tsquery('english', :query)
-                    ORDER BY rank DESC
-                    LIMIT :limit_val
-                    '''), {"query": query_lower, "limit_val": limit})
-
-                    results = [dict(row._mapping) for row in result.fetchall()]
-                    if results:
-                        print("IS plainto_tsquery")
-                        return results
-            except Exception:
-                pass
-
-        # Fallback to keyword-based search in separate session
         try:
-            print("IS keyword")
-            keywords = query_lower.split()
-            stopwords = {
-                'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'by',
-                'about', 'like', 'from', 'of', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-                'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'can',
-                'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that', 'these', 'those',
-                'get', 'find', 'show', 'list', 'give', 'me', 'all', 'some', 'any', 'how', 'what', 'when', 'where', 'why'
-            }
-
-            filtered_keywords = [word for word in keywords if word not in stopwords and len(word) >= 3]
-            if not filtered_keywords:
-                return []
+            return self._cached_search(
+                ('search_by_natural_language', query_lower, limit, mode),
+                lambda: self._natural_language_search(query_lower, limit, mode)
+            )
+        except SQLAlchemyError as e:
+            raise Exception(f"Database error in natural language search: {e}")
 
-            with self.get_session() as session:
-                search_conditions = []
-                search_params = {}
-
-                for i, keyword in enumerate(filtered_keywords):
-                    search_pattern = f"%{keyword}%"
-                    search_conditions.extend([
-                        f"path ILIKE :pattern_{i}",
-                        f"description ILIKE :pattern_{i}",
-                        f"tags ILIKE :pattern_{i}",
-                        f"summary ILIKE :pattern_{i}"
-                    ])
-                    search_params[f"pattern_{i}"] = search_pattern
-
-                where_clause = " OR ".join(search_conditions)
-                result = session.execute(text(f'''
-                SELECT id, path, method, description, category, tags, summary
-                FROM endpoints
-                WHERE {where_clause}
-                ORDER BY
-                    CASE
-                        WHEN summary ILIKE :first_pattern THEN 1
-                        WHEN description ILIKE :first_pattern THEN 2
-                        WHEN path ILIKE :first_pattern THEN 3
-                        WHEN tags ILIKE :first_pattern THEN 4
-                        ELSE 5
-                    END
-                LIMIT :limit_val
-                '''), {**search_params, "first_pattern": f"%{filtered_keywords[0]}%", "limit_val": limit})
+    def _natural_language_search(self, query: str, limit: int, mode: str) -> List[Dict[str, Any]]:
+        if mode == 'semantic':
+            return self.semantic_search(query, limit)
 
-                return [dict(row._mapping) for row in result.fetchall()]
+        fulltext = self.search_engine.search(
+            query, extract_keywords(query), limit, self._current_generation(),
+            terms=query_terms(query)
+        )
+        if mode == 'fulltext':
+            return fulltext
 
-        except SQLAlchemyError as e:
-            raise Exception(f"Database error in natural language search: {e}")
+        # Reciprocal rank fusion: endpoints ranked well by either search rise to the top
+        fused: Dict[int, Dict[str, Any]] = {}
+        scores: Dict[int, float] = {}
+        for results in (fulltext, self.semantic_search(query, limit)):
+            for position, endpoint in enumerate(results):
+                fused.setdefault(endpoint['id'], endpoint)
+                scores[endpoint['id']] = scores.get(endpoint['id'], 0.0) + 1.0 / (RRF_K + position + 1)
+
+        ranked = sorted(fused, key=lambda endpoint_id: -scores[endpoint_id])[:limit]
+        return [dict(fused[endpoint_id], rank=scores[endpoint_id]) for endpoint_id in ranked]
 
     def advanced_search(self, query: str, limit: int = 10, include_highlights: bool = False) -> List[Dict[str, Any]]:
         """
@@ -431,79 +742,18 @@ class APIDatabase:
         Returns:
             List of matching endpoints with optional highlights
         """
-        if not query or not query.strip():
+        query = normalize_query(query or '')
+        if not query:
             return []
 
         try:
-            with self.get_session() as session:
-                # Try full-text search with highlighting
-                try:
-                    if include_highlights:
-                        highlight_query = '''
-                        SELECT id, path, method, description, category, tags, summary,
-                               ts_rank_cd(search_vector, websearch_to_tsquery('english', :query)) as rank,
-                               ts_headline('english', COALESCE(summary, ''), websearch_to_tsquery('english', :query)) as summary_highlight,
-                               ts_headline('english', COALESCE(description, ''), websearch_to_tsquery('english', :query)) as description_highlight
-                        FROM endpoints
-                        WHERE search_vector @@ websearch_to_tsquery('english', :query)
-                        ORDER BY rank DESC
-                        LIMIT :limit_val
-                        '''
-                    else:
-                        highlight_query = '''
-                        SELECT id, path, method, description, category, tags, summary,
-                               ts_rank_cd(search_vector, websearch_to_tsquery('english', :query)) as rank
-                        FROM endpoints
-                        WHERE search_vector @@ websearch_to_tsquery('english', :query)
-                        ORDER BY rank DESC
-                        LIMIT :limit_val
-                        '''
-
-                    result = session.execute(text(highlight_query), {"query": query.strip(), "limit_val": limit})
-                    results = [dict(row._mapping) for row in result.fetchall()]
-
-                    if results:
-                        return results
-
-                except Exception:
-                    # Fallback to plainto_tsquery
-                    try:
-                        result = session.execute(text('''
-                        SELECT id, path, method, description, category, tags, summary,
-                               ts_rank(search_vector, plainto_tsquery('english', :query)) as rank
-                        FROM endpoints
-                        WHERE search_vector @@ plainto_tsquery('english', :query)
-                        ORDER BY rank DESC
-                        LIMIT :limit_val
-                        '''), {"query": query.strip(), "limit_val": limit})
-
-                        results = [dict(row._mapping) for row in result.fetchall()]
-                        if results:
-                            return results
-                    except Exception:
-                        pass
-
-                # Final fallback to ILIKE search
-                search_pattern = f"%{query.strip()}%"
-                result = session.execute(text('''
-                SELECT id, path, method, description, category, tags, summary
-                FROM endpoints
-                WHERE summary ILIKE :pattern
-                OR description ILIKE :pattern
-                OR path ILIKE :pattern
-                OR tags ILIKE :pattern
-                ORDER BY
-                    CASE
-                        WHEN summary ILIKE :pattern THEN 1
-                        WHEN description ILIKE :pattern THEN 2
-                        WHEN path ILIKE :pattern THEN 3
-                        ELSE 4
-                    END
-                LIMIT :limit_val
-                '''), {"pattern": search_pattern, "limit_val": limit})
-
-                return [dict(row._mapping) for row in result.fetchall()]
-
+            return self._cached_search(
+                ('advanced_search', query, limit, include_highlights),
+                lambda: self.search_engine.search(
+                    query, [query], limit, self._current_generation(),
+                    plain_fallback=False, highlights=include_highlights
+                )
+            )
         except SQLAlchemyError as e:
             raise Exception(f"Database error in advanced search: {e}")
 
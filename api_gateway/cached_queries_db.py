@@ -36,6 +36,7 @@ class CachedQueriesDB:
         """
         self.engine = None
         self.SessionLocal = None
+        self._has_trigram = False
 
         # Default engine configuration for PostgreSQL
         default_engine_kwargs = {
@@ -140,6 +141,29 @@ class CachedQueriesDB:
             logger.error(f"Failed to initialize database tables: {e}")
             raise
 
+        self._has_trigram = self.create_trigram_indexes()
+
+    def create_trigram_indexes(self) -> bool:
+        """
+        Create pg_trgm GIN indexes on the searched columns.
+
+        Returns:
+            True if trigram indexes are available for search_queries
+        """
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                for column in ('description', 'path'):
+                    conn.execute(text(f"""
+                        CREATE INDEX IF NOT EXISTS idx_saved_queries_{column}_trgm
+                        ON saved_queries USING GIN ({column} gin_trgm_ops)
+                    """))
+                conn.commit()
+            return True
+        except Exception as e:
+            logger.warning(f"Trigram indexes unavailable, saved query search will scan: {e}")
+            return False
+
     def save_query(
         self, description: str, 
         path: str, method: str,
@@ -258,17 +282,22 @@ class CachedQueriesDB:
         """
         try:
             with self.get_session() as session:
-                # Use ILIKE for case-insensitive search (PostgreSQL specific)
+                # Use ILIKE for case-insensitive search (PostgreSQL specific),
+                # served by the trigram indexes and ranked by similarity when available
                 search_pattern = f"%{search_term}%"
+                order_by = [SavedQuery.usage_count.desc(), SavedQuery.timestamp.desc()]
+                if self._has_trigram:
+                    similarity = func.greatest(
+                        func.word_similarity(search_term, func.coalesce(SavedQuery.description, '')),
+                        func.word_similarity(search_term, SavedQuery.path)
+                    )
+                    order_by.insert(0, similarity.desc())
                 queries = session.query(SavedQuery).filter(
                     or_(
                         SavedQuery.description.ilike(search_pattern),
                         SavedQuery.path.ilike(search_pattern)
                     )
-                ).order_by(
-                    SavedQuery.usage_count.desc(),
-                    SavedQuery.timestamp.desc()
-                ).all()
+                ).order_by(*order_by).all()
 
                 results = []
                 for query in queries:
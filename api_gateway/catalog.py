@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Endpoint Catalog Module
+
+This module holds the whole ConnectWise endpoint catalog in memory. The catalog only
+changes when the database is rebuilt from the OpenAPI document, so APIDatabase loads it
+once (endpoints, parameters and parsed request/response schemas) and answers category,
+tag, id and (path, method) lookups from dictionaries instead of querying Postgres.
+Concrete request paths are resolved to their templates with a PathRouter.
+
+Every ingest run records a row in the catalog_builds table; the highest build id is the
+catalog generation. APIDatabase checks the generation periodically and reloads the
+catalog when it changes.
+
+Identical schema and example documents are parsed once and shared between endpoints.
+Objects returned from the catalog must be treated as read-only.
+
+Environment Variables:
+    CATALOG_ENABLED - Serve catalog lookups from memory (default: true)
+    CATALOG_REFRESH_INTERVAL - Seconds between build generation checks (default: 60)
+    ENDPOINT_DETAILS_CACHE_SIZE - Parsed endpoint details cached when the catalog is
+                                  disabled or unavailable (default: 512)
+"""
+
+import os
+import json
+import time
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+from api_gateway.path_router import PathRouter
+
+def get_catalog_config() -> dict:
+    """Get endpoint catalog configuration from environment variables or defaults"""
+    return {
+        'enabled': os.getenv('CATALOG_ENABLED', 'true').lower() == 'true',
+        'refresh_interval': float(os.getenv('CATALOG_REFRESH_INTERVAL', 60)),
+        'details_cache_size': int(os.getenv('ENDPOINT_DETAILS_CACHE_SIZE', 512))
+    }
+
+def _parse_json(value: Any, parsed: Dict[str, Any]) -> Any:
+    """Parse a stored JSON document, reusing the result for identical documents."""
+    if not isinstance(value, str) or not value:
+        return value
+    if value not in parsed:
+        try:
+            parsed[value] = json.loads(value)
+        except json.JSONDecodeError:
+            parsed[value] = value
+    return parsed[value]
+
+class EndpointCatalog:
+    """Immutable in-memory index of API endpoints and their details."""
+
+    # Endpoint columns kept in memory (search_vector is only useful inside Postgres)
+    ENDPOINT_FIELDS = ('id', 'path', 'method', 'description', 'category', 'summary', 'tags', 'keywords')
+
+    def __init__(
+        self,
+        endpoints: Iterable[Dict[str, Any]],
+        parameters: Iterable[Dict[str, Any]] = (),
+        request_bodies: Iterable[Dict[str, Any]] = (),
+        response_bodies: Iterable[Dict[str, Any]] = (),
+        generation: int = 0
+    ):
+        """
+        Build the catalog from table rows.
+
+        Args:
+            endpoints: Rows of the endpoints table
+            parameters: Rows of the parameters table
+            request_bodies: Rows of the request_bodies table (schema/example as JSON text or decoded)
+            response_bodies: Rows of the response_bodies table (schema/example as JSON text or decoded)
+            generation: Catalog build generation the rows were read at
+        """
+        self.generation = generation
+        self.loaded_at = time.time()
+
+        self._endpoints: Dict[int, Dict[str, Any]] = {}
+        self._by_path_method: Dict[Tuple[str, str], int] = {}
+        self._router = PathRouter()
+        self._by_category: Dict[str, List[int]] = {}
+        self._by_tag: Dict[str, List[int]] = {}
+
+        for row in sorted(endpoints, key=lambda row: row['id']):
+            endpoint = {field: row.get(field) for field in self.ENDPOINT_FIELDS}
+            endpoint_id = endpoint['id']
+            method = (endpoint['method'] or '').lower()
+            path = endpoint['path'] or ''
+
+            self._endpoints[endpoint_id] = endpoint
+            self._by_path_method.setdefault((path.lower(), method), endpoint_id)
+            self._router.add(path, method, endpoint_id)
+            self._by_category.setdefault(endpoint['category'], []).append(endpoint_id)
+            for tag in (endpoint['tags'] or '').split(','):
+                if tag.strip():
+                    self._by_tag.setdefault(tag.strip().lower(), []).append(endpoint_id)
+
+        for endpoint_ids in self._by_category.values():
+            endpoint_ids.sort(key=lambda endpoint_id: self._endpoints[endpoint_id]['path'] or '')
+        self._categories = sorted(self._by_category, key=lambda category: (category is None, category or ''))
+
+        self._parameters: Dict[int, List[Dict[str, Any]]] = {}
+        for row in parameters:
+            self._parameters.setdefault(row['endpoint_id'], []).append(dict(row))
+
+        parsed: Dict[str, Any] = {}
+        self._request_bodies: Dict[int, Dict[str, Any]] = {}
+        for row in sorted(request_bodies, key=lambda row: row['id']):
+            body = dict(row)
+            body['schema'] = _parse_json(body.get('schema'), parsed)
+            body['example'] = _parse_json(body.get('example'), parsed)
+            self._request_bodies.setdefault(row['endpoint_id'], body)
+
+        self._response_bodies: Dict[int, List[Dict[str, Any]]] = {}
+        for row in sorted(response_bodies, key=lambda row: row['id']):
+            body = dict(row)
+            body['schema'] = _parse_json(body.get('schema'), parsed)
+            body['example'] = _parse_json(body.get('example'), parsed)
+            self._response_bodies.setdefault(row['endpoint_id'], []).append(body)
+
+        self._distinct_documents = len(parsed)
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+    def endpoint_ids(self) -> List[int]:
+        """Get every endpoint id in ascending order."""
+        return list(self._endpoints)
+
+    def get(self, endpoint_id: int) -> Optional[Dict[str, Any]]:
+        """Get the endpoint row (without children) for an id."""
+        endpoint = self._endpoints.get(endpoint_id)
+        return dict(endpoint) if endpoint else None
+
+    def details(self, endpoint_id: int) -> Dict[str, Any]:
+        """
+        Get complete details for an endpoint, in the shape of APIDatabase.get_endpoint_details.
+
+        Args:
+            endpoint_id: The endpoint ID
+
+        Returns:
+            Endpoint dictionary with parameters, request_body and response_bodies,
+            or an empty dict if the id is unknown
+        """
+        endpoint = self._endpoints.get(endpoint_id)
+        if not endpoint:
+            return {}
+
+        details = dict(endpoint)
+        details['parameters'] = list(self._parameters.get(endpoint_id, []))
+        if endpoint_id in self._request_bodies:
+            details['request_body'] = dict(self._request_bodies[endpoint_id])
+        details['response_bodies'] = [dict(body) for body in self._response_bodies.get(endpoint_id, [])]
+        return details
+
+    def find_id(self, path: str, method: str) -> Optional[int]:
+        """Find an endpoint id by exact path (case-insensitive) and method."""
+        return self._by_path_method.get((path.lower(), method.lower()))
+
+    def route(self, path: str, method: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        """
+        Resolve a concrete path (e.g. /service/tickets/123) to an endpoint.
+
+        Returns:
+            Tuple of (endpoint id, path parameter values), or None if nothing matches
+        """
+        return self._router.match(path, method)
+
+    def categories(self) -> List[str]:
+        """Get all unique categories in sorted order."""
+        return list(self._categories)
+
+    def by_category(self, category: str) -> List[Dict[str, Any]]:
+        """Get the endpoints of a category ordered by path."""
+        return [dict(self._endpoints[endpoint_id]) for endpoint_id in self._by_category.get(category, [])]
+
+    def category_page(
+        self,
+        category: str,
+        limit: int,
+        offset: int = 0,
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of a category's endpoints ordered by path.
+
+        Args:
+            category: Category name
+            limit: Page size
+            offset: Number of leading endpoints to skip
+            fields: Endpoint fields to include (default: all)
+
+        Returns:
+            Dictionary with the page's items and the category's total endpoint count
+        """
+        endpoint_ids = self._by_category.get(category, [])
+        fields = tuple(fields) if fields else self.ENDPOINT_FIELDS
+        items = [
+            {field: self._endpoints[endpoint_id].get(field) for field in fields}
+            for endpoint_id in endpoint_ids[offset:offset + limit]
+        ]
+        return {'items': items, 'total': len(endpoint_ids)}
+
+    def by_tag(self, tag: str) -> List[Dict[str, Any]]:
+        """Get the endpoints carrying a tag (case-insensitive)."""
+        return [dict(self._endpoints[endpoint_id]) for endpoint_id in self._by_tag.get(tag.strip().lower(), [])]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get catalog metrics."""
+        return {
+            'generation': self.generation,
+            'endpoints': len(self._endpoints),
+            'categories': len(self._categories),
+            'tags': len(self._by_tag),
+            'distinct_documents': self._distinct_documents,
+            'loaded_at': self.loaded_at
+        }
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Database Executor Module
+
+This module keeps synchronous SQLAlchemy work off the asyncio event loop. Database
+calls run on a bounded thread pool, so a slow Postgres round trip no longer blocks
+in-flight ConnectWise requests or other tool calls, and database latency overlaps with
+upstream HTTP latency instead of adding to it.
+
+AsyncDatabase wraps an APIDatabase or CachedQueriesDB instance and exposes each of its
+methods as a coroutine that runs on the pool. The SQLAlchemy connection pool of each
+engine is sized from the same configuration so every worker thread can hold a connection.
+
+Environment Variables:
+    DB_EXECUTOR_MAX_WORKERS - Threads running database calls (default: 8)
+    DB_POOL_SIZE - Persistent connections per database engine (default: DB_EXECUTOR_MAX_WORKERS)
+    DB_MAX_OVERFLOW - Extra connections opened under burst load (default: 4)
+    DB_POOL_TIMEOUT - Seconds to wait for a free connection (default: 30)
+"""
+
+import os
+import asyncio
+import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Iterable, Optional, TypeVar
+
+# Set up logging
+logger = logging.getLogger("api_gateway.db_executor")
+
+T = TypeVar('T')
+
+def get_db_executor_config() -> dict:
+    """Get database executor and connection pool configuration from environment variables or defaults"""
+    max_workers = max(1, int(os.getenv('DB_EXECUTOR_MAX_WORKERS', 8)))
+    return {
+        'max_workers': max_workers,
+        'pool_size': max(1, int(os.getenv('DB_POOL_SIZE', max_workers))),
+        'max_overflow': int(os.getenv('DB_MAX_OVERFLOW', 4)),
+        'pool_timeout': float(os.getenv('DB_POOL_TIMEOUT', 30))
+    }
+
+def db_engine_kwargs(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Get SQLAlchemy engine arguments matching the executor configuration.
+
+    Args:
+        config: Executor configuration (see get_db_executor_config for keys)
+
+    Returns:
+        Keyword arguments for create_engine
+    """
+    settings = get_db_executor_config()
+    if config:
+        settings.update(config)
+    return {
+        'pool_size': settings['pool_size'],
+        'max_overflow': settings['max_overflow'],
+        'pool_timeout': settings['pool_timeout'],
+        'pool_pre_ping': True
+    }
+
+class DatabaseExecutor:
+    """Bounded thread pool for blocking database calls."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the executor. Threads are started on first use.
+
+        Args:
+            config: Executor configuration (see get_db_executor_config for keys)
+        """
+        self.config = get_db_executor_config()
+        if config:
+            self.config.update(config)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._submitted = 0
+        self._running = 0
+        self._running_lock = threading.Lock()
+        self.completed_total = 0
+        self.failed_total = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.config['max_workers'],
+                thread_name_prefix='api-gateway-db'
+            )
+            logger.info(f"Started database executor with {self.config['max_workers']} worker(s)")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """
+        Run a blocking function on the database thread pool.
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's return value (exceptions are re-raised in the caller)
+        """
+        def call() -> T:
+            with self._running_lock:
+                self._running += 1
+            try:
+                return func(*args, **kwargs)
+            finally:
+                with self._running_lock:
+                    self._running -= 1
+
+        loop = asyncio.get_running_loop()
+        self._submitted += 1
+        try:
+            result = await loop.run_in_executor(self._get_executor(), call)
+            self.completed_total += 1
+            return result
+        except Exception:
+            self.failed_total += 1
+            raise
+        finally:
+            self._submitted -= 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads. The executor restarts on the next call."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+            logger.info("Database executor stopped")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get executor metrics."""
+        return {
+            'max_workers': self.config['max_workers'],
+            'running': self._running,
+            'queued': max(0, self._submitted - self._running),
+            'completed_total': self.completed_total,
+            'failed_total': self.failed_total
+        }
+
+class AsyncDatabase:
+    """
+    Async facade over a synchronous database object.
+
+    Public methods of the wrapped object become coroutines that run on a
+    DatabaseExecutor. Methods listed in `inline` do no I/O and are called directly.
+    """
+
+    def __init__(self, database: Any, executor: DatabaseExecutor, inline: Iterable[str] = ()):
+        """
+        Initialize the facade.
+
+        Args:
+            database: APIDatabase or CachedQueriesDB instance
+            executor: Executor running the blocking calls
+            inline: Names of methods to call on the event loop (pure formatting helpers)
+        """
+        self.sync = database
+        self._executor = executor
+        self._inline = set(inline)
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.sync, name)
+        if name.startswith('_') or name in self._inline or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        async def call(*args, **kwargs):
+            return await self._executor.run(attribute, *args, **kwargs)
+
+        # Cache the wrapper so later lookups skip __getattr__
+        setattr(self, name, call)
+        return call
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Field Projection Module
+
+This module supports requesting only selected fields from ConnectWise. Field lists use
+the ConnectWise 'fields' query parameter syntax, with '/' separating nested fields
+(e.g. "id,summary,board/name"). Fields are validated against the response schema stored
+in the API database, and the same projection can be applied locally when the upstream
+ignores the parameter.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple, Union
+
+def normalize_fields(fields: Union[str, List[str], None]) -> List[str]:
+    """
+    Normalize a field list.
+
+    Accepts a list or a comma-separated string, strips whitespace, accepts '.' as a
+    nested separator and removes duplicates while keeping order.
+
+    Examples:
+        "id, board.name" -> ["id", "board/name"]
+    """
+    if not fields:
+        return []
+    if isinstance(fields, str):
+        fields = fields.split(',')
+
+    normalized = []
+    for field in fields:
+        field = str(field).strip().replace('.', '/').strip('/')
+        if field and field not in normalized:
+            normalized.append(field)
+    return normalized
+
+def get_success_response_schema(endpoint: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Get the schema of the successful (2xx) response from endpoint details.
+
+    Args:
+        endpoint: Endpoint dictionary from APIDatabase.get_endpoint_details
+
+    Returns:
+        The response schema, or None if none is stored
+    """
+    responses = sorted(
+        endpoint.get('response_bodies') or [],
+        key=lambda response: str(response.get('status_code', ''))
+    )
+    for response in responses:
+        if str(response.get('status_code', '')).startswith('2') and isinstance(response.get('schema'), dict):
+            return response['schema']
+    return None
+
+def _object_schema(schema: Any) -> Optional[Dict[str, Any]]:
+    """Unwrap array schemas down to the record schema."""
+    while isinstance(schema, dict) and schema.get('type') == 'array':
+        items = schema.get('items')
+        # The ingest stores resolved array items as a one-element list
+        schema = items[0] if isinstance(items, list) and items else items
+    return schema if isinstance(schema, dict) else None
+
+def validate_fields(schema: Optional[Dict[str, Any]], fields: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Validate field paths against a response schema.
+
+    Segments that cannot be checked (no schema, or a sub-schema without properties)
+    are accepted.
+
+    Args:
+        schema: Response schema (object or array of objects)
+        fields: Normalized field paths
+
+    Returns:
+        Tuple of (valid fields, invalid fields)
+    """
+    record_schema = _object_schema(schema)
+    if not record_schema or not isinstance(record_schema.get('properties'), dict):
+        return list(fields), []
+
+    valid, invalid = [], []
+    for field in fields:
+        current = record_schema
+        ok = True
+        for segment in field.split('/'):
+            properties = current.get('properties') if current else None
+            if not isinstance(properties, dict):
+                break
+            if segment not in properties:
+                ok = False
+                break
+            current = _object_schema(properties[segment])
+        (valid if ok else invalid).append(field)
+    return valid, invalid
+
+def available_fields(schema: Optional[Dict[str, Any]]) -> List[str]:
+    """Get the top-level field names of a response schema."""
+    record_schema = _object_schema(schema)
+    if not record_schema or not isinstance(record_schema.get('properties'), dict):
+        return []
+    return sorted(record_schema['properties'])
+
+def _build_tree(fields: List[str]) -> Dict[str, Any]:
+    tree: Dict[str, Any] = {}
+    for field in fields:
+        node = tree
+        segments = field.split('/')
+        for segment in segments[:-1]:
+            child = node.setdefault(segment, {})
+            if child is None:
+                break
+            node = child
+        else:
+            # A full selection of a parent wins over selections of its children
+            node[segments[-1]] = None
+    return tree
+
+def _project_value(value: Any, tree: Optional[Dict[str, Any]]) -> Any:
+    if tree is None:
+        return value
+    if isinstance(value, list):
+        return [_project_value(item, tree) for item in value]
+    if not isinstance(value, dict):
+        return value
+    return {key: _project_value(value[key], subtree) for key, subtree in tree.items() if key in value}
+
+def needs_projection(data: Any, fields: List[str]) -> bool:
+    """Check if a response contains top-level keys outside the requested fields."""
+    wanted = {field.split('/', 1)[0] for field in fields}
+    records = data if isinstance(data, list) else [data]
+    return any(isinstance(record, dict) and not set(record).issubset(wanted) for record in records[:50])
+
+def project(data: Any, fields: List[str]) -> Any:
+    """
+    Apply a field projection locally.
+
+    Returns new objects; the input (which may be a shared cached response) is not modified.
+
+    Args:
+        data: Parsed response (record or list of records)
+        fields: Normalized field paths
+
+    Returns:
+        The projected response
+    """
+    if not fields:
+        return data
+    return _project_value(data, _build_tree(fields))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP Client Module
+
+This module owns the long-lived, pooled httpx.AsyncClient instances used to talk to
+the ConnectWise API. Reusing a single client per base URL keeps TCP/TLS connections
+alive between tool calls instead of paying a fresh handshake on every request.
+
+Environment Variables:
+    HTTP_MAX_CONNECTIONS - Maximum number of open connections per client (default: 20)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS - Maximum idle keep-alive connections (default: 10)
+    HTTP_KEEPALIVE_EXPIRY - Seconds an idle connection is kept open (default: 30)
+    HTTP_TIMEOUT - Request timeout in seconds (default: 30)
+    HTTP_CONNECT_TIMEOUT - Connect timeout in seconds (default: 10)
+    HTTP2_ENABLED - Negotiate HTTP/2 when the 'h2' package is installed (default: false)
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+import httpx
+
+# Set up logging
+logger = logging.getLogger("api_gateway.http_client")
+
+def get_http_client_config() -> dict:
+    """Get HTTP client pool configuration from environment variables or defaults"""
+    return {
+        'max_connections': int(os.getenv('HTTP_MAX_CONNECTIONS', 20)),
+        'max_keepalive_connections': int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', 10)),
+        'keepalive_expiry': float(os.getenv('HTTP_KEEPALIVE_EXPIRY', 30.0)),
+        'timeout': float(os.getenv('HTTP_TIMEOUT', 30.0)),
+        'connect_timeout': float(os.getenv('HTTP_CONNECT_TIMEOUT', 10.0)),
+        'http2': os.getenv('HTTP2_ENABLED', 'false').lower() == 'true'
+    }
+
+def http2_available() -> bool:
+    """Check if the optional 'h2' package required for HTTP/2 is installed."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+class HTTPClientManager:
+    """Owns the pooled async HTTP clients shared by the whole gateway process."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the client manager.
+
+        Args:
+            config: Pool configuration (see get_http_client_config for keys)
+        """
+        self.config = get_http_client_config()
+        if config:
+            self.config.update(config)
+
+        if self.config['http2'] and not http2_available():
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed. Falling back to HTTP/1.1.")
+            self.config['http2'] = False
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._lock = asyncio.Lock()
+        self._started = False
+
+    def _build_client(self, base_url: str) -> httpx.AsyncClient:
+        """Create a new pooled client for a base URL."""
+        limits = httpx.Limits(
+            max_connections=self.config['max_connections'],
+            max_keepalive_connections=self.config['max_keepalive_connections'],
+            keepalive_expiry=self.config['keepalive_expiry']
+        )
+        timeout = httpx.Timeout(self.config['timeout'], connect=self.config['connect_timeout'])
+
+        logger.info(
+            f"Creating pooled HTTP client for {base_url or 'default'} "
+            f"(max_connections={limits.max_connections}, keepalive={limits.max_keepalive_connections}, "
+            f"expiry={limits.keepalive_expiry}s, http2={self.config['http2']})"
+        )
+        return httpx.AsyncClient(
+            base_url=base_url,
+            limits=limits,
+            timeout=timeout,
+            http2=self.config['http2'],
+            verify=self.config.get('verify', True)
+        )
+
+    @property
+    def started(self) -> bool:
+        """Whether startup() has been called and shutdown() has not."""
+        return self._started
+
+    async def startup(self, base_url: Optional[str] = None) -> None:
+        """
+        Start the manager and optionally pre-create the client for a base URL.
+
+        Args:
+            base_url: Base URL to warm a client for (e.g. the ConnectWise API URL)
+        """
+        self._started = True
+        if base_url:
+            await self.get_client(base_url)
+        logger.info("HTTP client manager started")
+
+    async def get_client(self, base_url: str = "") -> httpx.AsyncClient:
+        """
+        Get the shared client for a base URL, creating it on first use.
+
+        Args:
+            base_url: Base URL the client is bound to
+
+        Returns:
+            The pooled httpx.AsyncClient
+        """
+        client = self._clients.get(base_url)
+        if client is not None and not client.is_closed:
+            return client
+
+        async with self._lock:
+            client = self._clients.get(base_url)
+            if client is None or client.is_closed:
+                client = self._build_client(base_url)
+                self._clients[base_url] = client
+            return client
+
+    async def shutdown(self) -> None:
+        """Close every pooled client and release their connections."""
+        async with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.error(f"Error closing HTTP client: {e}")
+
+        self._started = False
+        logger.info(f"HTTP client manager shut down ({len(clients)} client(s) closed)")
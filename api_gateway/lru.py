@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Bounded LRU Module
+
+This module provides a thread-safe least-recently-used cache bounded by entry count
+and, optionally, by the total size of its values. Entries belong to a generation
+(e.g. the endpoint catalog build); moving the cache to a new generation drops
+everything cached for the old one.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Hashable, Optional, Tuple
+
+class BoundedLRU:
+    """Thread-safe LRU cache with entry and size limits."""
+
+    def __init__(self, max_entries: int, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries (0 disables caching)
+            max_bytes: Maximum total size of cached values, or None for no size limit
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.generation: Any = None
+
+        self._entries: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value (None on a miss) and mark it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int = 0) -> None:
+        """
+        Store a value, evicting the least recently used entries to stay within bounds.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            size: Size of the value in bytes (only used with max_bytes)
+        """
+        if self.max_entries <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def set_generation(self, generation: Any) -> None:
+        """Move the cache to a generation, clearing it if the generation changed."""
+        with self._lock:
+            if generation == self.generation:
+                return
+            self.generation = generation
+            self._entries.clear()
+            self._bytes = 0
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache metrics."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'generation': self.generation,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Pagination Module
+
+This module walks ConnectWise list endpoints page by page and streams the items to the
+caller. Two pagination styles are supported:
+
+- 'page': numbered pages using the page/pageSize parameters. When the total is knowable
+  through the sibling /count endpoint, pages are fetched concurrently with bounded
+  parallelism and yielded in order. Otherwise pages are fetched sequentially until a
+  short page is returned.
+- 'pageId': ConnectWise forward-only pagination. Each request passes the id of the last
+  record seen as pageId, so pages can only be fetched one after another.
+
+Environment Variables:
+    PAGINATION_PAGE_SIZE - Page size requested from ConnectWise (default: 1000, the API maximum)
+    PAGINATION_CONCURRENCY - Maximum pages fetched in parallel (default: 4)
+"""
+
+import os
+import math
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Any, Optional, Callable, Awaitable, AsyncIterator, List
+
+# Set up logging
+logger = logging.getLogger("api_gateway.pagination")
+
+# ConnectWise rejects page sizes above this value
+MAX_PAGE_SIZE = 1000
+
+# Parameters that must not be forwarded to the /count endpoint
+PAGING_PARAMS = {'page', 'pagesize', 'pageid', 'orderby', 'fields', 'columns'}
+
+def get_pagination_config() -> dict:
+    """Get pagination configuration from environment variables or defaults"""
+    return {
+        'page_size': min(int(os.getenv('PAGINATION_PAGE_SIZE', MAX_PAGE_SIZE)), MAX_PAGE_SIZE),
+        'concurrency': max(1, int(os.getenv('PAGINATION_CONCURRENCY', 4)))
+    }
+
+class Paginator:
+    """Streams every item of a ConnectWise list endpoint across pages."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str, Dict[str, Any]], Awaitable[Any]],
+        page_size: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the paginator.
+
+        Args:
+            fetch: Coroutine function performing a GET for (path, params)
+            page_size: Items requested per page (capped at the ConnectWise maximum)
+            concurrency: Maximum number of pages fetched in parallel
+        """
+        config = get_pagination_config()
+        self.fetch = fetch
+        self.page_size = min(page_size or config['page_size'], MAX_PAGE_SIZE)
+        self.concurrency = concurrency or config['concurrency']
+        self.pages_fetched = 0
+        # Set by iter_items: the count reported by the /count endpoint (None if unknown)
+        # and whether it stopped at max_items with more items available or possibly available
+        self.total: Optional[int] = None
+        self.truncated = False
+
+    async def count(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """
+        Get the total number of records from the sibling /count endpoint.
+
+        Args:
+            path: List endpoint path (e.g., /service/tickets)
+            params: Query parameters of the list request
+
+        Returns:
+            The total count, or None when it cannot be determined
+        """
+        count_params = {k: v for k, v in (params or {}).items() if k.lower() not in PAGING_PARAMS}
+        try:
+            result = await self.fetch(f"{path.rstrip('/')}/count", count_params)
+        except Exception as e:
+            logger.info(f"Count unavailable for {path}, falling back to sequential paging: {e}")
+            return None
+
+        if isinstance(result, dict) and isinstance(result.get('count'), int):
+            return result['count']
+        return None
+
+    async def iter_items(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_items: Optional[int] = None,
+        style: str = 'page'
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items from a list endpoint.
+
+        Args:
+            path: List endpoint path
+            params: Query parameters (conditions, orderBy, fields, ...)
+            max_items: Stop after this many items (None for no limit)
+            style: 'page' for numbered pages or 'pageId' for forward-only pagination
+
+        Yields:
+            Individual records, in endpoint order
+        """
+        self.total = None
+        self.truncated = False
+        # Pages never ask for more items than will be returned
+        page_size = self.page_size if max_items is None else max(1, min(self.page_size, max_items))
+
+        if style == 'pageId':
+            pages = self._iter_forward_pages(path, params, page_size)
+        else:
+            self.total = await self.count(path, params)
+            if self.total is None:
+                pages = self._iter_sequential_pages(path, params, page_size)
+            else:
+                wanted = self.total if max_items is None else min(self.total, max_items)
+                pages = self._iter_concurrent_pages(path, params, page_size, math.ceil(wanted / page_size))
+
+        yielded = 0
+        try:
+            async for page in pages:
+                for item in page:
+                    if max_items is not None and yielded >= max_items:
+                        self.truncated = True
+                        return
+                    yield item
+                    yielded += 1
+                if max_items is not None and yielded >= max_items:
+                    # Without a count, a full last page means the next one may have more
+                    if self.total is not None:
+                        self.truncated = self.total > max_items
+                    else:
+                        self.truncated = len(page) >= page_size
+                    return
+        finally:
+            await pages.aclose()
+
+    def _page_params(self, params: Optional[Dict[str, Any]], page_size: int, **paging) -> Dict[str, Any]:
+        page_params = {k: v for k, v in (params or {}).items() if k.lower() not in ('page', 'pagesize', 'pageid')}
+        page_params['pageSize'] = page_size
+        page_params.update(paging)
+        return page_params
+
+    async def _fetch_page(self, path: str, params: Dict[str, Any]) -> List[Any]:
+        result = await self.fetch(path, params)
+        self.pages_fetched += 1
+        if isinstance(result, list):
+            return result
+        # A non-list response is a single record rather than a collection
+        return [result] if result else []
+
+    async def _iter_concurrent_pages(
+        self, path: str, params: Optional[Dict[str, Any]], page_size: int, page_count: int
+    ) -> AsyncIterator[List[Any]]:
+        """Fetch a known number of pages with bounded parallelism, yielding them in order."""
+        pending = deque()
+        next_page = 1
+
+        def schedule() -> None:
+            nonlocal next_page
+            while next_page <= page_count and len(pending) < self.concurrency:
+                pending.append(asyncio.ensure_future(
+                    self._fetch_page(path, self._page_params(params, page_size, page=next_page))
+                ))
+                next_page += 1
+
+        try:
+            schedule()
+            while pending:
+                items = await pending.popleft()
+                schedule()
+                yield items
+                # The collection shrank since it was counted
+                if len(items) < page_size:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the cancelled fetches so none outlives the iterator
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _iter_sequential_pages(
+        self, path: str, params: Optional[Dict[str, Any]], page_size: int
+    ) -> AsyncIterator[List[Any]]:
+        """Fetch numbered pages one at a time until a short page is returned."""
+        page = 1
+        while True:
+            items = await self._fetch_page(path, self._page_params(params, page_size, page=page))
+            if items:
+                yield items
+            if len(items) < page_size:
+                return
+            page += 1
+
+    async def _iter_forward_pages(
+        self, path: str, params: Optional[Dict[str, Any]], page_size: int
+    ) -> AsyncIterator[List[Any]]:
+        """Fetch forward-only pages, passing the id of the last record as pageId."""
+        page_id = None
+        while True:
+            paging = {'pageId': page_id} if page_id is not None else {}
+            items = await self._fetch_page(path, self._page_params(params, page_size, **paging))
+            if items:
+                yield items
+            if len(items) < page_size:
+                return
+
+            last = items[-1]
+            page_id = last.get('id') if isinstance(last, dict) else None
+            if page_id is None:
+                logger.warning(f"Forward-only paging on {path} stopped: records have no 'id' field")
+                return
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Path Router Module
+
+This module resolves concrete request paths such as /company/companies/123/contacts/456
+to their OpenAPI path templates (/company/companies/{parentId}/contacts/{id}). Templates
+are compiled into a segment trie; a lookup walks the trie once per path segment,
+preferring literal segments over {param} wildcards and backtracking only when a literal
+branch dead-ends. Literal segments match case-insensitively.
+"""
+
+from typing import Dict, List, Any, Optional, Tuple, Iterable
+
+class _Node:
+    __slots__ = ('literals', 'param', 'methods')
+
+    def __init__(self):
+        self.literals: Dict[str, '_Node'] = {}
+        self.param: Optional['_Node'] = None
+        # method -> (endpoint id, parameter names in path order)
+        self.methods: Dict[str, Tuple[Any, Tuple[str, ...]]] = {}
+
+def split_path(path: str) -> List[str]:
+    """Split a path into its non-empty segments."""
+    return [segment for segment in path.split('/') if segment]
+
+def _param_name(segment: str) -> Optional[str]:
+    if len(segment) > 2 and segment[0] == '{' and segment[-1] == '}':
+        return segment[1:-1]
+    return None
+
+class PathRouter:
+    """Segment trie mapping (path template, method) pairs to endpoint ids."""
+
+    def __init__(self, routes: Iterable[Tuple[str, str, Any]] = ()):
+        """
+        Build the router.
+
+        Args:
+            routes: (path template, HTTP method, endpoint id) tuples. When two templates
+                    differ only in parameter names, the first one added wins.
+        """
+        self._root = _Node()
+        self.route_count = 0
+        for path, method, endpoint_id in routes:
+            self.add(path, method, endpoint_id)
+
+    def add(self, path: str, method: str, endpoint_id: Any) -> None:
+        """Add a path template for a method."""
+        node = self._root
+        names = []
+        for segment in split_path(path):
+            name = _param_name(segment)
+            if name is not None:
+                names.append(name)
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.literals.setdefault(segment.lower(), _Node())
+
+        method = method.lower()
+        if method not in node.methods:
+            node.methods[method] = (endpoint_id, tuple(names))
+            self.route_count += 1
+
+    def match(self, path: str, method: str) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """
+        Resolve a concrete path.
+
+        Args:
+            path: Request path, e.g. /service/tickets/123/notes
+            method: HTTP method
+
+        Returns:
+            Tuple of (endpoint id, {parameter name: value}), or None if no template matches
+        """
+        segments = split_path(path)
+        values: List[str] = []
+        found = self._match(self._root, segments, 0, method.lower(), values)
+        if found is None:
+            return None
+        endpoint_id, names = found
+        return endpoint_id, dict(zip(names, values))
+
+    def _match(self, node: _Node, segments: List[str], index: int, method: str, values: List[str]):
+        if index == len(segments):
+            return node.methods.get(method)
+
+        segment = segments[index]
+        literal = node.literals.get(segment.lower())
+        if literal is not None:
+            found = self._match(literal, segments, index + 1, method, values)
+            if found is not None:
+                return found
+
+        if node.param is not None:
+            values.append(segment)
+            found = self._match(node.param, segments, index + 1, method, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Adaptive Rate Limiter Module
+
+This module provides a process-wide token bucket that paces outbound ConnectWise
+requests. The refill rate adapts AIMD-style: it is cut multiplicatively whenever the
+API answers 429/503 and grows additively with each successful response, so the gateway
+settles just below the upstream limit instead of thrashing against it. Retry-After
+headers pause the bucket until the server says it is ready again.
+
+Environment Variables:
+    RATE_LIMIT_ENABLED - Enable outbound rate limiting (default: true)
+    RATE_LIMIT_RPS - Initial requests per second (default: 10)
+    RATE_LIMIT_MIN_RPS - Lower bound for the adaptive rate (default: 1)
+    RATE_LIMIT_MAX_RPS - Upper bound for the adaptive rate (default: 20)
+    RATE_LIMIT_BURST - Bucket capacity, i.e. requests allowed in a burst (default: 10)
+    RATE_LIMIT_DECREASE_FACTOR - Multiplier applied to the rate on 429/503 (default: 0.5)
+    RATE_LIMIT_INCREASE_STEP - Requests per second added per successful response (default: 0.1)
+    RATE_LIMIT_MAX_THROTTLE_RETRIES - Times a 429 response is retried after waiting (default: 3)
+    RATE_LIMIT_MAX_RETRY_AFTER - Longest Retry-After in seconds that is waited out; requests
+                                 asked to wait longer fail instead (default: 60)
+"""
+
+import os
+import math
+import time
+import asyncio
+import logging
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, Awaitable
+
+# Set up logging
+logger = logging.getLogger("api_gateway.rate_limiter")
+
+# Status codes that signal the upstream is shedding load
+THROTTLE_STATUS_CODES = (429, 503)
+
+def get_rate_limit_config() -> dict:
+    """Get rate limiter configuration from environment variables or defaults"""
+    return {
+        'enabled': os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true',
+        'rate': float(os.getenv('RATE_LIMIT_RPS', 10)),
+        'min_rate': float(os.getenv('RATE_LIMIT_MIN_RPS', 1)),
+        'max_rate': float(os.getenv('RATE_LIMIT_MAX_RPS', 20)),
+        'burst': float(os.getenv('RATE_LIMIT_BURST', 10)),
+        'decrease_factor': float(os.getenv('RATE_LIMIT_DECREASE_FACTOR', 0.5)),
+        'increase_step': float(os.getenv('RATE_LIMIT_INCREASE_STEP', 0.1)),
+        'max_throttle_retries': int(os.getenv('RATE_LIMIT_MAX_THROTTLE_RETRIES', 3)),
+        'max_retry_after': float(os.getenv('RATE_LIMIT_MAX_RETRY_AFTER', 60))
+    }
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+        now: Current time an HTTP-date is measured from (default: the system clock)
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid (including
+        non-finite values such as "inf" or "nan")
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+class AdaptiveRateLimiter:
+    """Token bucket with AIMD rate adaptation and Retry-After support."""
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            config: Limiter configuration (see get_rate_limit_config for keys)
+            clock: Monotonic time source in seconds
+            sleep: Coroutine function waiting the given number of seconds
+        """
+        self.config = get_rate_limit_config()
+        if config:
+            self.config.update(config)
+        self._clock = clock
+        self._sleep = sleep
+
+        self.rate = min(max(self.config['rate'], self.config['min_rate']), self.config['max_rate'])
+        self._tokens = self.config['burst']
+        self._last_refill = self._clock()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self._waiting = 0
+
+        self.throttled_total = 0
+        self.acquired_total = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['enabled']
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests currently waiting for a token."""
+        return self._waiting
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.config['burst'], self._tokens + elapsed * self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent. Waiters are served in FIFO order."""
+        if not self.enabled:
+            return
+
+        self._waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    now = self._clock()
+                    if now < self._blocked_until:
+                        await self._sleep(self._blocked_until - now)
+                        continue
+
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self.acquired_total += 1
+                        return
+
+                    await self._sleep((1 - self._tokens) / self.rate)
+        finally:
+            self._waiting -= 1
+
+    def on_success(self) -> None:
+        """Additively increase the rate after a successful response."""
+        self.rate = min(self.config['max_rate'], self.rate + self.config['increase_step'])
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """
+        Multiplicatively decrease the rate after a 429/503 response.
+
+        Args:
+            retry_after: Seconds the server asked us to wait, if provided (capped at
+                         RATE_LIMIT_MAX_RETRY_AFTER)
+        """
+        self.throttled_total += 1
+        self.rate = max(self.config['min_rate'], self.rate * self.config['decrease_factor'])
+        self._tokens = 0
+
+        now = self._clock()
+        self._last_refill = now
+        if retry_after:
+            retry_after = min(retry_after, self.config['max_retry_after'])
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+        logger.warning(
+            f"Upstream throttled request; rate lowered to {self.rate:.2f} req/s"
+            + (f", pausing for {retry_after:.1f}s" if retry_after else "")
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current limiter metrics."""
+        now = self._clock()
+        return {
+            'enabled': self.enabled,
+            'rate_per_second': round(self.rate, 3),
+            'available_tokens': round(min(self.config['burst'], self._tokens + (now - self._last_refill) * self.rate), 3),
+            'queue_depth': self.queue_depth,
+            'paused_for_seconds': round(max(0.0, self._blocked_until - now), 3),
+            'acquired_total': self.acquired_total,
+            'throttled_total': self.throttled_total
+        }
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Resilience Module
+
+This module provides the retry and circuit breaking primitives used on the outbound
+ConnectWise request path:
+
+- Exponential backoff with full jitter for retrying idempotent requests after timeouts,
+  connection errors and transient 5xx responses.
+- A retry budget that caps retries to a fraction of recent traffic, so retries cannot
+  multiply the load on an API that is already struggling.
+- A per-host circuit breaker that fails fast while ConnectWise is degraded and lets a
+  limited number of half-open probe requests through to detect recovery.
+
+Environment Variables:
+    RETRY_MAX_ATTEMPTS - Total attempts for an idempotent request, including the first (default: 3)
+    RETRY_BASE_DELAY - Base backoff delay in seconds (default: 0.5)
+    RETRY_MAX_DELAY - Maximum backoff delay in seconds (default: 8)
+    RETRY_BUDGET_RATIO - Retries allowed per original request (default: 0.2)
+    RETRY_BUDGET_MIN_PER_SECOND - Retries always allowed per second at low traffic (default: 1)
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD - Consecutive failures that open the circuit (default: 5)
+    CIRCUIT_BREAKER_RESET_TIMEOUT - Seconds the circuit stays open before probing (default: 30)
+    CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS - Concurrent probe requests while half-open (default: 1)
+"""
+
+import os
+import time
+import random
+import logging
+from typing import Dict, Any, Optional, Callable
+
+# Set up logging
+logger = logging.getLogger("api_gateway.resilience")
+
+# Methods that can be safely sent more than once
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# Upstream responses that indicate a transient failure worth retrying
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+
+def get_resilience_config() -> dict:
+    """Get retry and circuit breaker configuration from environment variables or defaults"""
+    return {
+        'max_attempts': max(1, int(os.getenv('RETRY_MAX_ATTEMPTS', 3))),
+        'base_delay': float(os.getenv('RETRY_BASE_DELAY', 0.5)),
+        'max_delay': float(os.getenv('RETRY_MAX_DELAY', 8.0)),
+        'budget_ratio': float(os.getenv('RETRY_BUDGET_RATIO', 0.2)),
+        'budget_min_per_second': float(os.getenv('RETRY_BUDGET_MIN_PER_SECOND', 1.0)),
+        'failure_threshold': int(os.getenv('CIRCUIT_BREAKER_FAILURE_THRESHOLD', 5)),
+        'reset_timeout': float(os.getenv('CIRCUIT_BREAKER_RESET_TIMEOUT', 30.0)),
+        'half_open_max_calls': int(os.getenv('CIRCUIT_BREAKER_HALF_OPEN_MAX_CALLS', 1))
+    }
+
+class CircuitOpenError(Exception):
+    """Exception raised when a request is rejected by an open circuit breaker"""
+    def __init__(self, host: str, retry_in: float):
+        self.host = host
+        self.retry_in = retry_in
+        super().__init__(f"Circuit breaker open for {host}; failing fast. Retry in {retry_in:.0f}s.")
+
+class RetryPolicy:
+    """Decides whether a request may be retried and how long to wait before it."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, rng: Optional[random.Random] = None):
+        """
+        Initialize the policy.
+
+        Args:
+            config: Retry configuration (see get_resilience_config for keys)
+            rng: Random number generator for the jitter (default: the random module)
+        """
+        self.config = get_resilience_config()
+        if config:
+            self.config.update(config)
+        self._random = rng or random
+
+    def is_retryable(self, method: str, attempt: int, status_code: Optional[int] = None) -> bool:
+        """
+        Check if a failed attempt may be retried.
+
+        Args:
+            method: HTTP method of the request
+            attempt: Number of attempts already made (1 after the first failure)
+            status_code: Response status, or None for timeouts and connection errors
+
+        Returns:
+            True if another attempt is allowed by the policy
+        """
+        if attempt >= self.config['max_attempts']:
+            return False
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return False
+        return status_code is None or status_code in RETRYABLE_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """Get a full-jitter exponential backoff delay for the given attempt number."""
+        ceiling = min(self.config['max_delay'], self.config['base_delay'] * (2 ** (attempt - 1)))
+        return self._random.uniform(0, ceiling)
+
+class RetryBudget:
+    """Limits retries to a fraction of recent requests."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the budget.
+
+        Args:
+            config: Retry configuration (see get_resilience_config for keys)
+            clock: Monotonic time source in seconds
+        """
+        self.config = get_resilience_config()
+        if config:
+            self.config.update(config)
+        self._clock = clock
+
+        # Cap the balance so a long quiet period cannot bank an unbounded burst of retries
+        self._max_balance = max(1.0, 10 * self.config['budget_min_per_second'])
+        self._balance = self._max_balance
+        self._last_update = self._clock()
+        self.exhausted_total = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._balance = min(self._max_balance, self._balance + (now - self._last_update) * self.config['budget_min_per_second'])
+        self._last_update = now
+
+    def record_request(self) -> None:
+        """Deposit budget for an original (non-retry) request."""
+        self._refill()
+        self._balance = min(self._max_balance, self._balance + self.config['budget_ratio'])
+
+    def try_spend(self) -> bool:
+        """Withdraw budget for a retry. Returns False when the budget is exhausted."""
+        self._refill()
+        if self._balance >= 1:
+            self._balance -= 1
+            return True
+        self.exhausted_total += 1
+        return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current budget metrics."""
+        self._refill()
+        return {
+            'available_retries': round(self._balance, 3),
+            'exhausted_total': self.exhausted_total
+        }
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker for a single upstream host."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, host: str, config: Optional[Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the breaker.
+
+        Args:
+            host: Upstream host this breaker protects
+            config: Breaker configuration (see get_resilience_config for keys)
+            clock: Monotonic time source in seconds
+        """
+        self.host = host
+        self.config = get_resilience_config()
+        if config:
+            self.config.update(config)
+        self._clock = clock
+
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.rejected_total = 0
+
+    def before_request(self) -> None:
+        """
+        Admit a request or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all probe slots taken
+        """
+        if self.state == self.OPEN:
+            elapsed = self._clock() - self._opened_at
+            if elapsed < self.config['reset_timeout']:
+                self.rejected_total += 1
+                raise CircuitOpenError(self.host, self.config['reset_timeout'] - elapsed)
+            self.state = self.HALF_OPEN
+            self._probes_in_flight = 0
+            logger.info(f"Circuit breaker for {self.host} half-open; probing upstream")
+
+        if self.state == self.HALF_OPEN:
+            if self._probes_in_flight >= self.config['half_open_max_calls']:
+                self.rejected_total += 1
+                raise CircuitOpenError(self.host, 0)
+            self._probes_in_flight += 1
+
+    def record_success(self) -> None:
+        """Record that the upstream answered normally."""
+        if self.state == self.HALF_OPEN:
+            logger.info(f"Circuit breaker for {self.host} closed; upstream recovered")
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._probes_in_flight = 0
+
+    def record_failure(self) -> None:
+        """Record a timeout, connection error or 5xx response."""
+        self._consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self._consecutive_failures >= self.config['failure_threshold']:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Circuit breaker for {self.host} opened after {self._consecutive_failures} consecutive failure(s)"
+                )
+            self.state = self.OPEN
+            self._opened_at = self._clock()
+            self._probes_in_flight = 0
+
+    def release(self) -> None:
+        """Give back a probe slot for a request that ended without an outcome (e.g. cancelled)."""
+        if self.state == self.HALF_OPEN and self._probes_in_flight > 0:
+            self._probes_in_flight -= 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current breaker metrics."""
+        return {
+            'state': self.state,
+            'consecutive_failures': self._consecutive_failures,
+            'rejected_total': self.rejected_total
+        }
+
+class CircuitBreakerRegistry:
+    """Holds one circuit breaker per upstream host."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        self.config = config
+        self._clock = clock
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, host: str) -> CircuitBreaker:
+        """Get the breaker for a host, creating it on first use."""
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, self.config, self._clock)
+            self._breakers[host] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get metrics for every known host."""
+        return {host: breaker.snapshot() for host, breaker in self._breakers.items()}
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Response Cache Module
+
+This module provides an in-memory TTL + LRU cache for idempotent GET responses from
+the ConnectWise API. Entries are keyed on the normalized path and query parameters,
+bounded by entry count and total body size, and expire using per-category TTLs
+(the category being the first path segment, e.g. 'service' or 'company').
+
+Writes (POST/PUT/PATCH/DELETE) sent through the gateway invalidate cached entries for
+the same resource path, its sub-resources and its parent collection. A GET that was
+already in flight when such a write invalidated its path is not stored: callers read
+version(path) before sending and pass it to set(), which drops the response if the
+version has changed.
+
+Environment Variables:
+    RESPONSE_CACHE_ENABLED - Enable the response cache (default: true)
+    RESPONSE_CACHE_MAX_ENTRIES - Maximum number of cached responses (default: 1000)
+    RESPONSE_CACHE_MAX_BYTES - Maximum total size of cached bodies in bytes (default: 52428800)
+    RESPONSE_CACHE_DEFAULT_TTL - TTL in seconds for categories without an override (default: 60)
+    RESPONSE_CACHE_TTLS - Per-category TTL overrides, e.g. "service=30,system=600"
+"""
+
+import os
+import re
+import json
+import time
+import logging
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Callable
+
+# Set up logging
+logger = logging.getLogger("api_gateway.response_cache")
+
+# Reference data changes rarely, ticket/time data changes often
+DEFAULT_CATEGORY_TTLS = {
+    'system': 600,
+    'procurement': 300,
+    'marketing': 300,
+    'service': 30,
+    'time': 30,
+    'schedule': 30
+}
+
+def get_response_cache_config() -> dict:
+    """Get response cache configuration from environment variables or defaults"""
+    category_ttls = dict(DEFAULT_CATEGORY_TTLS)
+    for item in os.getenv('RESPONSE_CACHE_TTLS', '').split(','):
+        if '=' in item:
+            category, ttl = item.split('=', 1)
+            try:
+                category_ttls[category.strip().lower()] = float(ttl)
+            except ValueError:
+                logger.warning(f"Ignoring invalid RESPONSE_CACHE_TTLS entry: {item}")
+
+    return {
+        'enabled': os.getenv('RESPONSE_CACHE_ENABLED', 'true').lower() == 'true',
+        'max_entries': int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', 1000)),
+        'max_bytes': int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 50 * 1024 * 1024)),
+        'default_ttl': float(os.getenv('RESPONSE_CACHE_DEFAULT_TTL', 60)),
+        'category_ttls': category_ttls
+    }
+
+def normalize_api_path(path: str) -> str:
+    """
+    Normalize an API path for use in cache keys.
+
+    Examples:
+        /Service/Tickets/ -> /service/tickets
+        service//tickets/123 -> /service/tickets/123
+    """
+    if not path:
+        return '/'
+    normalized = re.sub(r'/+', '/', path.strip().split('?', 1)[0]).lower()
+    if not normalized.startswith('/'):
+        normalized = '/' + normalized
+    if len(normalized) > 1:
+        normalized = normalized.rstrip('/')
+    return normalized
+
+def canonical_params(params: Optional[Dict[str, Any]]) -> str:
+    """Serialize query parameters into a stable, order-independent string."""
+    if not params:
+        return ''
+    return json.dumps({str(k): params[k] for k in params}, sort_keys=True, separators=(',', ':'), default=str)
+
+def request_fingerprint(method: str, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a canonical fingerprint identifying a request by method, path and params."""
+    return f"{method.upper()} {normalize_api_path(path)}?{canonical_params(params)}"
+
+class ResponseCache:
+    """Bounded TTL + LRU cache of parsed GET responses."""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            config: Cache configuration (see get_response_cache_config for keys)
+            clock: Monotonic time source in seconds
+        """
+        self.config = get_response_cache_config()
+        if config:
+            self.config.update(config)
+        self._clock = clock
+
+        # key -> (path, value, size, expires_at)
+        self._entries: "OrderedDict[str, Tuple[str, Any, int, float]]" = OrderedDict()
+        self._total_bytes = 0
+        # Invalidation counts: of a path and its sub-paths, and of exactly one path
+        self._subtree_invalidations: Dict[str, int] = {}
+        self._path_invalidations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale_sets = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.config['enabled']
+
+    def ttl_for(self, path: str) -> float:
+        """Get the TTL in seconds for a path based on its category."""
+        segments = normalize_api_path(path).split('/')
+        category = segments[1] if len(segments) > 1 else ''
+        return self.config['category_ttls'].get(category, self.config['default_ttl'])
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters of the request
+
+        Returns:
+            The cached parsed response, or None on a miss. Cached values are shared
+            between callers and must be treated as read-only.
+        """
+        if not self.enabled:
+            return None
+
+        key = request_fingerprint('GET', path, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry[3] <= self._clock():
+            self._remove(key)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def version(self, path: str) -> int:
+        """
+        Get the invalidation version of a path.
+
+        The version changes whenever invalidate() is called for a write that affects
+        the path, so a response fetched in between can be recognized as stale.
+        """
+        normalized = normalize_api_path(path)
+        # Writes to the path itself or to any path above it
+        version = self._path_invalidations.get(normalized, 0) + self._subtree_invalidations.get(normalized, 0)
+        end = normalized.find('/', 1)
+        while end != -1:
+            version += self._subtree_invalidations.get(normalized[:end], 0)
+            end = normalized.find('/', end + 1)
+        return version
+
+    def set(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        value: Any,
+        size: int,
+        version: Optional[int] = None
+    ) -> None:
+        """
+        Store a parsed response.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters of the request
+            value: Parsed response body
+            size: Size of the raw response body in bytes
+            version: version(path) read before the request was sent; the response is
+                     not stored if the path has been invalidated since
+        """
+        if not self.enabled:
+            return
+        if version is not None and version != self.version(path):
+            self.stale_sets += 1
+            logger.info(f"Not caching GET {normalize_api_path(path)}: invalidated while in flight")
+            return
+
+        ttl = self.ttl_for(path)
+        if ttl <= 0 or size > self.config['max_bytes']:
+            return
+
+        key = request_fingerprint('GET', path, params)
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (normalize_api_path(path), value, size, self._clock() + ttl)
+        self._total_bytes += size
+
+        while len(self._entries) > self.config['max_entries'] or self._total_bytes > self.config['max_bytes']:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def invalidate(self, path: str) -> int:
+        """
+        Invalidate entries affected by a write to a resource path.
+
+        Removes entries for the path itself, its sub-resources, its parent collection
+        and the parent collection's /count endpoint.
+
+        Args:
+            path: Path the write was sent to
+
+        Returns:
+            Number of entries removed
+        """
+        target = normalize_api_path(path)
+        parent = target.rsplit('/', 1)[0] or '/'
+        affected = {target, parent, f"{parent}/count"}
+
+        self._subtree_invalidations[target] = self._subtree_invalidations.get(target, 0) + 1
+        for affected_path in (parent, f"{parent}/count"):
+            self._path_invalidations[affected_path] = self._path_invalidations.get(affected_path, 0) + 1
+
+        stale_keys = [
+            key for key, entry in self._entries.items()
+            if entry[0] in affected or entry[0].startswith(target + '/')
+        ]
+        for key in stale_keys:
+            self._remove(key)
+
+        if stale_keys:
+            self.invalidations += len(stale_keys)
+            logger.info(f"Invalidated {len(stale_keys)} cached response(s) for {target}")
+        return len(stale_keys)
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            'enabled': self.enabled,
+            'entries': len(self._entries),
+            'bytes': self._total_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'stale_sets': self.stale_sets
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[2]
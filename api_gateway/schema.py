@@ -4,8 +4,8 @@ Database schema definitions for ConnectWise API Gateway
 Contains SQLAlchemy table models for storing API endpoint information.
 """
 
-from sqlalchemy import Column, Integer, Text, Boolean, ForeignKey, Index, BigInteger, func
-from sqlalchemy.dialects.postgresql import JSON, TSVECTOR
+from sqlalchemy import Column, Integer, Text, Boolean, ForeignKey, Index, BigInteger, DateTime, Float, LargeBinary, func
+from sqlalchemy.dialects.postgresql import JSON, JSONB, TSVECTOR
 from sqlalchemy.orm import declarative_base, relationship
 
 # SQLAlchemy setup
@@ -23,6 +23,7 @@ class Endpoint(Base):
     tags = Column(Text)
     keywords = Column(Text)
     search_vector = Column(TSVECTOR, nullable=True)
+    fingerprint = Column(Text)  # Hash of the operation's ingested rows, compared by the next ingest
 
     # Relationships
     parameters = relationship("Parameter", back_populates="endpoint", cascade="all, delete-orphan")
@@ -57,13 +58,26 @@ class Parameter(Base):
         Index('idx_parameters_endpoint_id', 'endpoint_id'),
     )
 
+class SchemaDocument(Base):
+    """Distinct resolved body schema, content-addressed by the SHA-256 of its canonical JSON"""
+    __tablename__ = 'schemas'
+
+    id = Column(Integer, primary_key=True)
+    hash = Column(Text, nullable=False)
+    document = Column(JSONB, nullable=False)
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_schemas_hash', 'hash', unique=True),
+    )
+
 class RequestBody(Base):
     __tablename__ = 'request_bodies'
 
     id = Column(Integer, primary_key=True)
     endpoint_id = Column(Integer, ForeignKey('endpoints.id'), nullable=False)
-    schema = Column(Text)  # JSON schema for the body
-    example = Column(Text)  # JSON example if available
+    schema_id = Column(Integer, ForeignKey('schemas.id'))  # Resolved JSON schema for the body
+    example = Column(JSONB)  # JSON example if available
 
     # Relationships
     endpoint = relationship("Endpoint", back_populates="request_bodies")
@@ -71,6 +85,7 @@ class RequestBody(Base):
     # Indexes
     __table_args__ = (
         Index('idx_request_bodies_endpoint_id', 'endpoint_id'),
+        Index('idx_request_bodies_schema_id', 'schema_id'),
     )
 
 class ResponseBody(Base):
@@ -80,8 +95,8 @@ class ResponseBody(Base):
     endpoint_id = Column(Integer, ForeignKey('endpoints.id'), nullable=False)
     status_code = Column(Text)
     description = Column(Text)
-    schema = Column(Text)  # JSON schema for the response
-    example = Column(Text)  # JSON example if available
+    schema_id = Column(Integer, ForeignKey('schemas.id'))  # Resolved JSON schema for the response
+    example = Column(JSONB)  # JSON example if available
 
     # Relationships
     endpoint = relationship("Endpoint", back_populates="response_bodies")
@@ -89,8 +104,44 @@ class ResponseBody(Base):
     # Indexes
     __table_args__ = (
         Index('idx_response_bodies_endpoint_id', 'endpoint_id'),
+        Index('idx_response_bodies_schema_id', 'schema_id'),
+    )
+
+class EndpointTerm(Base):
+    """Inverted keyword index: one posting per (term, endpoint) with the term's field weight"""
+    __tablename__ = 'endpoint_terms'
+
+    term = Column(Text, primary_key=True)
+    endpoint_id = Column(Integer, ForeignKey('endpoints.id', ondelete='CASCADE'), primary_key=True)
+    weight = Column(Float, nullable=False)
+
+    # Indexes (the primary key serves term lookups)
+    __table_args__ = (
+        Index('idx_endpoint_terms_endpoint_id', 'endpoint_id'),
     )
 
+class CatalogBuild(Base):
+    """Record of a completed catalog ingest; the highest id is the catalog generation"""
+    __tablename__ = 'catalog_builds'
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    endpoint_count = Column(Integer)
+    spec_hash = Column(Text)  # SHA-256 of the OpenAPI document file the catalog was built from
+    spec_version = Column(Text)  # info.version of that document
+    ingest_version = Column(Integer)  # json_to_postgres INGEST_VERSION that built it
+    schema_max_depth = Column(Integer)  # SchemaResolver depth the body schemas were resolved with
+
+class SemanticIndexData(Base):
+    """Serialized semantic search index (see semantic_search.py); the latest row is used"""
+    __tablename__ = 'semantic_indexes'
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    endpoint_count = Column(Integer)
+    dimensions = Column(Integer)
+    data = Column(LargeBinary, nullable=False)
+
 class SavedQuery(Base):
     """Model for Fast Memory saved queries"""
     __tablename__ = 'saved_queries'
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Schema Resolver Module
+
+This module inlines the $ref component references of OpenAPI request and response body
+schemas for json_to_postgres.py.
+
+A reference back to a component that is still being resolved (Member -> Company ->
+Member) is a cycle. It is replaced with a marker naming the component instead of being
+expanded again, and so is a component nested deeper than SCHEMA_MAX_DEPTH below the
+body's schema:
+
+    {"type": "object", "x-circular-ref": "Member"}
+    {"type": "object", "x-truncated-ref": "CompanyReference"}
+
+Resolved components are memoized, and later references reuse the same object, so a
+component such as Ticket is not expanded again for every endpoint that returns it. A
+component's expansion only depends on which of the components it can reach are already
+being resolved around it (those become cycle markers) and, if the depth limit cuts it,
+on its depth. The memo is keyed by exactly that, so the result for a body never depends
+on the order bodies are resolved in. Components outside any cycle - nearly all of them -
+are resolved exactly once.
+
+Resolved schemas are content-addressed by schema_hash() (SHA-256 of the canonical JSON),
+which lets the ingest store each distinct body schema once in the schemas table.
+
+This module is imported by json_to_postgres.py, which runs as a standalone script, so it
+must not import anything from the api_gateway package.
+
+Environment Variables:
+    SCHEMA_MAX_DEPTH - Component levels inlined below a body schema (default: 8)
+"""
+
+import os
+import json
+import hashlib
+from typing import Dict, List, Any, Optional, Set, Tuple, FrozenSet
+
+COMPONENT_PREFIX = '#/components/schemas/'
+
+def get_resolver_config() -> dict:
+    """Get schema resolver configuration from environment variables or defaults"""
+    return {
+        'max_depth': int(os.getenv('SCHEMA_MAX_DEPTH', 8))
+    }
+
+def schema_hash(document: Any) -> str:
+    """Get the SHA-256 hex digest of a document's canonical JSON (sorted keys, no whitespace)."""
+    canonical = json.dumps(document, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class SchemaResolver:
+    """Resolves $ref references against the components of one OpenAPI document."""
+
+    def __init__(self, components: Dict[str, Any], max_depth: int = 8):
+        """
+        Initialize the resolver.
+
+        Args:
+            components: The document's #/components/schemas mapping
+            max_depth: Component levels inlined below a body schema
+        """
+        self.components = components or {}
+        self.max_depth = max_depth
+        self.stats = {'components': 0, 'cycles': 0, 'truncated': 0, 'unresolved': 0}
+
+        self._resolving: List[str] = []
+        self._reachable: Dict[str, FrozenSet[str]] = {}
+        # (name, enclosing reachable components) -> (schema, component levels); valid at any
+        # depth that leaves room for those levels
+        self._complete: Dict[Tuple[str, FrozenSet[str]], Tuple[Any, int]] = {}
+        # (name, enclosing reachable components, levels left) -> schema cut by the depth limit
+        self._cut: Dict[Tuple[str, FrozenSet[str], int], Any] = {}
+        self._arrays: Dict[str, Dict[str, Any]] = {}
+        # id(document) -> (document, hash); the document is kept so its id is not reused
+        self._hashes: Dict[int, tuple] = {}
+
+    @staticmethod
+    def component_name(ref: str) -> Optional[str]:
+        """Get the component name of a #/components/schemas/<name> reference."""
+        if isinstance(ref, str) and ref.startswith(COMPONENT_PREFIX):
+            return ref[len(COMPONENT_PREFIX):]
+        return None
+
+    def _references(self, node: Any, names: Set[str]) -> Set[str]:
+        """Collect the names of the known components a schema fragment references directly."""
+        if isinstance(node, dict):
+            name = self.component_name(node.get('$ref'))
+            if name in self.components:
+                names.add(name)
+            for value in node.values():
+                self._references(value, names)
+        elif isinstance(node, list):
+            for item in node:
+                self._references(item, names)
+        return names
+
+    def reachable(self, name: str) -> FrozenSet[str]:
+        """Get the components reachable from a component through references (itself if it is on a cycle)."""
+        if name not in self._reachable:
+            seen: Set[str] = set()
+            pending = [name]
+            while pending:
+                for reference in self._references(self.components[pending.pop()], set()):
+                    if reference not in seen:
+                        seen.add(reference)
+                        pending.append(reference)
+            self._reachable[name] = frozenset(seen)
+        return self._reachable[name]
+
+    def resolve_ref(self, ref: str) -> Any:
+        """
+        Resolve a component reference.
+
+        Args:
+            ref: Reference such as #/components/schemas/Ticket
+
+        Returns:
+            The resolved component (shared, treat as read-only), or a marker for a cycle,
+            the depth limit or an unknown component
+        """
+        return self._resolve_ref(ref)[0]
+
+    def resolve(self, node: Any) -> Any:
+        """Resolve every $ref inside a schema fragment (the fragment itself is not modified)."""
+        return self._resolve(node)[0]
+
+    def _resolve_ref(self, ref: str) -> Tuple[Any, int, bool]:
+        """Resolve a reference into (schema, component levels, cut by the depth limit)."""
+        name = self.component_name(ref)
+        if name is None or name not in self.components:
+            self.stats['unresolved'] += 1
+            return {"type": "parsing-error", "description": f"Unresolved reference: {ref}"}, 0, False
+        if name in self._resolving:
+            self.stats['cycles'] += 1
+            return {"type": "object", "x-circular-ref": name}, 0, False
+        levels_left = self.max_depth - len(self._resolving)
+        if levels_left <= 0:
+            self.stats['truncated'] += 1
+            return {"type": "object", "x-truncated-ref": name}, 0, True
+
+        # Only enclosing components the expansion can reach change it (into cycle markers)
+        context = frozenset(self._resolving) & self.reachable(name)
+        complete = self._complete.get((name, context))
+        if complete is not None and complete[1] <= levels_left:
+            return complete[0], complete[1], False
+        if (name, context, levels_left) in self._cut:
+            return self._cut[(name, context, levels_left)], levels_left, True
+
+        self._resolving.append(name)
+        try:
+            resolved, levels, cut = self._resolve(self.components[name])
+        finally:
+            self._resolving.pop()
+        self.stats['components'] += 1
+
+        if cut:
+            self._cut[(name, context, levels_left)] = resolved
+        else:
+            self._complete[(name, context)] = (resolved, levels + 1)
+        return resolved, levels + 1, cut
+
+    def _resolve(self, node: Any) -> Tuple[Any, int, bool]:
+        """Resolve a schema fragment into (schema, component levels, cut by the depth limit)."""
+        if isinstance(node, dict):
+            if isinstance(node.get('$ref'), str):
+                return self._resolve_ref(node['$ref'])
+            children = [(key, self._resolve(value)) for key, value in node.items()]
+        elif isinstance(node, list):
+            children = [(index, self._resolve(item)) for index, item in enumerate(node)]
+        else:
+            return node, 0, False
+
+        levels = max((child[1] for _, child in children), default=0)
+        cut = any(child[2] for _, child in children)
+        if isinstance(node, dict):
+            return {key: child[0] for key, child in children}, levels, cut
+        return [child[0] for _, child in children], levels, cut
+
+    def resolve_body(self, schema: Dict[str, Any]) -> Any:
+        """
+        Resolve a request/response body schema.
+
+        Arrays of a component are stored with their items as a one-element list; the
+        result for the same component is shared between bodies.
+        """
+        if not schema:
+            return {}
+        if schema.get('type', '') == 'array':
+            ref = (schema.get('items') or {}).get('$ref', '')
+            if not ref:
+                return {'type': 'array', 'items': []}
+            if ref not in self._arrays:
+                self._arrays[ref] = {'type': 'array', 'items': [self.resolve_ref(ref)]}
+            return self._arrays[ref]
+        return self.resolve(schema)
+
+    def hash(self, document: Any) -> str:
+        """Get schema_hash(document), computed once per resolved object."""
+        cached = self._hashes.get(id(document))
+        if cached is None or cached[0] is not document:
+            cached = (document, schema_hash(document))
+            self._hashes[id(document)] = cached
+        return cached[1]
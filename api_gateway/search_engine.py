@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Search Engine Module
+
+This module plans endpoint searches as a single SQL statement. The previous approach
+ran a cascade of queries (capability checks, websearch_to_tsquery, plainto_tsquery,
+then keyword ILIKE), each in its own session and each only after the one before had
+come back empty. The engine instead:
+
+- detects the database's search capabilities (search_vector column and data, pg_trgm,
+  websearch_to_tsquery) once, re-checking only when the catalog build generation changes
+- computes the tsqueries once per request in a CTE
+- gathers full-text, plain full-text and keyword candidates in tiered CTEs combined
+  with UNION ALL; each fallback tier is guarded by NOT EXISTS on the tiers before it,
+  so Postgres only scans for it when the earlier tiers found nothing
+- pushes ranking and LIMIT into every tier and into the final ordering
+- answers keyword searches from the endpoint_terms inverted index built at ingest (see
+  search_terms.py) when it is present, so they scale with the matching postings; older
+  databases fall back to ILIKE matching
+
+so every search costs one database round trip.
+
+APIDatabase keeps recent search results in a bounded LRU keyed by (search, normalized
+query, options) and clears it when the catalog build generation changes, so repeated
+searches are answered without touching Postgres.
+
+Environment Variables:
+    SEARCH_CACHE_MAX_ENTRIES - Cached search results (default: 1024, 0 disables the cache)
+    SEARCH_CACHE_MAX_BYTES - Approximate memory bound for cached results (default: 16777216)
+"""
+
+import os
+import logging
+from typing import Dict, List, Any, Optional, Callable, Iterable, Tuple
+from sqlalchemy import text
+from api_gateway.search_terms import STOPWORDS
+
+# Set up logging
+logger = logging.getLogger("api_gateway.search_engine")
+
+# Endpoint columns returned by searches
+RESULT_COLUMNS = ('id', 'path', 'method', 'description', 'category', 'tags', 'summary')
+
+# Columns matched by the keyword tier, in match priority order
+KEYWORD_COLUMNS = ('summary', 'description', 'path', 'tags')
+
+def get_search_cache_config() -> dict:
+    """Get search result cache configuration from environment variables or defaults"""
+    return {
+        'max_entries': int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', 1024)),
+        'max_bytes': int(os.getenv('SEARCH_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+    }
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query (case and whitespace insensitive) for searching and cache keys."""
+    return " ".join(query.lower().split())
+
+def extract_keywords(query: str) -> List[str]:
+    """Split a natural language query into keywords, dropping stopwords and short words."""
+    return [word for word in query.lower().split() if word not in STOPWORDS and len(word) >= 3]
+
+class SearchEngine:
+    """Builds and runs single-statement endpoint searches."""
+
+    def __init__(self, session_factory: Callable):
+        """
+        Initialize the search engine.
+
+        Args:
+            session_factory: Context manager factory yielding SQLAlchemy sessions
+                             (APIDatabase.get_session)
+        """
+        self.session_factory = session_factory
+        self._capabilities: Optional[Dict[str, bool]] = None
+        self._generation: Any = None
+
+    def detect_capabilities(self) -> Dict[str, bool]:
+        """
+        Query the database for the search features it supports.
+
+        Returns:
+            Dictionary with fulltext, websearch, trigram and terms flags
+        """
+        capabilities = {'fulltext': False, 'websearch': False, 'trigram': False, 'terms': False}
+        try:
+            with self.session_factory() as session:
+                row = session.execute(text("""
+                    SELECT
+                        EXISTS (
+                            SELECT 1 FROM information_schema.columns
+                            WHERE table_name = 'endpoints' AND column_name = 'search_vector'
+                        ) AS has_search_vector,
+                        EXISTS (SELECT 1 FROM pg_proc WHERE proname = 'websearch_to_tsquery') AS has_websearch,
+                        EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') AS has_trigram,
+                        EXISTS (
+                            SELECT 1 FROM information_schema.tables WHERE table_name = 'endpoint_terms'
+                        ) AS has_terms_table
+                """)).fetchone()
+                capabilities['websearch'] = bool(row.has_websearch)
+                capabilities['trigram'] = bool(row.has_trigram)
+
+                if row.has_search_vector:
+                    # Full-text search is only useful once the vectors have been populated
+                    result = session.execute(text("SELECT EXISTS (SELECT 1 FROM endpoints WHERE search_vector IS NOT NULL)"))
+                    capabilities['fulltext'] = bool(result.scalar())
+
+                if row.has_terms_table:
+                    result = session.execute(text("SELECT EXISTS (SELECT 1 FROM endpoint_terms)"))
+                    capabilities['terms'] = bool(result.scalar())
+        except Exception as e:
+            logger.warning(f"Could not detect search capabilities, using keyword search only: {e}")
+
+        logger.info(f"Search capabilities: {capabilities}")
+        return capabilities
+
+    def capabilities(self, generation: Any = None) -> Dict[str, bool]:
+        """
+        Get the search capabilities, detecting them on first use or when the build generation changes.
+
+        Args:
+            generation: Current catalog build generation
+
+        Returns:
+            Dictionary with fulltext, websearch, trigram and terms flags
+        """
+        if self._capabilities is None or generation != self._generation:
+            self._capabilities = self.detect_capabilities()
+            self._generation = generation
+        return self._capabilities
+
+    def similarity_rank(self, param: str, capabilities: Dict[str, bool]) -> str:
+        """
+        Build an SQL expression ranking endpoints by trigram word similarity.
+
+        Args:
+            param: Name of the bound parameter holding the search text
+            capabilities: Capabilities from capabilities()
+
+        Returns:
+            The best word similarity across the keyword columns, or a constant when
+            pg_trgm is not installed
+        """
+        if not capabilities['trigram']:
+            return "0"
+        return "GREATEST(" + ", ".join(
+            f"word_similarity(:{param}, COALESCE({column}, ''))" for column in KEYWORD_COLUMNS
+        ) + ")"
+
+    def build(
+        self,
+        query: str,
+        patterns: Iterable[str],
+        limit: Optional[int],
+        capabilities: Dict[str, bool],
+        fulltext_rank: str = 'ts_rank_cd',
+        plain_fallback: bool = True,
+        highlights: bool = False,
+        offset: int = 0,
+        with_total: bool = False,
+        columns: Iterable[str] = RESULT_COLUMNS,
+        terms: Optional[Iterable[str]] = None
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Build the search statement.
+
+        Args:
+            query: Text for the full-text tiers
+            patterns: Substrings for the keyword tier; the first one decides match priority
+            limit: Maximum number of results (None for no limit)
+            capabilities: Capabilities from capabilities()
+            fulltext_rank: Ranking function for the primary full-text tier (ts_rank or ts_rank_cd)
+            plain_fallback: Add a plainto_tsquery tier for when websearch_to_tsquery finds nothing
+            highlights: Add summary_highlight/description_highlight for full-text matches
+            offset: Number of leading results to skip
+            with_total: Add a total_count column holding the number of matches of the
+                        tier that answered, counted without the limit
+            columns: Endpoint columns to return (id is always included)
+            terms: Index terms (search_terms.query_terms) for the keyword tier; used
+                   instead of the patterns when the endpoint_terms index is available
+
+        Returns:
+            Tuple of (SQL string, bound parameters); the SQL is None when there is nothing to search
+        """
+        patterns = [pattern for pattern in patterns if pattern]
+        terms = list(terms or [])
+        params: Dict[str, Any] = {"query": query}
+
+        # Each tier only needs enough candidates to fill the requested page
+        window_clause = ""
+        page_clause = ""
+        if limit is not None:
+            params["window_val"] = limit + offset
+            window_clause = "\n                LIMIT :window_val"
+            params["limit_val"] = limit
+            page_clause = "\n            LIMIT :limit_val"
+        if offset:
+            params["offset_val"] = offset
+            page_clause += "\n            OFFSET :offset_val"
+
+        ctes = []
+        tiers = []
+        # Tier name -> query counting its matches
+        counts = {}
+
+        if capabilities['fulltext']:
+            primary = 'websearch_to_tsquery' if capabilities['websearch'] else 'plainto_tsquery'
+            plain_fallback = plain_fallback and capabilities['websearch']
+            query_columns = [f"{primary}('english', :query) AS primary_query"]
+            if plain_fallback:
+                query_columns.append("plainto_tsquery('english', :query) AS plain_query")
+            ctes.append(f"search_query AS (SELECT {', '.join(query_columns)})")
+
+            matches = "endpoints e, search_query q WHERE e.search_vector @@ q.primary_query"
+            counts['fulltext'] = f"SELECT COUNT(*) FROM {matches}"
+            ctes.append(f"""fulltext AS (
+                SELECT e.id, 1 AS tier, 0 AS priority, {fulltext_rank}(e.search_vector, q.primary_query) AS rank
+                FROM {matches}
+                ORDER BY rank DESC{window_clause}
+            )""")
+            tiers.append('fulltext')
+
+            if plain_fallback:
+                matches = "endpoints e, search_query q WHERE e.search_vector @@ q.plain_query"
+                counts['plain'] = f"SELECT COUNT(*) FROM {matches}"
+                ctes.append(f"""plain AS (
+                SELECT e.id, 2 AS tier, 0 AS priority, ts_rank(e.search_vector, q.plain_query) AS rank
+                FROM {matches}
+                AND NOT EXISTS (SELECT 1 FROM fulltext)
+                ORDER BY rank DESC{window_clause}
+            )""")
+                tiers.append('plain')
+
+        guards = "".join(f"\n                AND NOT EXISTS (SELECT 1 FROM {tier})" for tier in tiers)
+        if terms and capabilities['terms']:
+            # Endpoints matching more query terms first, then by field weight scaled by
+            # term rarity; only the postings of the query terms are read
+            params["terms"] = terms
+            counts['keyword'] = "SELECT COUNT(DISTINCT endpoint_id) FROM endpoint_terms WHERE term = ANY(:terms)"
+            ctes.append("""term_stats AS (
+                SELECT term, 1.0 / ln(2 + COUNT(*)::float8) AS idf
+                FROM endpoint_terms
+                WHERE term = ANY(:terms)
+                GROUP BY term
+            )""")
+            ctes.append(f"""keyword AS (
+                SELECT t.endpoint_id AS id, 3 AS tier, -COUNT(*) AS priority, SUM(t.weight * s.idf) AS rank
+                FROM endpoint_terms t
+                JOIN term_stats s ON s.term = t.term
+                WHERE t.term = ANY(:terms){guards}
+                GROUP BY t.endpoint_id
+                ORDER BY priority, rank DESC{window_clause}
+            )""")
+            tiers.append('keyword')
+        elif patterns:
+            conditions = []
+            for i, pattern in enumerate(patterns):
+                params[f"pattern_{i}"] = f"%{pattern}%"
+                conditions.extend(f"{column} ILIKE :pattern_{i}" for column in KEYWORD_COLUMNS)
+            priority = "CASE " + " ".join(
+                f"WHEN {column} ILIKE :pattern_0 THEN {position}" for position, column in enumerate(KEYWORD_COLUMNS, 1)
+            ) + f" ELSE {len(KEYWORD_COLUMNS) + 1} END"
+            params["keywords"] = " ".join(patterns)
+
+            # Each ILIKE is served by a pg_trgm GIN index when the extension is installed
+            matches = f"endpoints WHERE ({' OR '.join(conditions)})"
+            counts['keyword'] = f"SELECT COUNT(*) FROM {matches}"
+            ctes.append(f"""keyword AS (
+                SELECT id, 3 AS tier, {priority} AS priority, {self.similarity_rank('keywords', capabilities)} AS rank
+                FROM {matches}{guards}
+                ORDER BY priority, rank DESC{window_clause}
+            )""")
+            tiers.append('keyword')
+
+        if not tiers:
+            return None, params
+
+        selected = [f"e.{column}" for column in dict.fromkeys(('id', *columns))] + ["hits.rank", "hits.tier", "hits.priority"]
+        joins = ""
+        if highlights and capabilities['fulltext']:
+            joins = "\n            CROSS JOIN search_query q"
+            for column in ('summary', 'description'):
+                selected.append(
+                    f"CASE WHEN hits.tier = 1 THEN ts_headline('english', COALESCE(e.{column}, ''), q.primary_query) END AS {column}_highlight"
+                )
+
+        hits = "\n                UNION ALL\n                ".join(f"SELECT * FROM {tier}" for tier in tiers)
+        ctes.append(f"""hits AS (
+                {hits}
+            )""")
+        page = f"""
+            SELECT {', '.join(selected)}, e.category AS sort_category, e.path AS sort_path
+            FROM hits
+            JOIN endpoints e ON e.id = hits.id{joins}
+            ORDER BY hits.tier, hits.priority, hits.rank DESC, e.category, e.path{page_clause}
+        """
+
+        if not with_total:
+            return f"WITH {', '.join(ctes)}{page}", params
+
+        # Count the tier that answered; CASE only evaluates the counts it reaches.
+        # Joining the page onto the total keeps the total when the page is empty.
+        total = " ".join(f"WHEN EXISTS (SELECT 1 FROM {tier}) THEN ({counts[tier]})" for tier in tiers)
+        ctes.append(f"total AS (SELECT CASE {total} ELSE 0 END AS total_count)")
+        ctes.append(f"page AS ({page})")
+        sql = f"""
+            WITH {', '.join(ctes)}
+            SELECT page.*, total.total_count
+            FROM total
+            LEFT JOIN page ON true
+            ORDER BY page.tier, page.priority, page.rank DESC, page.sort_category, page.sort_path
+        """
+        return sql, params
+
+    def _run(self, query: str, patterns: Iterable[str], limit: Optional[int], generation: Any, options: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int]:
+        sql, params = self.build(query, patterns, limit, self.capabilities(generation), **options)
+        if sql is None:
+            return [], 0
+
+        with self.session_factory() as session:
+            result = session.execute(text(sql), params)
+            results = []
+            total = 0
+            for row in result.fetchall():
+                endpoint = dict(row._mapping)
+                total = endpoint.pop('total_count', 0) or 0
+                if endpoint['id'] is None:
+                    # Empty page joined onto the total
+                    continue
+                for key in ('tier', 'priority', 'sort_category', 'sort_path'):
+                    del endpoint[key]
+                # Highlights only exist for full-text matches
+                for key in ('summary_highlight', 'description_highlight'):
+                    if key in endpoint and endpoint[key] is None:
+                        del endpoint[key]
+                results.append(endpoint)
+            return results, total
+
+    def search(
+        self,
+        query: str,
+        patterns: Iterable[str],
+        limit: Optional[int] = None,
+        generation: Any = None,
+        **options
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a search in one round trip.
+
+        Args:
+            query: Text for the full-text tiers
+            patterns: Substrings for the keyword tier
+            limit: Maximum number of results (None for no limit)
+            generation: Current catalog build generation (re-detects capabilities on change)
+            **options: fulltext_rank, plain_fallback, highlights, offset, columns and terms (see build())
+
+        Returns:
+            List of matching endpoints ordered by tier and relevance
+        """
+        return self._run(query, patterns, limit, generation, options)[0]
+
+    def search_page(
+        self,
+        query: str,
+        patterns: Iterable[str],
+        limit: int,
+        offset: int = 0,
+        generation: Any = None,
+        **options
+    ) -> Dict[str, Any]:
+        """
+        Run a search for one page of results plus the total number of matches, in one round trip.
+
+        Args:
+            query: Text for the full-text tiers
+            patterns: Substrings for the keyword tier
+            limit: Page size
+            offset: Number of leading results to skip
+            generation: Current catalog build generation (re-detects capabilities on change)
+            **options: fulltext_rank, plain_fallback, highlights, columns and terms (see build())
+
+        Returns:
+            Dictionary with the page's items and the total match count
+        """
+        items, total = self._run(query, patterns, limit, generation, dict(options, offset=offset, with_total=True))
+        return {'items': items, 'total': total}
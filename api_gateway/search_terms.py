@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Search Terms Module
+
+This module tokenizes endpoint metadata and search queries into the terms stored in the
+endpoint_terms inverted index. The ingest (json_to_postgres.py) indexes every endpoint
+with endpoint_terms(); the gateway tokenizes queries with query_terms() and joins them
+against the index, so the same rules apply on both sides:
+
+- camelCase and PascalCase words are split (companyTypeAssociations -> company, type,
+  associations); short compounds are kept whole as well
+- path segments are split on '/', and {parameter} placeholders are dropped
+- terms are lowercased, stopwords and words shorter than three characters are dropped,
+  and plurals are folded to their singular (tickets -> ticket, companies -> company)
+
+This module is imported by json_to_postgres.py, which runs as a standalone script, so it
+must not import anything from the api_gateway package.
+"""
+
+import re
+from typing import Dict, List, Iterable
+
+# Weight of a term by the field it appears in; a term found in several fields gets the sum
+FIELD_WEIGHTS = {
+    'summary': 3.0,
+    'path': 3.0,
+    'tags': 2.0,
+    'operation_id': 2.0,
+    'description': 1.0
+}
+
+STOPWORDS = {
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'with', 'by',
+    'about', 'like', 'from', 'of', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'can',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they', 'this', 'that', 'these', 'those',
+    'get', 'find', 'show', 'list', 'give', 'me', 'all', 'some', 'any', 'how', 'what', 'when', 'where', 'why'
+}
+
+MIN_TERM_LENGTH = 3
+MAX_COMPOUND_PARTS = 3
+
+_WORD = re.compile(r'[A-Za-z0-9]+')
+_CAMEL_BOUNDARY = re.compile(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+_PLACEHOLDER = re.compile(r'\{[^}]*\}')
+
+def stem(word: str) -> str:
+    """Fold a lowercase word to its singular form."""
+    if len(word) > 4 and word.endswith('ies'):
+        return word[:-3] + 'y'
+    if len(word) > 4 and word.endswith(('sses', 'xes', 'ches', 'shes')):
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        return word[:-1]
+    return word
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms, in order of appearance (duplicates kept).
+
+    Args:
+        text: Free text, an identifier such as an operationId, or a path
+
+    Returns:
+        Lowercased, stemmed terms without stopwords or short words
+    """
+    terms = []
+    for word in _WORD.findall(_PLACEHOLDER.sub(' ', text or '')):
+        parts = _CAMEL_BOUNDARY.split(word)
+        # Keep short compounds whole too (e.g. path segments), but not long operationIds
+        candidates = parts + [word] if 1 < len(parts) <= MAX_COMPOUND_PARTS else parts
+        for candidate in candidates:
+            candidate = candidate.lower()
+            if len(candidate) >= MIN_TERM_LENGTH and candidate not in STOPWORDS:
+                terms.append(stem(candidate))
+    return terms
+
+def endpoint_terms(path: str, summary: str, description: str, operation_id: str, tags: Iterable[str]) -> Dict[str, float]:
+    """
+    Build the weighted terms of an endpoint for the inverted index.
+
+    Args:
+        path: Path template, e.g. /company/companies/{id}/contacts
+        summary: Operation summary
+        description: Operation description
+        operation_id: Operation id, e.g. getCompanyCompaniesByIdContacts
+        tags: Operation tags
+
+    Returns:
+        Dictionary of term -> weight
+    """
+    fields = {
+        'summary': summary,
+        'path': ' '.join(segment for segment in path.split('/') if segment),
+        'tags': ' '.join(tags or []),
+        'operation_id': operation_id,
+        'description': description
+    }
+
+    weights: Dict[str, float] = {}
+    for field, value in fields.items():
+        for term in set(tokenize(value)):
+            weights[term] = weights.get(term, 0.0) + FIELD_WEIGHTS[field]
+    return weights
+
+def query_terms(query: str) -> List[str]:
+    """Tokenize a search query into distinct index terms, in order of appearance."""
+    return list(dict.fromkeys(tokenize(query)))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Semantic Search Module
+
+This module provides an offline vector index for natural language endpoint search. At
+build time (json_to_postgres.py) every endpoint becomes a TF-IDF vector over the terms
+and adjacent term pairs of its summary, description, tags, camelCase-split operationId
+and path. The TF-IDF matrix is reduced with latent semantic analysis (a truncated SVD),
+which places endpoints whose words tend to co-occur close together even when they do
+not share the query's exact words. The reduced, L2-normalized matrix is stored as a
+compact float32 array in the semantic_indexes table.
+
+A query is tokenized the same way, expanded with a few domain synonyms (bill -> invoice,
+customer -> company, hours -> time entry, ...), projected into the reduced space and
+scored against every endpoint with one matrix-vector product. No network or GPU is
+needed.
+
+Tokens are passed in already tokenized (see search_terms.py), so this module can be
+imported by json_to_postgres.py, which runs as a standalone script, and must not import
+anything from the api_gateway package. NumPy is optional; without it the index is not
+built and searches fall back to full-text search.
+
+Environment Variables:
+    SEMANTIC_SEARCH_ENABLED - Use the semantic index when it is available (default: true)
+    SEMANTIC_DIMENSIONS - Dimensions kept by the truncated SVD (default: 256)
+    SEMANTIC_MAX_FEATURES - Maximum vocabulary size, most frequent terms first (default: 4096)
+    SEMANTIC_MIN_SCORE - Minimum cosine similarity for a result (default: 0.15)
+"""
+
+import io
+import os
+import math
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Expansions for query words that rarely appear in the ConnectWise API documentation.
+# Keys and values are search_terms tokens (lowercase, singular).
+SYNONYMS = {
+    'bill': ('invoice',),
+    'billing': ('invoice',),
+    'customer': ('company',),
+    'client': ('company',),
+    'account': ('company',),
+    'hour': ('time', 'entry'),
+    'timesheet': ('time', 'sheet'),
+    'employee': ('member',),
+    'user': ('member',),
+    'staff': ('member',),
+    'technician': ('member',),
+    'issue': ('ticket',),
+    'incident': ('ticket',),
+    'device': ('configuration',),
+    'asset': ('configuration',),
+    'deal': ('opportunity',),
+    'contract': ('agreement',),
+    'person': ('contact',),
+    'people': ('contact',)
+}
+
+def get_semantic_config() -> dict:
+    """Get semantic search configuration from environment variables or defaults"""
+    return {
+        'enabled': os.getenv('SEMANTIC_SEARCH_ENABLED', 'true').lower() == 'true',
+        'dimensions': int(os.getenv('SEMANTIC_DIMENSIONS', 256)),
+        'max_features': int(os.getenv('SEMANTIC_MAX_FEATURES', 4096)),
+        'min_score': float(os.getenv('SEMANTIC_MIN_SCORE', 0.15))
+    }
+
+def numpy_available() -> bool:
+    """Check if the optional 'numpy' package required for semantic search is installed."""
+    return np is not None
+
+def features(tokens: List[str]) -> List[str]:
+    """Get the index features of a token sequence: the tokens and adjacent token pairs."""
+    return tokens + [f"{first}_{second}" for first, second in zip(tokens, tokens[1:])]
+
+def expand_query(tokens: List[str]) -> List[str]:
+    """
+    Get the features of a query with the synonyms of its tokens added.
+
+    Each synonym contributes only its own features (a multi-word synonym keeps its inner
+    pair), never pairs with the query tokens around it, so no bigram forms across the
+    boundary between the query and its expansions.
+    """
+    expanded = features(tokens)
+    for token in tokens:
+        expanded.extend(features(list(SYNONYMS.get(token, ()))))
+    return expanded
+
+def _truncated_svd(matrix, dimensions: int, seed: int = 0):
+    """
+    Compute the top right singular vectors of a matrix with a randomized SVD.
+
+    Args:
+        matrix: Documents x features float32 array
+        dimensions: Number of singular vectors to keep
+
+    Returns:
+        Features x dimensions float32 projection
+    """
+    rng = np.random.default_rng(seed)
+    sample = min(dimensions + 10, min(matrix.shape))
+    basis = matrix @ rng.standard_normal((matrix.shape[1], sample)).astype(np.float32)
+    # Power iterations sharpen the spectrum so the sampled basis captures the top components
+    for _ in range(2):
+        basis, _ = np.linalg.qr(basis)
+        basis = matrix @ (matrix.T @ basis)
+    basis, _ = np.linalg.qr(basis)
+    _, _, vt = np.linalg.svd(basis.T @ matrix, full_matrices=False)
+    return np.ascontiguousarray(vt[:dimensions].T, dtype=np.float32)
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+class SemanticIndex:
+    """LSA-reduced TF-IDF vectors of every endpoint."""
+
+    def __init__(self, vocabulary: List[str], idf, projection, matrix, endpoint_ids):
+        """
+        Initialize the index from its arrays.
+
+        Args:
+            vocabulary: Feature names in column order
+            idf: Inverse document frequency per feature (float32)
+            projection: Features x dimensions LSA projection (float32)
+            matrix: Endpoints x dimensions L2-normalized endpoint vectors (float32)
+            endpoint_ids: Endpoint id per matrix row (int64)
+        """
+        self.vocabulary = {feature: column for column, feature in enumerate(vocabulary)}
+        self.idf = idf
+        self.projection = projection
+        self.matrix = matrix
+        self.endpoint_ids = endpoint_ids
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[Tuple[int, List[str]]],
+        dimensions: int = 256,
+        max_features: int = 4096
+    ) -> 'SemanticIndex':
+        """
+        Build the index.
+
+        Args:
+            documents: (endpoint id, tokens) pairs
+            dimensions: Dimensions kept by the truncated SVD
+            max_features: Maximum vocabulary size
+
+        Returns:
+            The built index
+        """
+        documents = [(endpoint_id, features(tokens)) for endpoint_id, tokens in documents]
+
+        # Keep features shared by at least two endpoints, most common first
+        document_frequency: Dict[str, int] = {}
+        for _, document in documents:
+            for feature in set(document):
+                document_frequency[feature] = document_frequency.get(feature, 0) + 1
+        vocabulary = sorted(
+            (feature for feature, count in document_frequency.items() if count > 1 or len(documents) < 3),
+            key=lambda feature: (-document_frequency[feature], feature)
+        )[:max_features]
+        columns = {feature: column for column, feature in enumerate(vocabulary)}
+
+        count = len(documents)
+        idf = np.array(
+            [math.log((1 + count) / (1 + document_frequency[feature])) + 1 for feature in vocabulary],
+            dtype=np.float32
+        )
+
+        # Sublinear term frequency times idf, L2-normalized per endpoint
+        tfidf = np.zeros((count, len(vocabulary)), dtype=np.float32)
+        for row, (_, document) in enumerate(documents):
+            for feature in document:
+                column = columns.get(feature)
+                if column is not None:
+                    tfidf[row, column] += 1
+        np.log1p(tfidf, out=tfidf)
+        tfidf *= idf
+        tfidf = _normalize_rows(tfidf)
+
+        dimensions = max(1, min(dimensions, count, len(vocabulary)))
+        projection = _truncated_svd(tfidf, dimensions) if len(vocabulary) else np.zeros((0, 1), dtype=np.float32)
+        matrix = _normalize_rows(tfidf @ projection).astype(np.float32)
+        endpoint_ids = np.array([endpoint_id for endpoint_id, _ in documents], dtype=np.int64)
+        return cls(vocabulary, idf, projection, matrix, endpoint_ids)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the index for the semantic_indexes table."""
+        vocabulary = sorted(self.vocabulary, key=self.vocabulary.get)
+        buffer = io.BytesIO()
+        np.savez(
+            buffer,
+            vocabulary=np.array(vocabulary, dtype=str),
+            idf=self.idf,
+            projection=self.projection,
+            matrix=self.matrix,
+            endpoint_ids=self.endpoint_ids
+        )
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'SemanticIndex':
+        """Load an index serialized with to_bytes()."""
+        with np.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            return cls(
+                arrays['vocabulary'].tolist(),
+                arrays['idf'],
+                arrays['projection'],
+                arrays['matrix'],
+                arrays['endpoint_ids']
+            )
+
+    def search(self, tokens: List[str], limit: int, min_score: float = 0.0) -> List[Tuple[int, float]]:
+        """
+        Find the endpoints closest to a query.
+
+        Args:
+            tokens: Query tokens (search_terms.tokenize), before synonym expansion
+            limit: Maximum number of results
+            min_score: Minimum cosine similarity
+
+        Returns:
+            List of (endpoint id, score) pairs, best first
+        """
+        weights: Dict[int, float] = {}
+        for feature in expand_query(tokens):
+            column = self.vocabulary.get(feature)
+            if column is not None:
+                weights[column] = weights.get(column, 0.0) + 1.0
+        if not weights or limit <= 0:
+            return []
+
+        columns = np.fromiter(weights, dtype=np.int64)
+        values = np.log1p(np.fromiter(weights.values(), dtype=np.float32)) * self.idf[columns]
+        query = values @ self.projection[columns]
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        scores = self.matrix @ (query / norm)
+        limit = min(limit, len(scores))
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.endpoint_ids[row]), float(scores[row])) for row in top if scores[row] >= min_score]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get index metrics."""
+        return {
+            'endpoints': int(self.matrix.shape[0]),
+            'dimensions': int(self.matrix.shape[1]),
+            'features': len(self.vocabulary),
+            'bytes': int(self.matrix.nbytes + self.projection.nbytes + self.idf.nbytes)
+        }
@@ -18,11 +18,25 @@ import httpx
 import asyncio
 import base64
 import logging
-from typing import Dict, List, Optional, Any, Union
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Any, Union, Tuple
 from pydantic import BaseModel
 from mcp.server.fastmcp import FastMCP
-from api_gateway.api_db_utils import APIDatabase
+from api_gateway.api_db_utils import APIDatabase, SEARCH_MODES
 from api_gateway.cached_queries_db import CachedQueriesDB
+from api_gateway.http_client import HTTPClientManager
+from api_gateway.db_executor import DatabaseExecutor, AsyncDatabase, db_engine_kwargs
+from api_gateway.response_cache import ResponseCache, request_fingerprint
+from api_gateway.single_flight import SingleFlight
+from api_gateway.pagination import Paginator
+from api_gateway.streaming_json import PartialList, read_json_items
+from api_gateway.field_projection import (
+    normalize_fields, get_success_response_schema, validate_fields, available_fields, needs_projection, project
+)
+from api_gateway.rate_limiter import AdaptiveRateLimiter, THROTTLE_STATUS_CODES, parse_retry_after
+from api_gateway.resilience import (
+    RetryPolicy, RetryBudget, CircuitBreakerRegistry, CircuitOpenError, RETRYABLE_STATUS_CODES
+)
 
 # Set up logging
 log_dir = os.path.dirname(os.path.abspath(__file__))
@@ -37,8 +51,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger("api_gateway")
 
+# Shared pooled HTTP clients for all outbound ConnectWise requests
+http_clients = HTTPClientManager()
+
+# Thread pool running the synchronous database calls off the event loop
+db_executor = DatabaseExecutor()
+
+# In-memory cache of GET responses, invalidated by writes sent through the gateway
+response_cache = ResponseCache()
+
+# Coalesces identical in-flight GET requests into one upstream call
+request_coalescer = SingleFlight()
+
+# Process-wide pacing of outbound requests, adapting to 429/503 responses
+rate_limiter = AdaptiveRateLimiter()
+
+# Retries for idempotent requests and per-host circuit breaking
+retry_policy = RetryPolicy()
+retry_budget = RetryBudget()
+circuit_breakers = CircuitBreakerRegistry()
+
+SUPPORTED_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+# Number of list items shown by execute_api_call
+DISPLAY_ITEM_LIMIT = 10
+
+@asynccontextmanager
+async def gateway_lifespan(server):
+    """Start shared resources when the MCP server starts and release them on shutdown"""
+    await http_clients.startup(API_URL)
+    try:
+        yield
+    finally:
+        await http_clients.shutdown()
+        db_executor.shutdown(wait=False)
+
 # Initialize FastMCP server
-mcp = FastMCP("api_gateway")
+mcp = FastMCP("api_gateway", lifespan=gateway_lifespan)
 
 # Global variables
 API_URL = None  # Will be set from environment
@@ -131,7 +180,11 @@ def initialize_database():
 
     # Connect to the PostgreSQL database
     try:
-        api_db = APIDatabase(API_DATABASE_URL)
+        api_db = AsyncDatabase(
+            APIDatabase(API_DATABASE_URL, **db_engine_kwargs()),
+            db_executor,
+            inline=('format_endpoint_for_display', 'catalog_stats')
+        )
         logger.info("Connected to API PostgreSQL database.")
         return True
     except Exception as e:
@@ -153,7 +206,7 @@ def initialize_cached_queries():
 
     print(CACHED_QUERIES_DATABASE_URL)
     try:
-        cached_queries_db = CachedQueriesDB(CACHED_QUERIES_DATABASE_URL)
+        cached_queries_db = AsyncDatabase(CachedQueriesDB(CACHED_QUERIES_DATABASE_URL, **db_engine_kwargs()), db_executor)
         logger.info("Connected to cached queries PostgreSQL database.")
         return True
     except Exception as e:
@@ -186,10 +239,75 @@ async def make_api_request(
     endpoint: str,
     params: Optional[Dict[str, Any]] = None,
     data: Optional[Dict[str, Any]] = None,
-    headers: Optional[Dict[str, str]] = None
+    headers: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+    max_items: Optional[int] = None,
+    count_total: bool = False
 ) -> Dict[str, Any]:
     """
     Make a request to the ConnectWise Manage API
+
+    GET responses are served from and stored in the response cache unless use_cache
+    is False, and identical concurrent GETs are coalesced into a single upstream call.
+    Successful writes invalidate cached entries for the affected resource.
+
+    When max_items is set, a GET response body larger than STREAMING_FULL_READ_BYTES is
+    parsed as a stream and reading stops once max_items array elements have been decoded
+    (or continues only to count them when count_total is True). Truncated arrays are
+    returned as a PartialList and are not cached; smaller bodies are read in full, so
+    they are cached and their connection is reused.
+    """
+    if method.upper() != "GET":
+        result, _ = await _send_request(method, endpoint, params, data, headers)
+        response_cache.invalidate(endpoint)
+        return result
+
+    # Requests with custom headers may see different data, so they are never shared
+    shareable = headers is None
+    if shareable and use_cache:
+        cached = response_cache.get(endpoint, params)
+        if cached is not None:
+            logger.info(f"Serving GET {endpoint} from response cache")
+            return cached
+
+    # A write invalidating the path while this GET is in flight makes the result stale
+    version = response_cache.version(endpoint)
+
+    async def fetch() -> Any:
+        result, size = await _send_request(method, endpoint, params, data, headers, max_items, count_total)
+        if shareable and not isinstance(result, PartialList):
+            response_cache.set(endpoint, params, result, size, version=version)
+        return result
+
+    if not shareable:
+        return await fetch()
+
+    key = request_fingerprint(method, endpoint, params)
+    if max_items is not None:
+        key += f"#items={max_items},count={count_total}"
+    return await request_coalescer.do(key, fetch)
+
+async def _send_request(
+    method: str,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    max_items: Optional[int] = None,
+    count_total: bool = False
+) -> Tuple[Any, int]:
+    """
+    Send a single request to the ConnectWise Manage API over the shared HTTP client
+
+    Requests are paced by the adaptive rate limiter. A 429 response lowers the rate,
+    honors Retry-After and is resent up to RATE_LIMIT_MAX_THROTTLE_RETRIES times; a
+    Retry-After longer than RATE_LIMIT_MAX_RETRY_AFTER fails the request instead.
+    Idempotent requests are retried with jittered backoff after timeouts, connection
+    errors and transient 5xx responses, within the retry budget. A per-host circuit
+    breaker fails fast while ConnectWise is degraded.
+
+    Returns:
+        Tuple of the parsed response body and the raw body size in bytes
     """
     if not API_URL:
         if not setup_config():
@@ -205,43 +323,216 @@ async def make_api_request(
     if data:
         logger.info(f"Data: {json.dumps(data)}")
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=data)
-            elif method.upper() == "PUT":
-                response = await client.put(url, headers=headers, json=data)
-            elif method.upper() == "PATCH":
-                response = await client.patch(url, headers=headers, json=data)
-            elif method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers)
-            else:
-                raise APIError(f"Unsupported HTTP method: {method}")
-            
+    if method.upper() not in SUPPORTED_METHODS:
+        raise APIError(f"Unsupported HTTP method: {method}")
+
+    client = await http_clients.get_client(API_URL)
+    stream = max_items is not None and method.upper() == "GET"
+    breaker = circuit_breakers.get(httpx.URL(url).host)
+    max_throttle_retries = rate_limiter.config['max_throttle_retries']
+    retry_budget.record_request()
+    try:
+        attempt = 0
+        throttle_retries = 0
+        while True:
+            await rate_limiter.acquire()
+            try:
+                breaker.before_request()
+            except CircuitOpenError as e:
+                logger.error(str(e))
+                raise APIError(str(e), status_code=503)
+
+            attempt += 1
+            try:
+                response = await _dispatch_request(client, method, url, headers, params, data, stream=stream)
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if await _wait_for_retry(method, attempt, None, type(e).__name__):
+                    continue
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+
             logger.info(f"Response status: {response.status_code}")
-            
-            response.raise_for_status()
-            return response.json() if response.content else {}
-            
-        except httpx.HTTPStatusError as e:
-            error_message = f"HTTP error {e.response.status_code}: {e.response.text}"
-            logger.error(error_message)
-            raise APIError(error_message, status_code=e.response.status_code, response=e.response)
-        except httpx.TimeoutException:
-            logger.error("Request timed out. ConnectWise API may be slow to respond.")
-            raise APIError("Request timed out. ConnectWise API may be slow to respond.")
-        except httpx.RequestError as e:
-            logger.error(f"API request error: {str(e)}")
-            raise APIError(f"API request failed: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unknown error: {str(e)}")
-            raise APIError(f"Unknown error: {str(e)}")
+
+            retry_after = None
+            if response.status_code in THROTTLE_STATUS_CODES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                max_retry_after = rate_limiter.config['max_retry_after']
+                if retry_after is not None and retry_after > max_retry_after:
+                    # Neither this request nor the rest of the gateway waits that long
+                    rate_limiter.on_throttle()
+                    if response.status_code in RETRYABLE_STATUS_CODES:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                    await response.aclose()
+                    message = (
+                        f"ConnectWise asked to retry after {retry_after:.0f}s, longer than "
+                        f"RATE_LIMIT_MAX_RETRY_AFTER ({max_retry_after:.0f}s). Try again later."
+                    )
+                    logger.error(message)
+                    raise APIError(message, status_code=response.status_code)
+                rate_limiter.on_throttle(retry_after)
+
+            if response.status_code in RETRYABLE_STATUS_CODES:
+                breaker.record_failure()
+                if await _wait_for_retry(method, attempt, response.status_code, f"HTTP {response.status_code}", retry_after or 0):
+                    await response.aclose()
+                    continue
+                break
+
+            breaker.record_success()
+            # A 429 means the request was rejected before processing, so it is safe to resend
+            if response.status_code == 429 and throttle_retries < max_throttle_retries:
+                throttle_retries += 1
+                attempt -= 1
+                logger.warning(f"Rate limited by ConnectWise, retrying ({throttle_retries}/{max_throttle_retries})")
+                await response.aclose()
+                continue
+
+            if response.is_success:
+                rate_limiter.on_success()
+            break
+
+        if stream:
+            try:
+                if response.is_success:
+                    body_size = 0
+
+                    async def counted_chunks():
+                        nonlocal body_size
+                        async for chunk in response.aiter_bytes():
+                            body_size += len(chunk)
+                            yield chunk
+
+                    result = await read_json_items(counted_chunks(), max_items, count_total)
+                    return result, body_size
+                # Error bodies are small; read them so the error message can include them
+                await response.aread()
+            finally:
+                await response.aclose()
+
+        response.raise_for_status()
+        return (response.json() if response.content else {}), len(response.content)
+
+    except APIError:
+        raise
+    except httpx.HTTPStatusError as e:
+        error_message = f"HTTP error {e.response.status_code}: {e.response.text}"
+        logger.error(error_message)
+        raise APIError(error_message, status_code=e.response.status_code, response=e.response)
+    except httpx.TimeoutException:
+        logger.error("Request timed out. ConnectWise API may be slow to respond.")
+        raise APIError("Request timed out. ConnectWise API may be slow to respond.")
+    except httpx.RequestError as e:
+        logger.error(f"API request error: {str(e)}")
+        raise APIError(f"API request failed: {str(e)}")
+    except Exception as e:
+        logger.error(f"Unknown error: {str(e)}")
+        raise APIError(f"Unknown error: {str(e)}")
+
+async def _wait_for_retry(method: str, attempt: int, status_code: Optional[int], reason: str, min_delay: float = 0) -> bool:
+    """Sleep before retrying a failed attempt if the retry policy and budget allow it"""
+    if not retry_policy.is_retryable(method, attempt, status_code):
+        return False
+    if not retry_budget.try_spend():
+        logger.warning(f"Retry budget exhausted; not retrying {method.upper()} after {reason}")
+        return False
+
+    delay = max(min_delay, retry_policy.backoff(attempt))
+    logger.warning(
+        f"Retrying {method.upper()} after {reason} in {delay:.2f}s "
+        f"(attempt {attempt + 1}/{retry_policy.config['max_attempts']})"
+    )
+    await asyncio.sleep(delay)
+    return True
+
+async def _dispatch_request(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    headers: Dict[str, str],
+    params: Optional[Dict[str, Any]] = None,
+    data: Optional[Dict[str, Any]] = None,
+    stream: bool = False
+) -> httpx.Response:
+    """Send one HTTP request with the verb-specific httpx call"""
+    if stream:
+        # The body is left unread so the caller can consume it incrementally
+        request = client.build_request(method.upper(), url, headers=headers, params=params)
+        return await client.send(request, stream=True)
+    if method.upper() == "GET":
+        return await client.get(url, headers=headers, params=params)
+    elif method.upper() == "POST":
+        return await client.post(url, headers=headers, json=data)
+    elif method.upper() == "PUT":
+        return await client.put(url, headers=headers, json=data)
+    elif method.upper() == "PATCH":
+        return await client.patch(url, headers=headers, json=data)
+    elif method.upper() == "DELETE":
+        return await client.delete(url, headers=headers)
+    else:
+        raise APIError(f"Unsupported HTTP method: {method}")
+
+# Response Formatting Helpers
+
+def format_api_result(result: Any) -> str:
+    """Format an API result for display, truncating long lists to the first DISPLAY_ITEM_LIMIT items"""
+    if isinstance(result, PartialList) and result.total_count is None:
+        formatted_data = json.dumps(result[:DISPLAY_ITEM_LIMIT], indent=2)
+        return (
+            f"Showing first {min(len(result), DISPLAY_ITEM_LIMIT)} items:\n\n{formatted_data}\n\n"
+            f"(Response truncated. More items are available; use count_total to count them, "
+            f"or paginate/fields to retrieve them.)"
+        )
+
+    if isinstance(result, list):
+        total = result.total_count if isinstance(result, PartialList) else len(result)
+        if total > DISPLAY_ITEM_LIMIT:
+            summary = f"Retrieved {total} items. Showing first {DISPLAY_ITEM_LIMIT}:"
+            formatted_data = json.dumps(result[:DISPLAY_ITEM_LIMIT], indent=2)
+            return f"{summary}\n\n{formatted_data}\n\n(Response truncated. Full response contained {total} items.)"
+    return json.dumps(result, indent=2)
+
+async def fetch_all_pages(
+    path: str,
+    params: Optional[Dict[str, Any]],
+    max_items: int,
+    style: str = "page",
+    use_cache: bool = True,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    Fetch every page of a list endpoint and format the items for display.
+
+    Items are serialized as they stream in (one compact JSON record per line) so the full
+    collection is never held as a single list of parsed records.
+    """
+    if style not in ("page", "pageId"):
+        raise APIError(f"Unsupported pagination style: {style}. Use 'page' or 'pageId'.")
+
+    async def fetch_page(page_path: str, page_params: Dict[str, Any]) -> Any:
+        return await make_api_request("GET", page_path, page_params, use_cache=use_cache)
+
+    paginator = Paginator(fetch_page)
+    lines = []
+    async for item in paginator.iter_items(path, params, max_items=max(1, max_items), style=style):
+        if fields and needs_projection(item, fields):
+            item = project(item, fields)
+        lines.append(json.dumps(item, separators=(',', ':')))
+
+    summary = f"Retrieved {len(lines)} items across {paginator.pages_fetched} page(s)"
+    if paginator.truncated and paginator.total is not None:
+        summary += f" (stopped at max_items={max_items} of {paginator.total} items)"
+    elif paginator.truncated:
+        summary += f" (stopped at max_items={max_items}; more items may be available)"
+    return f"{summary}:\n\n[\n" + ",\n".join(lines) + "\n]"
 
 # cached queries Helper Functions
 
-def check_cached_queries(path: str, method: str) -> Optional[Dict[str, Any]]:
+async def check_cached_queries(path: str, method: str) -> Optional[Dict[str, Any]]:
     """
     Check if a query exists in cached queries.
     
@@ -255,16 +546,16 @@ def check_cached_queries(path: str, method: str) -> Optional[Dict[str, Any]]:
     global cached_queries_db, current_query_from_cached_queries
     
     if not cached_queries_db:
-        if not initialize_cached_queries():
+        if not await db_executor.run(initialize_cached_queries):
             logger.error("Failed to initialize cached queries database.")
             return None
     
-    query = cached_queries_db.find_query(path, method)
+    query = await cached_queries_db.find_query(path, method)
     if query:
         # Mark that this query came from cached queries
         current_query_from_cached_queries = True
         # Increment usage count
-        cached_queries_db.increment_usage(query['id'])
+        await cached_queries_db.increment_usage(query['id'])
         logger.info(f"Found query in cached queries: {path} {method}")
         return query
     
@@ -275,26 +566,33 @@ def check_cached_queries(path: str, method: str) -> Optional[Dict[str, Any]]:
 # MCP Tool Implementations
 
 @mcp.tool()
-async def search_api_endpoints(query: str, max_results: int = 10) -> str:
+async def search_api_endpoints(query: str, max_results: int = 10, offset: int = 0) -> str:
     """
     Search for available API endpoints based on a query.
     
     Args:
         query: Search string to find matching endpoints
         max_results: Maximum number of results to return
+        offset: Number of results to skip (for paging through more results)
     """
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
     
+    max_results = max(1, max_results)
+    offset = max(0, offset)
     try:
-        results = api_db.search_endpoints(query)
+        page = await api_db.search_endpoints_page(query, max_results, offset)
+        results = page['items']
+        total = page['total']
         
         if not results:
+            if total:
+                return f"No more results: the query matched {total} endpoints."
             return "No API endpoints found matching your query."
         
         formatted_results = []
-        for i, endpoint in enumerate(results[:max_results], 1):
+        for i, endpoint in enumerate(results, offset + 1):
             method = endpoint.get('method', '').upper()
             path = endpoint.get('path', '')
             description = endpoint.get('description', 'No description available')
@@ -304,8 +602,11 @@ async def search_api_endpoints(query: str, max_results: int = 10) -> str:
         response = "Found the following API endpoints:\n\n"
         response += "\n\n".join(formatted_results)
         
-        if len(results) > max_results:
-            response += f"\n\nShowing {max_results} of {len(results)} results. Refine your search for more specific results."
+        if total > offset + len(results):
+            response += (
+                f"\n\nShowing {offset + 1}-{offset + len(results)} of {total} results. "
+                f"Use offset={offset + len(results)} for more, or refine your search for more specific results."
+            )
         
         return response
     
@@ -323,11 +624,11 @@ async def get_api_endpoint_details(path: str, method: str = "GET") -> str:
         method: HTTP method (GET, POST, PUT, PATCH, DELETE)
     """
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
     
     try:
-        endpoint = api_db.find_endpoint_by_path_method(path, method)
+        endpoint = await api_db.find_endpoint_by_path_method(path, method)
         
         if not endpoint:
             return f"No API endpoint found for {method} {path}."
@@ -343,7 +644,13 @@ async def execute_api_call(
     path: str,
     method: str = "GET",
     params: Optional[Dict[str, Any]] = None,
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None,
+    bypass_cache: bool = False,
+    paginate: bool = False,
+    max_items: int = 1000,
+    pagination_style: str = "page",
+    fields: Optional[List[str]] = None,
+    count_total: bool = False
 ) -> str:
     """
     Execute an API call to the ConnectWise API.
@@ -353,15 +660,23 @@ async def execute_api_call(
         method: HTTP method (GET, POST, PUT, PATCH, DELETE)
         params: Query parameters for the request
         data: Request body data (for POST, PUT, PATCH)
+        bypass_cache: Fetch fresh data instead of a recently cached GET response
+        paginate: For GET list endpoints, fetch every page and return all items (up to max_items)
+        max_items: Maximum number of items returned when paginate is True
+        pagination_style: "page" for page/pageSize paging or "pageId" for forward-only paging
+        fields: For GET, only return these fields (e.g. ["id", "summary", "board/name"]);
+                sent upstream as the ConnectWise 'fields' parameter
+        count_total: For large GET list responses, count every item instead of stopping
+                     once the displayed items have been read
     """
     global current_query_from_cached_queries
     
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
     
     # Check cached queries first
-    cached_queries_entry = check_cached_queries(path, method)
+    cached_queries_entry = await check_cached_queries(path, method)
     if cached_queries_entry:
         # If parameters are not provided, use the ones from cached queries
         if params is None and 'params' in cached_queries_entry and cached_queries_entry['params']:
@@ -375,29 +690,46 @@ async def execute_api_call(
     
     try:
         # Verify the endpoint exists in our database
-        endpoint = api_db.find_endpoint_by_path_method(path, method)
+        endpoint = await api_db.find_endpoint_by_path_method(path, method)
         if not endpoint:
             return f"Warning: No documented API endpoint found for {method} {path}. Proceeding with caution."
         
+        # Validate the requested field projection against the stored response schema
+        field_list = normalize_fields(fields if fields is not None else (params or {}).get('fields'))
+        if field_list and method.upper() == "GET":
+            response_schema = get_success_response_schema(endpoint)
+            field_list, invalid_fields = validate_fields(response_schema, field_list)
+            if invalid_fields:
+                known_fields = available_fields(response_schema)
+                error = f"Error: Unknown field(s) for {method.upper()} {path}: {', '.join(invalid_fields)}."
+                if known_fields:
+                    error += f"\nAvailable fields: {', '.join(known_fields)}"
+                return error
+            params = {**(params or {}), 'fields': ','.join(field_list)}
+        else:
+            field_list = []
+
         # Execute the API call
-        result = await make_api_request(method, path, params, data)
-        
-        # Format the response
-        response = ""
-        if isinstance(result, list):
-            if len(result) > 10:
-                summary = f"Retrieved {len(result)} items. Showing first 10:"
-                formatted_data = json.dumps(result[:10], indent=2)
-                response = f"{summary}\n\n{formatted_data}\n\n(Response truncated. Full response contained {len(result)} items.)"
-            else:
-                response = json.dumps(result, indent=2)
+        if paginate and method.upper() == "GET":
+            response = await fetch_all_pages(path, params, max_items, pagination_style, use_cache=not bypass_cache, fields=field_list)
         else:
-            response = json.dumps(result, indent=2)
+            # Only the displayed items of a GET list are parsed; the rest of the body is skipped
+            result = await make_api_request(
+                method, path, params, data,
+                use_cache=not bypass_cache,
+                max_items=DISPLAY_ITEM_LIMIT if method.upper() == "GET" else None,
+                count_total=count_total
+            )
+            # Apply the projection locally if the upstream ignored the fields parameter
+            if field_list and needs_projection(result, field_list):
+                projected = project(result, field_list)
+                result = PartialList(projected, result.total_count) if isinstance(result, PartialList) else projected
+            response = format_api_result(result)
         
         # If the query was successful and not from cached memory, auto-save it
         if not current_query_from_cached_queries:
             if not cached_queries_db:
-                if not initialize_cached_queries():
+                if not await db_executor.run(initialize_cached_queries):
                     response += "\n\nNote: Failed to initialize cached queries database."
                 else:
                     try:
@@ -408,7 +740,7 @@ async def execute_api_call(
                         if data:
                             auto_description += f" with data"
 
-                        query_id = cached_queries_db.save_query(auto_description, path, method, params, data)
+                        query_id = await cached_queries_db.save_query(auto_description, path, method, params, data)
                         response += f"\n\n✓ Query automatically saved to cached queries with ID {query_id}"
                     except Exception as e:
                         logger.error(f"Error auto-saving query to cached queries: {str(e)}")
@@ -422,7 +754,7 @@ async def execute_api_call(
                     if data:
                         auto_description += f" with data"
 
-                    query_id = cached_queries_db.save_query(auto_description, path, method, params, data)
+                    query_id = await cached_queries_db.save_query(auto_description, path, method, params, data)
                     response += f"\n\n✓ Query automatically saved to cached queries with ID {query_id}"
                 except Exception as e:
                     logger.error(f"Error auto-saving query to cached queries: {str(e)}")
@@ -447,13 +779,107 @@ async def execute_api_call(
         current_query_from_cached_queries = False
 
 @mcp.tool()
-async def natural_language_api_search(query: str, max_results: int = 50) -> str:
+async def execute_api_calls_batch(
+    calls: List[Dict[str, Any]],
+    max_concurrency: int = 5,
+    timeout_per_item: float = 30.0,
+    sequential_writes: bool = True,
+    max_items_per_result: int = 10
+) -> str:
+    """
+    Execute several API calls to the ConnectWise API in one round trip.
+
+    Args:
+        calls: List of call specs, each {"path": ..., "method": "GET", "params": {...}, "data": {...}}.
+               A spec may also set "timeout" (seconds) to override timeout_per_item.
+        max_concurrency: Maximum number of calls in flight at once
+        timeout_per_item: Default timeout in seconds for each call
+        sequential_writes: Run POST/PUT/PATCH/DELETE calls one at a time in input order
+                           (reads still run in parallel)
+        max_items_per_result: Truncate list results to this many items
+    """
+    if not calls:
+        return "Error: Provide at least one call specification."
+
+    if not api_db:
+        if not await db_executor.run(initialize_database):
+            return "Error: Failed to initialize API database."
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+
+    async def run_item(index: int, spec: Dict[str, Any]) -> None:
+        async with semaphore:
+            results[index] = await _execute_batch_item(index, spec, timeout_per_item, max_items_per_result)
+
+    async def run_writes_in_order(indexes: List[int]) -> None:
+        for index in indexes:
+            await run_item(index, calls[index])
+
+    reads, writes = [], []
+    for index, spec in enumerate(calls):
+        method = str(spec.get('method', 'GET')).upper() if isinstance(spec, dict) else 'GET'
+        (reads if method == 'GET' else writes).append(index)
+
+    tasks = [run_item(index, calls[index]) for index in reads]
+    if sequential_writes:
+        tasks.append(run_writes_in_order(writes))
+    else:
+        tasks.extend(run_item(index, calls[index]) for index in writes)
+
+    await asyncio.gather(*tasks)
+
+    succeeded = sum(1 for result in results if result and result['ok'])
+    summary = {'total': len(calls), 'succeeded': succeeded, 'failed': len(calls) - succeeded}
+    return json.dumps({'summary': summary, 'results': results}, separators=(',', ':'), default=str)
+
+async def _execute_batch_item(
+    index: int,
+    spec: Dict[str, Any],
+    default_timeout: float,
+    max_items: int
+) -> Dict[str, Any]:
+    """Execute one call of a batch and capture its result or error"""
+    if not isinstance(spec, dict) or not spec.get('path'):
+        return {'index': index, 'ok': False, 'error': "Invalid call specification: 'path' is required"}
+
+    path = spec['path']
+    method = str(spec.get('method', 'GET')).upper()
+    item = {'index': index, 'method': method, 'path': path}
+
+    try:
+        endpoint = await api_db.find_endpoint_by_path_method(path, method)
+        if not endpoint:
+            return {**item, 'ok': False, 'error': f"No documented API endpoint found for {method} {path}"}
+
+        timeout = float(spec.get('timeout', default_timeout))
+        result = await asyncio.wait_for(
+            make_api_request(method, path, spec.get('params'), spec.get('data')),
+            timeout=timeout
+        )
+
+        if isinstance(result, list) and len(result) > max_items:
+            return {**item, 'ok': True, 'total_items': len(result), 'truncated': True, 'result': result[:max_items]}
+        return {**item, 'ok': True, 'result': result}
+
+    except asyncio.TimeoutError:
+        return {**item, 'ok': False, 'error': f"Timed out after {spec.get('timeout', default_timeout)}s"}
+    except APIError as e:
+        return {**item, 'ok': False, 'status_code': e.status_code, 'error': e.message}
+    except Exception as e:
+        logger.error(f"Error executing batch item {index}: {str(e)}")
+        return {**item, 'ok': False, 'error': str(e)}
+
+@mcp.tool()
+async def natural_language_api_search(query: str, max_results: int = 50, mode: str = "auto") -> str:
     """
     Search for API endpoints using natural language.
 
     Args:
         query: Natural language description of what you're looking for
         max_results: Maximum number of results to return (1-20)
+        mode: "auto" (combine both), "fulltext" (keyword/full-text matching) or
+              "semantic" (meaning-based, finds paraphrases such as "bill a customer")
     """
     # Input validation
     if not query or not isinstance(query, str):
@@ -467,16 +893,20 @@ async def natural_language_api_search(query: str, max_results: int = 50) -> str:
     if len(query) > 500:
         return "Error: Search query too long. Please keep it under 500 characters."
 
+    mode = (mode or "auto").strip().lower()
+    if mode not in SEARCH_MODES:
+        return f"Error: Invalid search mode '{mode}'. Use one of: {', '.join(SEARCH_MODES)}."
+
     # Validate max_results parameter
     if not isinstance(max_results, int) or max_results < 1 or max_results > 20:
         max_results = min(max(1, max_results), 50)
 
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
 
     try:
-        results = api_db.search_by_natural_language(query, max_results)
+        results = await api_db.search_by_natural_language(query, max_results, mode)
         
         if not results:
             return "No API endpoints found matching your query."
@@ -513,11 +943,11 @@ async def list_api_categories() -> str:
     List all available API categories.
     """
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
     
     try:
-        categories = api_db.get_categories()
+        categories = await api_db.get_categories()
         
         if not categories:
             return "No API categories found."
@@ -532,26 +962,33 @@ async def list_api_categories() -> str:
         return f"Error listing API categories: {str(e)}"
 
 @mcp.tool()
-async def get_category_endpoints(category: str, max_results: int = 20) -> str:
+async def get_category_endpoints(category: str, max_results: int = 20, offset: int = 0) -> str:
     """
     Get all endpoints for a specific API category.
     
     Args:
         category: Category name (use list_api_categories to see available categories)
         max_results: Maximum number of results to return
+        offset: Number of endpoints to skip (for paging through large categories)
     """
     if not api_db:
-        if not initialize_database():
+        if not await db_executor.run(initialize_database):
             return "Error: Failed to initialize API database."
     
+    max_results = max(1, max_results)
+    offset = max(0, offset)
     try:
-        endpoints = api_db.get_endpoints_by_category(category)
+        page = await api_db.get_endpoints_by_category_page(category, max_results, offset)
+        endpoints = page['items']
+        total = page['total']
         
         if not endpoints:
+            if total:
+                return f"No more endpoints: category '{category}' has {total} endpoints."
             return f"No endpoints found for category: {category}"
         
         formatted_results = []
-        for i, endpoint in enumerate(endpoints[:max_results], 1):
+        for i, endpoint in enumerate(endpoints, offset + 1):
             method = endpoint.get('method', '').upper()
             path = endpoint.get('path', '')
             summary = endpoint.get('summary', 'No summary available')
@@ -561,8 +998,11 @@ async def get_category_endpoints(category: str, max_results: int = 20) -> str:
         response = f"Endpoints in category '{category}':\n\n"
         response += "\n\n".join(formatted_results)
         
-        if len(endpoints) > max_results:
-            response += f"\n\nShowing {max_results} of {len(endpoints)} endpoints. Use a higher max_results value to see more."
+        if total > offset + len(endpoints):
+            response += (
+                f"\n\nShowing {offset + 1}-{offset + len(endpoints)} of {total} endpoints. "
+                f"Use offset={offset + len(endpoints)} to see more."
+            )
         
         return response
     
@@ -572,7 +1012,8 @@ async def get_category_endpoints(category: str, max_results: int = 20) -> str:
 
 @mcp.tool()
 async def send_raw_api_request(
-    raw_request: str
+    raw_request: str,
+    fields: Optional[List[str]] = None
 ) -> str:
     """
     Send a raw API request to the ConnectWise API.
@@ -581,6 +1022,7 @@ async def send_raw_api_request(
         raw_request: Raw API request in the format "METHOD /path?params [JSON body]"
                      Example: "GET /service/tickets?conditions=status/name='Open'"
                      Example: "POST /service/tickets { "summary": "Test ticket" }"
+        fields: For GET, only return these fields (e.g. ["id", "summary", "board/name"])
     """
     if not setup_config():
         return "Error: Failed to initialize API configuration."
@@ -619,7 +1061,7 @@ async def send_raw_api_request(
         
         # Use the execute_api_call function to handle the API call
         # This ensures cached queries checking and saving is consistent
-        return await execute_api_call(path, method, params, data)
+        return await execute_api_call(path, method, params, data, fields=fields)
     
     except Exception as e:
         logger.error(f"Error executing raw API request: {str(e)}")
@@ -644,11 +1086,11 @@ async def save_to_cached_queries(
         data: Request body data
     """
     if not cached_queries_db:
-        if not initialize_cached_queries():
+        if not await db_executor.run(initialize_cached_queries):
             return "Error: Failed to initialize cached queries database."
     
     try:
-        query_id = cached_queries_db.save_query(description, path, method, params, data)
+        query_id = await cached_queries_db.save_query(description, path, method, params, data)
         return f"Successfully saved query to cached queries with ID {query_id}."
     except Exception as e:
         logger.error(f"Error saving query to cached queries: {str(e)}")
@@ -663,16 +1105,16 @@ async def list_cached_queries(search_term: Optional[str] = None) -> str:
         search_term: Optional search term to filter queries
     """
     if not cached_queries_db:
-        if not initialize_cached_queries():
+        if not await db_executor.run(initialize_cached_queries):
             return "Error: Failed to initialize cached queries database."
     
     try:
         if search_term:
-            queries = cached_queries_db.search_queries(search_term)
+            queries = await cached_queries_db.search_queries(search_term)
             if not queries:
                 return f"No queries found in cached queries matching '{search_term}'."
         else:
-            queries = cached_queries_db.get_all_queries()
+            queries = await cached_queries_db.get_all_queries()
             if not queries:
                 return "No queries saved in cached queries yet."
         
@@ -719,11 +1161,11 @@ async def delete_from_cached_queries(query_id: int) -> str:
         query_id: ID of the query to delete
     """
     if not cached_queries_db:
-        if not initialize_cached_queries():
+        if not await db_executor.run(initialize_cached_queries):
             return "Error: Failed to initialize cached queries database."
     
     try:
-        success = cached_queries_db.delete_query(query_id)
+        success = await cached_queries_db.delete_query(query_id)
         if success:
             return f"Successfully deleted query with ID {query_id} from cached queries."
         else:
@@ -738,16 +1180,34 @@ async def clear_cached_queries() -> str:
     Clear all queries from cached queries.
     """
     if not cached_queries_db:
-        if not initialize_cached_queries():
+        if not await db_executor.run(initialize_cached_queries):
             return "Error: Failed to initialize cached queries database."
     
     try:
-        count = cached_queries_db.clear_all()
+        count = await cached_queries_db.clear_all()
         return f"Successfully cleared {count} queries from cached queries."
     except Exception as e:
         logger.error(f"Error clearing cached queries: {str(e)}")
         return f"Error clearing cached queries: {str(e)}"
 
+@mcp.tool()
+async def get_gateway_metrics() -> str:
+    """
+    Get runtime metrics for the gateway's outbound request pipeline
+    (rate limiter, retries, circuit breakers, response cache and request coalescing),
+    the database executor and the in-memory endpoint catalog.
+    """
+    metrics = {
+        'rate_limiter': rate_limiter.snapshot(),
+        'retry_budget': retry_budget.snapshot(),
+        'circuit_breakers': circuit_breakers.snapshot(),
+        'response_cache': response_cache.stats(),
+        'request_coalescing': request_coalescer.stats(),
+        'database_executor': db_executor.stats(),
+        'endpoint_catalog': api_db.catalog_stats() if api_db else None
+    }
+    return json.dumps(metrics, indent=2)
+
 def main():
     """Main entry point for the server"""
     logger.info("Starting ConnectWise API Gateway MCP Server...")
@@ -755,7 +1215,12 @@ def main():
     setup_config()
     initialize_database()
     initialize_cached_queries()
-    mcp.run(transport='stdio')
+
+    # The shared HTTP clients are started and closed by gateway_lifespan around the server run
+    try:
+        mcp.run(transport='stdio')
+    finally:
+        logger.info("ConnectWise API Gateway MCP Server stopped.")
     # result = api_db.find_endpoint_by_path_method('/company/managedDevicesIntegrations/123123/notifications/123123', 'GET')
     # print(f"Endpoint matching result: {result is not None}")
     # if result:
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Single-Flight Request Coalescing Module
+
+This module collapses concurrent identical requests into one upstream call. The first
+caller for a key starts the work; every caller that arrives while it is in flight awaits
+the same shared future and receives the same result (or the same exception).
+
+The shared work runs in its own task, so a caller that is cancelled does not cancel the
+request for the other waiters. Entries are removed as soon as the work finishes, so a
+failure is never cached and the next caller starts a fresh request.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Any, Callable, Awaitable
+
+# Set up logging
+logger = logging.getLogger("api_gateway.single_flight")
+
+class SingleFlight:
+    """Coalesces concurrent calls that share the same key."""
+
+    def __init__(self):
+        """Initialize the in-flight registry."""
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once for all concurrent callers with the same key.
+
+        Args:
+            key: Canonical fingerprint of the request
+            func: Zero-argument coroutine function performing the request
+
+        Returns:
+            The shared result of func
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            logger.debug(f"Coalescing request onto in-flight call: {key}")
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(func())
+        self._inflight[key] = future
+        self.started += 1
+
+        def _on_done(done: asyncio.Future) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+            # Mark the exception as retrieved when every waiter was cancelled
+            if not done.cancelled():
+                done.exception()
+
+        future.add_done_callback(_on_done)
+        return await asyncio.shield(future)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics."""
+        return {
+            'in_flight': self.in_flight,
+            'started': self.started,
+            'coalesced': self.coalesced
+        }
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Module
+
+This module parses large JSON responses incrementally. When the top-level value is an
+array, its elements are decoded one at a time as bytes arrive, so a caller that only
+needs the first few records can stop reading without buffering or parsing the rest of
+the body. Any other top-level value is buffered and decoded as a whole.
+
+Bodies that end within STREAMING_FULL_READ_BYTES are read and decoded in full: stopping
+early saves little on them, and a fully read body lets the connection go back to the
+pool and the complete result be cached.
+
+Environment Variables:
+    STREAMING_FULL_READ_BYTES - Bodies up to this size are read in full (default: 262144)
+"""
+
+import os
+import json
+import codecs
+from typing import Any, AsyncIterator, Optional, List
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]}'
+
+def get_streaming_config() -> dict:
+    """Get streaming configuration from environment variables or defaults"""
+    return {
+        'full_read_bytes': int(os.getenv('STREAMING_FULL_READ_BYTES', 256 * 1024))
+    }
+
+class PartialList(list):
+    """A list holding only the first items of a larger JSON array.
+
+    Attributes:
+        total_count: Number of elements in the full array, if they were counted
+    """
+
+    def __init__(self, items=(), total_count: Optional[int] = None):
+        super().__init__(items)
+        self.total_count = total_count
+
+class JSONStreamReader:
+    """Incrementally decodes a JSON document from a stream of byte chunks."""
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self.is_array: Optional[bool] = None
+        self.bytes_read = 0
+
+    async def values(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+        """
+        Decode values from the stream.
+
+        Args:
+            chunks: Async iterator of raw body bytes
+
+        Yields:
+            Each array element if the document is an array, otherwise the single
+            top-level value once the whole body has been read
+        """
+        text_decoder = codecs.getincrementaldecoder('utf-8')()
+        buffer = ''
+        pos = 0
+        # Text read since the last decode attempt, joined onto the buffer only when the
+        # next attempt is made
+        pending = []
+        pending_size = 0
+        # Undecoded text needed before decoding is retried. It doubles after every
+        # attempt that stops inside an incomplete element, so an element split across
+        # many chunks is re-scanned a logarithmic number of times instead of once per chunk.
+        retry_size = 0
+        finished = False
+        eof = False
+        chunk_iter = chunks.__aiter__()
+
+        while not finished:
+            # Read more data
+            try:
+                chunk = await chunk_iter.__anext__()
+                self.bytes_read += len(chunk)
+                text = text_decoder.decode(chunk)
+            except StopAsyncIteration:
+                text = text_decoder.decode(b'', final=True)
+                eof = True
+            if text:
+                pending.append(text)
+                pending_size += len(text)
+            if not eof and len(buffer) - pos + pending_size < retry_size:
+                continue
+
+            buffer = buffer[pos:] + ''.join(pending)
+            pending = []
+            pending_size = 0
+            pos = 0
+            retry_size = 0
+
+            if self.is_array is None:
+                stripped = buffer.lstrip(_WHITESPACE)
+                if not stripped:
+                    if eof:
+                        return
+                    continue
+                self.is_array = stripped[0] == '['
+                pos = len(buffer) - len(stripped) + (1 if self.is_array else 0)
+
+            if not self.is_array:
+                if eof:
+                    value = buffer[pos:].strip(_WHITESPACE)
+                    yield json.loads(value) if value else {}
+                    return
+                # Decoded once the whole body has been read
+                retry_size = float('inf')
+                continue
+
+            # Decode as many complete elements as the buffer holds
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE + ',':
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                if buffer[pos] == ']':
+                    finished = True
+                    break
+                try:
+                    value, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    retry_size = 2 * (len(buffer) - pos)
+                    break
+                # A number or literal is only complete once a delimiter follows it: the
+                # buffer may end inside it (15000000000. + 0, 1e + 5, tru + e)
+                if (not eof and not isinstance(value, (dict, list, str))
+                        and (end == len(buffer) or buffer[end] not in _DELIMITERS)):
+                    break
+                pos = end
+                yield value
+
+            if eof and not finished:
+                raise json.JSONDecodeError("Unterminated JSON array", buffer, pos)
+
+async def _replay(head: List[bytes], rest: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    for chunk in head:
+        yield chunk
+    async for chunk in rest:
+        yield chunk
+
+async def read_json_items(
+    chunks: AsyncIterator[bytes],
+    max_items: int,
+    count_total: bool = False,
+    full_read_bytes: Optional[int] = None
+) -> Any:
+    """
+    Read a JSON response, keeping at most max_items elements of a top-level array.
+
+    Args:
+        chunks: Async iterator of raw body bytes
+        max_items: Number of array elements to keep
+        count_total: Keep reading to count the remaining elements (without keeping them)
+        full_read_bytes: Bodies up to this size are decoded in full (default:
+                         STREAMING_FULL_READ_BYTES)
+
+    Returns:
+        The decoded value. A top-level array longer than max_items in a body larger
+        than full_read_bytes is returned as a PartialList; other values and complete
+        arrays are returned as decoded.
+    """
+    if full_read_bytes is None:
+        full_read_bytes = get_streaming_config()['full_read_bytes']
+
+    # Buffer the start of the body; if it ends within the limit, decode it whole
+    chunk_iter = chunks.__aiter__()
+    head = []
+    head_size = 0
+    while head_size <= full_read_bytes:
+        try:
+            chunk = await chunk_iter.__anext__()
+        except StopAsyncIteration:
+            body = b''.join(head).decode('utf-8').strip(_WHITESPACE)
+            return json.loads(body) if body else {}
+        head.append(chunk)
+        head_size += len(chunk)
+
+    reader = JSONStreamReader()
+    values = reader.values(_replay(head, chunk_iter))
+    items = []
+    seen = 0
+    truncated = False
+
+    try:
+        async for value in values:
+            if not reader.is_array:
+                return value
+            seen += 1
+            if len(items) < max_items:
+                items.append(value)
+            elif not count_total:
+                truncated = True
+                break
+            else:
+                truncated = True
+    finally:
+        await values.aclose()
+
+    if reader.is_array is None:
+        return {}
+    if truncated:
+        return PartialList(items, total_count=seen if count_total else None)
+    return items
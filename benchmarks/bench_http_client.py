@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+HTTP Client Pooling Benchmark
+
+Compares per-request latency of the old behavior (a brand-new httpx.AsyncClient for
+every call) against the shared pooled client from api_gateway.http_client, using a
+local stub HTTP server so the numbers only reflect connection handling.
+
+Usage:
+    python benchmarks/bench_http_client.py [--requests 500] [--concurrency 1]
+                                           [--tls-cert cert.pem --tls-key key.pem]
+"""
+
+import os
+import sys
+import ssl
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from api_gateway.http_client import HTTPClientManager
+
+STUB_BODY = json.dumps([{"id": i, "summary": f"Ticket {i}"} for i in range(5)]).encode()
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive capable handler returning a small JSON list."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(STUB_BODY)))
+        self.end_headers()
+        self.wfile.write(STUB_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_stub_server(cert: str = None, key: str = None):
+    """Start the stub server on a free port in a background thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    scheme = "http"
+    if cert and key:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = "https"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"{scheme}://127.0.0.1:{server.server_address[1]}"
+
+async def run_requests(send, total: int, concurrency: int) -> list:
+    """Issue `total` requests with bounded concurrency and return per-request latencies in ms."""
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            start = time.perf_counter()
+            await send()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    await asyncio.gather(*(one() for _ in range(total)))
+    return latencies
+
+def summarize(name: str, latencies: list) -> dict:
+    """Build a summary of latency percentiles."""
+    ordered = sorted(latencies)
+    return {
+        "mode": name,
+        "requests": len(ordered),
+        "mean_ms": round(statistics.mean(ordered), 3),
+        "p50_ms": round(ordered[int(len(ordered) * 0.50)], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3)
+    }
+
+async def benchmark(base_url: str, total: int, concurrency: int, verify: bool) -> list:
+    url = f"{base_url}/service/tickets"
+
+    # Before: one client (and one connection handshake) per request
+    async def per_request_client():
+        async with httpx.AsyncClient(timeout=30.0, verify=verify) as client:
+            response = await client.get(url)
+            response.json()
+
+    # After: shared pooled client with keep-alive
+    manager = HTTPClientManager({'verify': verify})
+    await manager.startup(base_url)
+    pooled = await manager.get_client(base_url)
+
+    async def shared_client():
+        response = await pooled.get(url)
+        response.json()
+
+    results = [
+        summarize("client_per_request", await run_requests(per_request_client, total, concurrency)),
+        summarize("shared_pooled_client", await run_requests(shared_client, total, concurrency))
+    ]
+
+    await manager.shutdown()
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-request vs pooled HTTP clients")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per mode")
+    parser.add_argument("--concurrency", type=int, default=1, help="Concurrent requests in flight")
+    parser.add_argument("--tls-cert", help="PEM certificate to serve HTTPS (includes TLS handshake cost)")
+    parser.add_argument("--tls-key", help="PEM private key for --tls-cert")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.tls_cert, args.tls_key)
+    try:
+        results = asyncio.run(benchmark(base_url, args.requests, args.concurrency, verify=not args.tls_cert))
+    finally:
+        server.shutdown()
+
+    print(json.dumps({"base_url": base_url, "concurrency": args.concurrency, "results": results}, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Path Router Benchmark
+
+Compares resolving concrete request paths (e.g. /company/companies/123/contacts/456)
+to endpoint templates with api_gateway.path_router.PathRouter against the previous
+find_endpoint_by_path_method fallback: parameterize the path segment by segment, then
+scan every endpoint of the method and run re.sub on each template. The legacy version
+here runs against in-memory paths, so it excludes the per-segment LIKE queries and
+the full-table fetch it used to make; real-world gains are larger than reported.
+
+Usage:
+    python benchmarks/bench_path_router.py [--endpoints 3000] [--lookups 20000]
+"""
+
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from api_gateway.path_router import PathRouter
+
+AREAS = ['company', 'service', 'time', 'finance', 'project', 'sales', 'system', 'procurement', 'marketing', 'schedule']
+RESOURCES = [
+    'companies', 'contacts', 'tickets', 'boards', 'entries', 'invoices', 'agreements', 'projects',
+    'opportunities', 'members', 'products', 'activities', 'configurations', 'notes', 'documents', 'teams'
+]
+METHODS = ['get', 'post', 'put', 'patch', 'delete']
+
+def build_templates(count: int, seed: int = 7) -> list:
+    """Build ConnectWise-shaped path templates, e.g. /service/tickets/{parentId}/notes/{id}."""
+    rng = random.Random(seed)
+    templates = set()
+    while len(templates) < count:
+        parts = [rng.choice(AREAS), rng.choice(RESOURCES) + str(rng.randint(0, 40))]
+        for _ in range(rng.randint(0, 2)):
+            parts += ['{parentId}', rng.choice(RESOURCES)]
+        if rng.random() < 0.6:
+            parts.append('{id}')
+        if rng.random() < 0.1:
+            parts.append('count')
+        for method in rng.sample(METHODS, rng.randint(1, 3)):
+            templates.add(('/' + '/'.join(parts), method))
+    return sorted(templates)[:count]
+
+def concrete_path(template: str, rng: random.Random) -> str:
+    """Replace every placeholder with a numeric id."""
+    return re.sub(r'\{[^}]+\}', lambda _: str(rng.randint(1, 99999)), template)
+
+class LegacyResolver:
+    """The pre-router resolution logic, minus the database round trips."""
+
+    def __init__(self, templates: list):
+        self.templates = templates
+        self._all_paths = [path for path, _ in templates]
+        self._known_segments_cache = {}
+
+    def _is_known_path_segment(self, segment: str) -> bool:
+        # Previously one `LIKE '%/segment%'` query per uncached segment
+        if segment not in self._known_segments_cache:
+            self._known_segments_cache[segment] = any(f"/{segment}" in path for path in self._all_paths)
+        return self._known_segments_cache[segment]
+
+    def _convert_segment_to_parameter(self, segment: str) -> str:
+        if self._is_known_path_segment(segment):
+            return segment
+        if re.match(r'^\d+$', segment):
+            return '{id}'
+        return segment
+
+    def resolve(self, path: str, method: str):
+        parameterized = '/'.join(self._convert_segment_to_parameter(segment) if segment else segment for segment in path.split('/'))
+        generic = re.sub(r'\{[^}]+\}', '{param}', parameterized)
+        # Previously `SELECT id, path FROM endpoints WHERE method = :method` and a Python scan
+        for index, (template, template_method) in enumerate(self.templates):
+            if template_method == method and re.sub(r'\{[^}]+\}', '{param}', template) == generic:
+                return index
+        return None
+
+def time_lookups(resolve, lookups: list) -> list:
+    """Return per-lookup latencies in microseconds."""
+    latencies = []
+    for path, method in lookups:
+        start = time.perf_counter()
+        resolve(path, method)
+        latencies.append((time.perf_counter() - start) * 1e6)
+    return latencies
+
+def summarize(name: str, latencies: list) -> str:
+    ordered = sorted(latencies)
+    return (
+        f"{name:<8} mean={statistics.mean(ordered):9.2f}us  p50={ordered[len(ordered) // 2]:9.2f}us  "
+        f"p99={ordered[int(len(ordered) * 0.99) - 1]:9.2f}us"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PathRouter against the legacy endpoint scan")
+    parser.add_argument('--endpoints', type=int, default=3000)
+    parser.add_argument('--lookups', type=int, default=20000)
+    parser.add_argument('--legacy-lookups', type=int, default=2000, help="Lookups for the (slow) legacy resolver")
+    args = parser.parse_args()
+
+    templates = build_templates(args.endpoints)
+    rng = random.Random(11)
+    lookups = [(concrete_path(path, rng), method) for path, method in (rng.choice(templates) for _ in range(args.lookups))]
+
+    start = time.perf_counter()
+    router = PathRouter((path, method, index) for index, (path, method) in enumerate(templates))
+    build_ms = (time.perf_counter() - start) * 1000
+
+    legacy = LegacyResolver(templates)
+    mismatches = sum(
+        1 for path, method in lookups[:args.legacy_lookups]
+        if templates[router.match(path, method)[0]][0] != templates[legacy.resolve(path, method)][0]
+    )
+
+    print(f"{len(templates)} templates, router built in {build_ms:.1f}ms, {mismatches} mismatching resolutions")
+    legacy_latencies = time_lookups(legacy.resolve, lookups[:args.legacy_lookups])
+    router_latencies = time_lookups(router.match, lookups)
+    print(summarize("legacy", legacy_latencies))
+    print(summarize("router", router_latencies))
+    print(f"speedup  {statistics.mean(legacy_latencies) / statistics.mean(router_latencies):.0f}x (mean)")
+
+if __name__ == '__main__':
+    main()
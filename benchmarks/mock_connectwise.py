@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Mock ConnectWise Server
+
+A local stand-in for the ConnectWise Manage REST API used by the benchmark suite.
+Every path is served from a synthetic collection of records:
+
+    GET  /<collection>            -> a page of records (page/pageSize or pageId paging)
+    GET  /<collection>/count      -> {"count": N}
+    GET  /<collection>/<id>       -> a single record
+    POST/PUT/PATCH/DELETE ...     -> echoes the request body with an id
+    GET  /_mock/stats             -> {"requests_total": N, "connections_total": N}
+
+Latency, collection size, maximum page size, record payload size and 429 throttling are
+configurable so benchmarks can reproduce slow, large or rate-limited upstreams.
+
+Usage:
+    python benchmarks/mock_connectwise.py [--port 0] [--latency-ms 50] [--jitter-ms 10]
+                                          [--records 5000] [--max-page-size 1000]
+                                          [--record-bytes 512] [--rate-limit 0]
+                                          [--retry-after 1]
+
+The first line written to stdout is "LISTENING <base_url>".
+"""
+
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+from typing import Dict, Any, Optional
+from aiohttp import web
+
+class MockConnectWise:
+    """aiohttp application emulating the parts of ConnectWise the gateway relies on."""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize the mock.
+
+        Args:
+            config: Server options (see parse_args for keys)
+        """
+        self.config = config
+        self.requests_total = 0
+        self.throttled_total = 0
+        self._connections = set()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._padding = 'x' * max(0, config['record_bytes'] - 120)
+
+    def record(self, collection: str, record_id: int) -> Dict[str, Any]:
+        """Build a deterministic synthetic record."""
+        return {
+            'id': record_id,
+            'summary': f"{collection} record {record_id}",
+            'status': {'id': record_id % 7, 'name': ['New', 'Open', 'In Progress', 'Waiting', 'Scheduled', 'Resolved', 'Closed'][record_id % 7]},
+            'board': {'id': record_id % 5, 'name': f"Board {record_id % 5}"},
+            'company': {'id': record_id % 50, 'identifier': f"Company{record_id % 50}"},
+            'notes': self._padding,
+            '_info': {'lastUpdated': '2024-01-01T00:00:00Z'}
+        }
+
+    def _throttled(self) -> bool:
+        limit = self.config['rate_limit']
+        if limit <= 0:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        return self._window_count > limit
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if request.path == '/_mock/stats':
+            return web.json_response({
+                'requests_total': self.requests_total,
+                'throttled_total': self.throttled_total,
+                'connections_total': len(self._connections)
+            })
+
+        self.requests_total += 1
+        # Client address and port identify the TCP connection the request arrived on
+        self._connections.add(request.transport.get_extra_info('peername') if request.transport else None)
+
+        latency = self.config['latency_ms'] + random.uniform(-1, 1) * self.config['jitter_ms']
+        if latency > 0:
+            await asyncio.sleep(latency / 1000)
+
+        if self._throttled():
+            self.throttled_total += 1
+            return web.json_response(
+                {'code': 'TooManyRequests', 'message': 'Rate limit exceeded'},
+                status=429,
+                headers={'Retry-After': str(self.config['retry_after'])}
+            )
+
+        segments = [segment for segment in request.path.split('/') if segment]
+        collection = '/'.join(segments[:2]) if segments else 'root'
+
+        if request.method != 'GET':
+            body = await request.json() if request.can_read_body else {}
+            return web.json_response({'id': random.randint(1, self.config['records']), **(body or {})})
+
+        if segments and segments[-1] == 'count':
+            return web.json_response({'count': self.config['records']})
+
+        if segments and segments[-1].isdigit():
+            return web.json_response(self.record(collection, int(segments[-1])))
+
+        return web.json_response(self.page(collection, request.query))
+
+    def page(self, collection: str, query) -> list:
+        """Build one page of records honoring page/pageSize and pageId."""
+        page_size = min(int(query.get('pageSize', 25)), self.config['max_page_size'])
+        total = self.config['records']
+
+        if 'pageId' in query:
+            start = int(query['pageId'])
+        else:
+            start = (max(1, int(query.get('page', 1))) - 1) * page_size
+
+        end = min(total, start + page_size)
+        records = [self.record(collection, record_id) for record_id in range(start + 1, end + 1)]
+
+        fields = query.get('fields')
+        if fields:
+            wanted = {field.split('/', 1)[0] for field in fields.split(',')}
+            records = [{key: value for key, value in record.items() if key in wanted} for record in records]
+        return records
+
+    def application(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', self.handle)
+        return app
+
+def parse_args(argv=None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Local mock ConnectWise API server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help="Port to listen on (0 picks a free port)")
+    parser.add_argument('--latency-ms', type=float, default=50, help="Base response latency")
+    parser.add_argument('--jitter-ms', type=float, default=10, help="Random latency jitter (+/-)")
+    parser.add_argument('--records', type=int, default=5000, help="Records in every collection")
+    parser.add_argument('--max-page-size', type=int, default=1000, help="Largest pageSize honored")
+    parser.add_argument('--record-bytes', type=int, default=512, help="Approximate size of each record")
+    parser.add_argument('--rate-limit', type=int, default=0, help="Requests per second before 429s (0 disables)")
+    parser.add_argument('--retry-after', type=float, default=1, help="Retry-After seconds sent with 429s")
+    return vars(parser.parse_args(argv))
+
+async def serve(config: Dict[str, Any]) -> None:
+    mock = MockConnectWise(config)
+    runner = web.AppRunner(mock.application(), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, config['host'], config['port'])
+    await site.start()
+
+    port = runner.addresses[0][1]
+    print(f"LISTENING http://{config['host']}:{port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+def start_mock_server(options: Optional[Dict[str, Any]] = None):
+    """
+    Start the mock server in a subprocess so it does not share the benchmark's event loop.
+
+    Args:
+        options: Command line options as a dict, e.g. {'latency-ms': 20, 'records': 1000}
+
+    Returns:
+        Tuple of (process, base_url)
+    """
+    argv = [sys.executable, __file__]
+    for key, value in (options or {}).items():
+        argv += [f"--{key}", str(value)]
+
+    process = subprocess.Popen(argv, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline().strip()
+    if not line.startswith('LISTENING '):
+        process.kill()
+        raise RuntimeError(f"Mock ConnectWise server failed to start: {line}")
+    return process, line.split(' ', 1)[1]
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(serve(parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -6,11 +6,15 @@ This script builds the SQLite database for the ConnectWise API Gateway MCP serve
 It should be run once before starting the server, or whenever the API definition changes.
 
 Usage:
-    python build_database.py <path_to_manage.json>
+    python build_database.py <path_to_manage.json> [--force]
+
+The build is skipped when the database was already built from an identical
+manage.json; pass --force to rebuild anyway.
 """
 
 import os
 import sys
+import argparse
 import subprocess
 import logging
 
@@ -21,8 +25,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger("build_database")
 
-def build_database(json_path):
-    """Build the PostgresSQL database from the JSON file."""
+def build_database(json_path, force=False):
+    """Build the PostgresSQL database from the JSON file (skipped if it is unchanged unless force is set)."""
     # Directory of this script
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
@@ -45,7 +49,10 @@ def build_database(json_path):
     # Run the converter script
     try:
         logger.info(f"Building database from {json_path}...")
-        subprocess.run([sys.executable, converter_script, json_path], check=True)
+        command = [sys.executable, converter_script, json_path]
+        if force:
+            command.append("--force")
+        subprocess.run(command, check=True)
         logger.info(f"Database built successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -53,14 +60,18 @@ def build_database(json_path):
         return False
 
 def main():
-    if len(sys.argv) < 2:
-        print(f"Usage: python {os.path.basename(__file__)} <path_to_manage.json>")
-        print("\nExample:")
-        print(f"  python {os.path.basename(__file__)} C:\\path\\to\\manage.json")
-        sys.exit(1)
-    
-    json_path = sys.argv[1]
-    if build_database(json_path):
+    parser = argparse.ArgumentParser(
+        description="Build the ConnectWise API database from manage.json",
+        epilog=f"Example: python {os.path.basename(__file__)} C:\\path\\to\\manage.json"
+    )
+    parser.add_argument("json_path", help="Path to manage.json")
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rebuild even if the database was already built from an identical file"
+    )
+    args = parser.parse_args()
+
+    if build_database(args.json_path, args.force):
         print("\nDatabase built successfully!")
         print("You can now run the API Gateway MCP server.")
     else:
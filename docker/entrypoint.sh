@@ -12,13 +12,17 @@ done
 
 echo "PostgreSQL is ready!"
 
-# Check if manage.json exists and build database if needed
+# Check if manage.json exists and build database if needed; the build is skipped
+# when the database was already built from an identical file
 if [ -f "/app/manage.json" ]; then
-    echo "Found manage.json - building API database..."
-    python build_database.py /app/manage.json
+    BUILD_ARGS=""
+    if [ "${FORCE_DATABASE_BUILD:-false}" = "true" ]; then
+        BUILD_ARGS="--force"
+    fi
 
-    if [ $? -eq 0 ]; then
-        echo "Database built successfully!"
+    echo "Found manage.json - building API database (skipped if unchanged)..."
+    if python build_database.py /app/manage.json $BUILD_ARGS; then
+        echo "Database is up to date!"
     else
         echo "Warning: Database build failed, but continuing..."
     fi
@@ -0,0 +1,16 @@
+"""
+Shared pytest setup.
+
+The repository root is put on sys.path for `api_gateway.*` imports, and the api_gateway
+directory for the modules json_to_postgres.py imports as a standalone script
+(schema, schema_resolver, search_terms, semantic_search).
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+for path in (ROOT, os.path.join(ROOT, 'api_gateway')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
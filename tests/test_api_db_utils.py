@@ -0,0 +1,45 @@
+import pytest
+
+from api_gateway.api_db_utils import APIDatabase
+from api_gateway.lru import BoundedLRU
+
+class FakeSearchEngine:
+    """Records the query text and patterns of every search"""
+    def __init__(self):
+        self.searches = []
+
+    def search(self, query, patterns, limit=None, generation=None, **options):
+        self.searches.append((query, list(patterns)))
+        return [{'id': len(self.searches), 'path': '/service/tickets'}]
+
+    def search_page(self, query, patterns, limit, offset=0, generation=None, **options):
+        self.searches.append((query, list(patterns)))
+        return {'items': [{'id': len(self.searches)}], 'total': 1}
+
+@pytest.fixture
+def database():
+    # Skip __init__, which connects to PostgreSQL
+    database = APIDatabase.__new__(APIDatabase)
+    database.search_engine = FakeSearchEngine()
+    database._search_cache = BoundedLRU(100)
+    database._current_generation = lambda: 1
+    return database
+
+@pytest.mark.parametrize('method', ['search_endpoints', 'search_endpoints_page', 'advanced_search'])
+def test_queries_sharing_a_cache_key_search_for_the_same_text(database, method):
+    search = getattr(database, method)
+    first = search('  Service   TICKETS ')
+    second = search('service tickets')
+
+    assert database.search_engine.searches == [('service tickets', ['service tickets'])]
+    assert second == first
+
+def test_natural_language_search_uses_the_normalized_query(database):
+    database.get_semantic_index = lambda: None
+    database.search_by_natural_language('Open  Tickets\tfor a company')
+    database.search_by_natural_language('open tickets for a company')
+
+    query, keywords = database.search_engine.searches[0]
+    assert query == 'open tickets for a company'
+    assert keywords == ['open', 'tickets', 'company']
+    assert len(database.search_engine.searches) == 1
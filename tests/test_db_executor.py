@@ -0,0 +1,89 @@
+import asyncio
+import inspect
+import threading
+
+import pytest
+
+from api_gateway.db_executor import AsyncDatabase, DatabaseExecutor, db_engine_kwargs
+
+class FakeDatabase:
+    """Synchronous database recording the thread each call runs on"""
+    def __init__(self):
+        self.name = 'fake'
+        self.threads = {}
+
+    def search_endpoints(self, query, limit=None):
+        self.threads['search_endpoints'] = threading.current_thread().name
+        return [{'query': query, 'limit': limit}]
+
+    def get_endpoint_details(self, endpoint_id):
+        raise LookupError(f"No endpoint {endpoint_id}")
+
+    def format_endpoint_for_display(self, endpoint):
+        self.threads['format_endpoint_for_display'] = threading.current_thread().name
+        return f"{endpoint['method']} {endpoint['path']}"
+
+    def _normalize_path(self, path):
+        return path.lower()
+
+@pytest.fixture
+def executor():
+    executor = DatabaseExecutor({'max_workers': 2})
+    yield executor
+    executor.shutdown()
+
+@pytest.fixture
+def database(executor):
+    return AsyncDatabase(FakeDatabase(), executor, inline=('format_endpoint_for_display',))
+
+def test_methods_become_coroutines_run_on_the_executor(database, executor):
+    assert inspect.iscoroutinefunction(database.search_endpoints)
+    assert database.search_endpoints.__name__ == 'search_endpoints'
+
+    result = asyncio.run(database.search_endpoints('tickets', limit=5))
+    assert result == [{'query': 'tickets', 'limit': 5}]
+    assert database.sync.threads['search_endpoints'].startswith('api-gateway-db')
+    assert executor.stats()['completed_total'] == 1
+
+def test_wrapper_is_created_once(database):
+    assert database.search_endpoints is database.search_endpoints
+
+def test_inline_private_and_non_callable_attributes_pass_through(database):
+    formatted = database.format_endpoint_for_display({'method': 'GET', 'path': '/service/tickets'})
+    assert formatted == 'GET /service/tickets'
+    assert database.sync.threads['format_endpoint_for_display'] == threading.current_thread().name
+
+    assert not inspect.iscoroutinefunction(database._normalize_path)
+    assert database._normalize_path('/Service/Tickets') == '/service/tickets'
+    assert database.name == 'fake'
+
+def test_exceptions_propagate_and_count_as_failures(database, executor):
+    with pytest.raises(LookupError, match='No endpoint 42'):
+        asyncio.run(database.get_endpoint_details(42))
+
+    stats = executor.stats()
+    assert stats['failed_total'] == 1 and stats['completed_total'] == 0
+    assert stats['running'] == 0 and stats['queued'] == 0
+
+def test_missing_attributes_raise_attribute_error(database):
+    with pytest.raises(AttributeError):
+        database.no_such_method
+
+def test_calls_overlap_up_to_the_worker_count(executor):
+    barrier = threading.Barrier(2, timeout=5)
+
+    class SlowDatabase:
+        def wait(self):
+            # Both calls must be running at once for the barrier to release
+            return barrier.wait()
+
+    database = AsyncDatabase(SlowDatabase(), executor)
+
+    async def scenario():
+        return await asyncio.gather(database.wait(), database.wait())
+
+    assert sorted(asyncio.run(scenario())) == [0, 1]
+
+def test_engine_kwargs_follow_the_executor_configuration():
+    kwargs = db_engine_kwargs({'pool_size': 3, 'max_overflow': 1, 'pool_timeout': 5.0})
+    assert kwargs == {'pool_size': 3, 'max_overflow': 1, 'pool_timeout': 5.0, 'pool_pre_ping': True}
@@ -0,0 +1,90 @@
+import copy
+
+import pytest
+
+from api_gateway.field_projection import (
+    normalize_fields, get_success_response_schema, validate_fields, available_fields, needs_projection,
+    project, _build_tree
+)
+
+BOARD = {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'name': {'type': 'string'}}}
+TICKET = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer'},
+        'summary': {'type': 'string'},
+        'board': BOARD,
+        # Resolved arrays of a component hold their items as a one-element list
+        'notes': {'type': 'array', 'items': [{'type': 'object', 'properties': {'text': {'type': 'string'}}}]},
+        'owner': {'type': 'object', 'x-circular-ref': 'Member'},
+        'customFields': {'type': 'array', 'items': {'type': 'object', 'properties': {'caption': {'type': 'string'}}}},
+    }
+}
+TICKET_LIST = {'type': 'array', 'items': [TICKET]}
+
+@pytest.mark.parametrize('fields, expected', [
+    ('id, summary,board/name', ['id', 'summary', 'board/name']),
+    ('board.name, board/name, id ,id', ['board/name', 'id']),
+    (['id', ' /board/ ', '', 'status.name'], ['id', 'board', 'status/name']),
+    ('', []),
+    (None, []),
+])
+def test_normalize_fields(fields, expected):
+    assert normalize_fields(fields) == expected
+
+@pytest.mark.parametrize('schema', [TICKET, TICKET_LIST, {'type': 'array', 'items': TICKET}])
+def test_validate_fields_unwraps_arrays(schema):
+    fields = ['id', 'board/name', 'notes/text', 'customFields/caption', 'board/code', 'notes/author', 'status']
+    assert validate_fields(schema, fields) == (
+        ['id', 'board/name', 'notes/text', 'customFields/caption'],
+        ['board/code', 'notes/author', 'status']
+    )
+
+def test_validate_fields_accepts_paths_below_markers_and_unknown_schemas():
+    assert validate_fields(TICKET_LIST, ['owner/identifier', 'owner/name/first']) == (
+        ['owner/identifier', 'owner/name/first'], []
+    )
+    assert validate_fields(None, ['anything']) == (['anything'], [])
+    assert validate_fields({'type': 'object', 'x-truncated-ref': 'Ticket'}, ['id']) == (['id'], [])
+
+def test_available_fields_and_success_schema():
+    endpoint = {'response_bodies': [
+        {'status_code': '400', 'schema': {'type': 'object', 'properties': {'code': {}}}},
+        {'status_code': '200', 'schema': TICKET_LIST},
+        {'status_code': '201', 'schema': BOARD},
+    ]}
+    schema = get_success_response_schema(endpoint)
+    assert schema is TICKET_LIST
+    assert available_fields(schema) == ['board', 'customFields', 'id', 'notes', 'owner', 'summary']
+    assert get_success_response_schema({'response_bodies': [{'status_code': '204', 'schema': None}]}) is None
+
+@pytest.mark.parametrize('fields', [['board', 'board/name'], ['board/name', 'board']])
+def test_full_selection_of_a_parent_wins_over_its_children(fields):
+    assert _build_tree(fields) == {'board': None}
+
+def test_build_tree_merges_nested_selections():
+    assert _build_tree(['id', 'board/name', 'board/id', 'company/site/name']) == {
+        'id': None, 'board': {'name': None, 'id': None}, 'company': {'site': {'name': None}}
+    }
+
+def test_project_lists_and_nested_records_without_mutating_the_input():
+    data = [
+        {'id': 1, 'summary': 'Printer', 'board': {'id': 5, 'name': 'Help Desk'},
+         'notes': [{'text': 'a', 'author': 'x'}, {'text': 'b', 'author': 'y'}]},
+        {'id': 2, 'board': None, 'notes': []},
+    ]
+    original = copy.deepcopy(data)
+
+    projected = project(data, ['id', 'board/name', 'notes/text', 'missing'])
+    assert projected == [
+        {'id': 1, 'board': {'name': 'Help Desk'}, 'notes': [{'text': 'a'}, {'text': 'b'}]},
+        {'id': 2, 'board': None, 'notes': []},
+    ]
+    assert data == original
+    assert project(data, []) is data
+
+def test_needs_projection():
+    records = [{'id': 1, 'board': {'name': 'x'}}]
+    assert not needs_projection(records, ['id', 'board/name'])
+    assert needs_projection(records, ['id'])
+    assert needs_projection({'id': 1, 'summary': 's'}, ['id'])
@@ -0,0 +1,199 @@
+import json
+import os
+import re
+
+import pytest
+
+import json_to_postgres
+from schema_resolver import SchemaResolver
+
+_COPY_ESCAPES = {'\\\\': '\\', '\\t': '\t', '\\n': '\n', '\\r': '\r'}
+
+def _copy_unescape(field: str):
+    """Decode one field of COPY text format (None for \\N)"""
+    if field == '\\N':
+        return None
+    return re.sub(r'\\[\\tnr]', lambda match: _COPY_ESCAPES[match.group(0)], field)
+
+class _RecordingCursor:
+    def __init__(self):
+        self.statements = []
+
+    def copy_expert(self, statement, buffer):
+        self.statements.append((statement, buffer.read()))
+
+@pytest.mark.parametrize('example', [
+    '2024-01-01', 'tab\there', 'line\nbreak\\slash', 0, 12.5, True, False, None,
+    {}, {'date': '2024-01-01', 'nested': [1, None, True]}, ['a', 'b']
+])
+def test_copy_value_round_trips_json(example):
+    field = json_to_postgres.copy_value(example, as_json=True)
+    assert '\t' not in field and '\n' not in field
+    assert json.loads(_copy_unescape(field)) == example
+
+def test_copy_value_plain_columns():
+    assert json_to_postgres.copy_value(None) == '\\N'
+    assert json_to_postgres.copy_value(True) == 't'
+    assert json_to_postgres.copy_value(False) == 'f'
+    assert json_to_postgres.copy_value(3) == '3'
+    assert _copy_unescape(json_to_postgres.copy_value('a\tb\nc\\d')) == 'a\tb\nc\\d'
+
+def test_copy_rows_encodes_only_json_columns():
+    cursor = _RecordingCursor()
+    json_to_postgres.copy_rows(
+        cursor, 'stage_request_bodies', ('ord', 'schema_hash', 'example'),
+        [(0, 'abc', '2024-01-01'), (1, None, None), (2, 'def', True)],
+        json_columns=('example',)
+    )
+    statement, data = cursor.statements[0]
+    assert statement == "COPY stage_request_bodies (ord, schema_hash, example) FROM STDIN"
+    rows = [[_copy_unescape(field) for field in line.split('\t')] for line in data.splitlines()]
+    assert rows == [['0', 'abc', '"2024-01-01"'], ['1', None, 'null'], ['2', 'def', 'true']]
+
+def test_build_is_current_only_with_the_same_file_and_settings():
+    build = {
+        'id': 3, 'spec_hash': 'abc', 'spec_version': '2024.1',
+        'ingest_version': json_to_postgres.INGEST_VERSION, 'schema_max_depth': 8
+    }
+    assert json_to_postgres.is_build_current(build, 'abc', 8)
+    assert not json_to_postgres.is_build_current(build, 'def', 8)
+    assert not json_to_postgres.is_build_current(build, 'abc', 4)
+    assert not json_to_postgres.is_build_current(dict(build, ingest_version=0), 'abc', 8)
+    assert not json_to_postgres.is_build_current(dict(build, schema_max_depth=None), 'abc', 8)
+    assert not json_to_postgres.is_build_current(None, 'abc', 8)
+
+@pytest.mark.parametrize('succeeded, exit_code', [(True, None), (False, 1)])
+def test_main_exits_non_zero_when_the_ingest_fails(monkeypatch, tmp_path, succeeded, exit_code):
+    json_path = tmp_path / 'manage.json'
+    json_path.write_text('{"paths": {}}')
+    monkeypatch.setattr(json_to_postgres, 'process_json_file', lambda *args: succeeded)
+    monkeypatch.setattr('sys.argv', ['json_to_postgres.py', str(json_path)])
+    if exit_code is None:
+        json_to_postgres.main()
+    else:
+        with pytest.raises(SystemExit) as raised:
+            json_to_postgres.main()
+        assert raised.value.code == exit_code
+
+def test_process_json_file_reports_a_skipped_ingest_as_success(tmp_path):
+    sqlalchemy = pytest.importorskip('sqlalchemy')
+    json_path = tmp_path / 'manage.json'
+    json_path.write_bytes(b'{"info": {"version": "2024.1"}, "paths": {}}')
+    database_url = f"sqlite:///{tmp_path / 'catalog.db'}"
+    engine = sqlalchemy.create_engine(database_url)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE catalog_builds (id INTEGER PRIMARY KEY, spec_hash TEXT, spec_version TEXT, "
+            "ingest_version INTEGER, schema_max_depth INTEGER)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO catalog_builds VALUES (1, ?, '2024.1', ?, 8)",
+            (json_to_postgres.hashlib.sha256(json_path.read_bytes()).hexdigest(), json_to_postgres.INGEST_VERSION)
+        )
+    engine.dispose()
+    assert json_to_postgres.process_json_file(str(json_path), database_url, max_depth=8) is True
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), os.pardir, 'benchmarks', 'fixtures', 'sample_openapi.json')
+
+def _load_fixture():
+    with open(FIXTURE_PATH) as f:
+        return json.load(f)
+
+def _fingerprints(document):
+    resolver = SchemaResolver(document['components']['schemas'], max_depth=8)
+    return {
+        (operation['endpoint']['path'], operation['endpoint']['method']): operation['endpoint']['fingerprint']
+        for operation in json_to_postgres.extract_operations(document['paths'], resolver)
+    }
+
+def _stored(fingerprints):
+    return {key: (endpoint_id, fingerprint) for endpoint_id, (key, fingerprint) in enumerate(fingerprints.items(), 1)}
+
+def _diff(document, stored):
+    resolver = SchemaResolver(document['components']['schemas'], max_depth=8)
+    operations = json_to_postgres.extract_operations(document['paths'], resolver)
+    changes = json_to_postgres.diff_operations(operations, stored)
+    return {
+        kind: sorted(
+            (entry['endpoint']['path'], entry['endpoint']['method']) if isinstance(entry, dict) else entry[1:]
+            for entry in entries
+        )
+        for kind, entries in changes.items()
+    }
+
+def test_fingerprints_are_stable_across_identical_extracts():
+    fingerprints = _fingerprints(_load_fixture())
+    assert fingerprints == _fingerprints(_load_fixture())
+    assert len(set(fingerprints.values())) == len(fingerprints)
+
+def test_diff_of_an_unchanged_document_writes_nothing():
+    document = _load_fixture()
+    changes = _diff(document, _stored(_fingerprints(document)))
+    assert changes['added'] == changes['changed'] == changes['removed'] == []
+    assert len(changes['unchanged']) == len(_fingerprints(document))
+
+def test_diff_detects_added_changed_and_removed_operations():
+    document = _load_fixture()
+    stored = _stored(_fingerprints(document))
+
+    del document['paths']['/service/tickets/{id}']['delete']
+    document['paths']['/service/tickets/{id}']['put']['summary'] = 'Replace a ticket'
+    document['paths']['/service/boards/{id}/archive'] = {
+        'post': {'operationId': 'archiveBoard', 'responses': {'204': {'description': 'No Content'}}}
+    }
+    changes = _diff(document, stored)
+
+    assert changes['added'] == [('/service/boards/{id}/archive', 'post')]
+    assert changes['changed'] == [('/service/tickets/{id}', 'put')]
+    assert changes['removed'] == [('/service/tickets/{id}', 'delete')]
+
+def test_changed_component_schema_flips_the_fingerprints_of_its_operations():
+    document = _load_fixture()
+    before = _fingerprints(document)
+    document['components']['schemas']['BoardReference']['properties']['code'] = {'type': 'string'}
+    after = _fingerprints(document)
+
+    changed = {key for key in before if before[key] != after[key]}
+    assert ('/service/tickets/{id}', 'get') in changed
+    assert ('/service/tickets/{id}', 'delete') not in changed
+    assert ('/service/tickets/count', 'get') not in changed
+
+def test_changed_example_flips_the_fingerprint():
+    document = _load_fixture()
+    before = _fingerprints(document)
+    content = document['paths']['/service/tickets/{id}']['get']['responses']['200']['content']['application/json']
+    content['example'] = {'id': 1, 'summary': 'Printer offline'}
+    after = _fingerprints(document)
+
+    assert {key for key in before if before[key] != after[key]} == {('/service/tickets/{id}', 'get')}
+
+def test_deleting_endpoints_removes_child_rows_and_unreferenced_schemas():
+    sqlalchemy = pytest.importorskip('sqlalchemy')
+    engine = sqlalchemy.create_engine('sqlite://')
+    with engine.begin() as conn:
+        for statement in (
+            "CREATE TABLE endpoints (id INTEGER PRIMARY KEY, path TEXT, method TEXT, fingerprint TEXT)",
+            "CREATE TABLE schemas (id INTEGER PRIMARY KEY, hash TEXT)",
+            "CREATE TABLE parameters (id INTEGER PRIMARY KEY, endpoint_id INTEGER)",
+            "CREATE TABLE request_bodies (id INTEGER PRIMARY KEY, endpoint_id INTEGER, schema_id INTEGER)",
+            "CREATE TABLE response_bodies (id INTEGER PRIMARY KEY, endpoint_id INTEGER, schema_id INTEGER)",
+            "CREATE TABLE endpoint_terms (term TEXT, endpoint_id INTEGER, weight REAL)",
+            "INSERT INTO endpoints VALUES (1, '/service/tickets', 'get', 'a'), (2, '/service/tickets', 'post', 'b'), "
+            "(3, '/service/boards', 'get', 'c')",
+            "INSERT INTO schemas VALUES (1, 'ticket'), (2, 'ticket-create'), (3, 'board')",
+            "INSERT INTO parameters VALUES (1, 1), (2, 2), (3, 3)",
+            "INSERT INTO request_bodies VALUES (1, 2, 2)",
+            "INSERT INTO response_bodies VALUES (1, 1, 1), (2, 2, 1), (3, 3, 3)",
+            "INSERT INTO endpoint_terms VALUES ('ticket', 1, 1.0), ('ticket', 2, 1.0), ('board', 3, 1.0)",
+        ):
+            conn.exec_driver_sql(statement)
+
+        json_to_postgres.delete_endpoints(conn, [2, 3])
+        conn.execute(sqlalchemy.text(json_to_postgres.DELETE_UNUSED_SCHEMAS))
+
+        assert set(json_to_postgres.stored_endpoints(conn)) == {('/service/tickets', 'get')}
+        for table in json_to_postgres.CHILD_TABLES:
+            endpoint_ids = {row[0] for row in conn.exec_driver_sql(f"SELECT endpoint_id FROM {table}")}
+            assert endpoint_ids <= {1}, table
+        # The ticket schema is still referenced by the remaining endpoint
+        assert [row[0] for row in conn.exec_driver_sql("SELECT hash FROM schemas")] == ['ticket']
@@ -0,0 +1,66 @@
+from api_gateway.lru import BoundedLRU
+
+def test_bytes_track_stores_replacements_and_evictions():
+    cache = BoundedLRU(max_entries=10, max_bytes=100)
+    cache.set('a', 'first', 30)
+    cache.set('b', 'second', 30)
+    assert cache.stats()['bytes'] == 60
+
+    cache.set('a', 'replaced', 50)
+    assert cache.stats()['bytes'] == 80
+    assert cache.stats()['evictions'] == 0
+
+    cache.get('b')
+    cache.set('c', 'third', 40)
+    # 'a' was least recently used, and dropping it alone brings the total back within bounds
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 70
+    assert cache.stats()['evictions'] == 1
+
+def test_value_larger_than_max_bytes_is_not_stored():
+    cache = BoundedLRU(max_entries=10, max_bytes=100)
+    cache.set('small', 1, 10)
+    cache.set('huge', 2, 101)
+    assert cache.get('huge') is None
+    assert cache.stats()['bytes'] == 10 and len(cache) == 1
+
+def test_entry_limit_evicts_the_least_recently_used():
+    cache = BoundedLRU(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+def test_zero_entries_disables_caching():
+    cache = BoundedLRU(max_entries=0)
+    cache.set('a', 1)
+    assert cache.get('a') is None and len(cache) == 0
+
+def test_new_generation_clears_entries_and_bytes():
+    cache = BoundedLRU(max_entries=10, max_bytes=100)
+    cache.set_generation(1)
+    cache.set('a', 1, 40)
+
+    cache.set_generation(1)
+    assert cache.get('a') == 1
+
+    cache.set_generation(2)
+    assert cache.get('a') is None
+    assert cache.stats()['bytes'] == 0 and cache.stats()['generation'] == 2
+
+    # The byte budget is whole again after the clear
+    cache.set('b', 2, 100)
+    assert cache.get('b') == 2
+    assert cache.stats()['evictions'] == 0
+
+def test_clear_keeps_the_generation():
+    cache = BoundedLRU(max_entries=10, max_bytes=100)
+    cache.set_generation(3)
+    cache.set('a', 1, 10)
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()['bytes'] == 0
+    cache.set_generation(3)
+    cache.set('a', 1, 10)
+    assert cache.get('a') == 1
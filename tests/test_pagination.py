@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from api_gateway.pagination import Paginator
+
+class FakeEndpoint:
+    """A list endpoint with a /count sibling, serving numbered or forward-only pages"""
+    def __init__(self, total: int, countable: bool = True, delays: dict = None):
+        self.records = [{'id': record_id} for record_id in range(1, total + 1)]
+        self.count = total
+        self.countable = countable
+        self.delays = delays or {}
+        self.requests = []
+        self.cancelled = []
+
+    async def fetch(self, path, params):
+        self.requests.append((path, dict(params)))
+        if path.endswith('/count'):
+            if not self.countable:
+                raise RuntimeError('404 Not Found')
+            return {'count': self.count}
+
+        size = params['pageSize']
+        if 'pageId' in params:
+            start = params['pageId']
+        else:
+            start = (params.get('page', 1) - 1) * size
+        try:
+            await asyncio.sleep(self.delays.get(params.get('page'), 0))
+        except asyncio.CancelledError:
+            self.cancelled.append(params.get('page'))
+            raise
+        return self.records[start:start + size]
+
+    def page_sizes(self):
+        return [params['pageSize'] for path, params in self.requests if not path.endswith('/count')]
+
+def _collect(paginator, max_items=None, style='page'):
+    async def scenario():
+        return [item['id'] async for item in paginator.iter_items('/service/tickets', {}, max_items=max_items, style=style)]
+    return asyncio.run(scenario())
+
+@pytest.mark.parametrize('style, countable', [('page', True), ('page', False), ('pageId', False)])
+def test_page_size_is_capped_at_max_items(style, countable):
+    endpoint = FakeEndpoint(50, countable=countable)
+    paginator = Paginator(endpoint.fetch, page_size=1000, concurrency=2)
+    assert _collect(paginator, max_items=5, style=style) == [1, 2, 3, 4, 5]
+    assert endpoint.page_sizes() == [5]
+
+def test_every_item_is_streamed_in_order_without_max_items():
+    endpoint = FakeEndpoint(23)
+    paginator = Paginator(endpoint.fetch, page_size=5, concurrency=3)
+    assert _collect(paginator) == list(range(1, 24))
+    assert paginator.pages_fetched == 5
+    assert paginator.total == 23 and not paginator.truncated
+
+@pytest.mark.parametrize('total, max_items, truncated', [(12, 5, True), (5, 5, False), (3, 5, False)])
+def test_truncation_is_reported_only_when_the_count_exceeds_max_items(total, max_items, truncated):
+    endpoint = FakeEndpoint(total)
+    paginator = Paginator(endpoint.fetch, page_size=1000)
+    assert len(_collect(paginator, max_items=max_items)) == min(total, max_items)
+    assert paginator.total == total
+    assert paginator.truncated is truncated
+
+@pytest.mark.parametrize('style', ['page', 'pageId'])
+@pytest.mark.parametrize('total, truncated', [(7, True), (4, False)])
+def test_truncation_without_a_count_follows_the_last_page(style, total, truncated):
+    endpoint = FakeEndpoint(total, countable=False)
+    paginator = Paginator(endpoint.fetch, page_size=1000)
+    assert len(_collect(paginator, max_items=5, style=style)) == min(total, 5)
+    assert paginator.total is None
+    assert paginator.truncated is truncated
+    # Reaching max_items does not fetch another page
+    assert paginator.pages_fetched == 1
+
+def test_prefetched_pages_are_cancelled_and_awaited_when_the_collection_shrank():
+    # Counted at 40 items, but page 1 comes back short and pages 2-4 are still in flight
+    endpoint = FakeEndpoint(40, delays={2: 10, 3: 10, 4: 10})
+    del endpoint.records[3:]
+
+    async def scenario():
+        paginator = Paginator(endpoint.fetch, page_size=10, concurrency=4)
+        items = [item['id'] async for item in paginator.iter_items('/service/tickets', {})]
+        # The cancelled fetches have finished by the time iteration ends
+        cancelled_on_exit = sorted(endpoint.cancelled)
+        pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        return items, cancelled_on_exit, pending
+
+    items, cancelled_on_exit, pending = asyncio.run(scenario())
+    assert items == [1, 2, 3]
+    assert cancelled_on_exit == [2, 3, 4]
+    assert pending == []
@@ -0,0 +1,71 @@
+import pytest
+
+from api_gateway.path_router import PathRouter, split_path
+
+ROUTES = [
+    ('/company/companies', 'GET', 1),
+    ('/company/companies', 'POST', 2),
+    ('/company/companies/{id}', 'GET', 3),
+    ('/company/companies/count', 'GET', 4),
+    ('/company/companies/{parentId}/contacts', 'GET', 5),
+    ('/company/companies/{parentId}/contacts/{id}', 'GET', 6),
+    ('/company/companies/{companyId}/sites/{siteId}', 'GET', 7),
+    ('/company/companies/types/info', 'GET', 8),
+    ('/service/tickets/{id}', 'PATCH', 9),
+]
+
+@pytest.fixture(scope='module')
+def router():
+    return PathRouter(ROUTES)
+
+@pytest.mark.parametrize('path, method, expected', [
+    # A literal segment wins over {param}
+    ('/company/companies/count', 'GET', (4, {})),
+    ('/company/companies/123', 'GET', (3, {'id': '123'})),
+    # Each template keeps its own parameter names below a shared {param} node
+    ('/company/companies/12/contacts', 'GET', (5, {'parentId': '12'})),
+    ('/company/companies/12/contacts/34', 'GET', (6, {'parentId': '12', 'id': '34'})),
+    ('/company/companies/12/sites/56', 'GET', (7, {'companyId': '12', 'siteId': '56'})),
+    # The 'types' literal branch dead-ends, so the {param} branch is tried
+    ('/company/companies/types', 'GET', (3, {'id': 'types'})),
+    ('/company/companies/types/contacts', 'GET', (5, {'parentId': 'types'})),
+    ('/company/companies/types/info', 'GET', (8, {})),
+    # Trailing and repeated slashes, literal case and method case do not matter
+    ('/company/companies/', 'get', (1, {})),
+    ('company//companies/COUNT/', 'GET', (4, {})),
+    ('/Company/Companies/AbC/Contacts', 'GET', (5, {'parentId': 'AbC'})),
+    ('/company/companies', 'post', (2, {})),
+    ('/service/tickets/7', 'PATCH', (9, {'id': '7'})),
+])
+def test_match(router, path, method, expected):
+    assert router.match(path, method) == expected
+
+@pytest.mark.parametrize('path, method', [
+    ('/company/companies/1/unknown', 'GET'),
+    ('/company/companies/1/contacts/2/extra', 'GET'),
+    ('/company', 'GET'),
+    ('/', 'GET'),
+    ('/company/companies/1', 'DELETE'),
+    ('/service/tickets/7', 'GET'),
+])
+def test_no_match(router, path, method):
+    assert router.match(path, method) is None
+
+def test_method_mismatch_on_a_literal_falls_back_to_the_param_branch():
+    router = PathRouter([('/system/members/me', 'GET', 1), ('/system/members/{id}', 'PATCH', 2)])
+    assert router.match('/system/members/me', 'PATCH') == (2, {'id': 'me'})
+    assert router.match('/system/members/me', 'GET') == (1, {})
+
+def test_first_template_wins_when_only_parameter_names_differ():
+    router = PathRouter([('/service/tickets/{id}', 'GET', 1), ('/service/tickets/{ticketId}', 'GET', 2)])
+    assert router.route_count == 1
+    assert router.match('/service/tickets/5', 'GET') == (1, {'id': '5'})
+
+def test_braces_alone_are_a_literal_segment():
+    router = PathRouter([('/odd/{}', 'GET', 1)])
+    assert router.match('/odd/{}', 'GET') == (1, {})
+    assert router.match('/odd/5', 'GET') is None
+
+def test_split_path():
+    assert split_path('//service/tickets//5/') == ['service', 'tickets', '5']
+    assert split_path('/') == []
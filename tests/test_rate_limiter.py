@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from api_gateway.rate_limiter import AdaptiveRateLimiter, parse_retry_after
+
+CONFIG = {
+    'enabled': True, 'rate': 10.0, 'min_rate': 1.0, 'max_rate': 20.0, 'burst': 2.0,
+    'decrease_factor': 0.5, 'increase_step': 0.1
+}
+
+class FakeTime:
+    """Monotonic clock whose sleep advances the clock instead of waiting"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await asyncio.sleep(0)
+
+def _limiter(fake_time: FakeTime, **config) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter({**CONFIG, **config}, clock=fake_time, sleep=fake_time.sleep)
+
+def _acquire(limiter: AdaptiveRateLimiter, count: int = 1) -> None:
+    async def scenario():
+        for _ in range(count):
+            await limiter.acquire()
+    asyncio.run(scenario())
+
+def test_burst_is_served_immediately_then_paced_at_the_rate():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time)
+    _acquire(limiter, 4)
+    assert fake_time.sleeps == pytest.approx([0.1, 0.1])
+    assert limiter.acquired_total == 4
+
+def test_throttle_decreases_the_rate_multiplicatively_down_to_the_minimum():
+    limiter = _limiter(FakeTime())
+    rates = []
+    for _ in range(5):
+        limiter.on_throttle()
+        rates.append(limiter.rate)
+    assert rates == [5.0, 2.5, 1.25, 1.0, 1.0]
+    assert limiter.throttled_total == 5
+
+def test_success_increases_the_rate_additively_up_to_the_maximum():
+    limiter = _limiter(FakeTime())
+    limiter.on_throttle()
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == pytest.approx(6.0)
+    for _ in range(500):
+        limiter.on_success()
+    assert limiter.rate == 20.0
+
+def test_throttle_empties_the_bucket():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time)
+    limiter.on_throttle()
+    _acquire(limiter)
+    # The bucket refills at the lowered rate of 5 requests per second
+    assert fake_time.sleeps == pytest.approx([0.2])
+
+def test_retry_after_pauses_the_bucket():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time)
+    limiter.on_throttle(retry_after=3.0)
+    assert limiter.snapshot()['paused_for_seconds'] == 3.0
+
+    _acquire(limiter)
+    # After the pause the bucket has refilled, so no further wait is needed
+    assert fake_time.sleeps == pytest.approx([3.0])
+    assert limiter.snapshot()['paused_for_seconds'] == 0.0
+
+def test_shorter_retry_after_does_not_cut_an_existing_pause():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time)
+    limiter.on_throttle(retry_after=10.0)
+    fake_time.now += 2
+    limiter.on_throttle(retry_after=1.0)
+    assert limiter.snapshot()['paused_for_seconds'] == 8.0
+
+def test_retry_after_pause_is_capped():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time, max_retry_after=60.0)
+    limiter.on_throttle(retry_after=1e9)
+    assert limiter.snapshot()['paused_for_seconds'] == 60.0
+
+def test_disabled_limiter_never_waits():
+    fake_time = FakeTime()
+    limiter = _limiter(fake_time, enabled=False)
+    limiter.on_throttle(retry_after=30.0)
+    _acquire(limiter, 10)
+    assert fake_time.sleeps == []
+    assert limiter.acquired_total == 0
+
+@pytest.mark.parametrize('value, expected', [
+    ('120', 120.0),
+    (' 1.5 ', 1.5),
+    ('-5', 0.0),
+    ('1e9', 1e9),
+    ('inf', None),
+    ('-inf', None),
+    ('nan', None),
+    ('Wed, 21 Oct 2026 07:29:30 GMT', 90.0),
+    ('Wed, 21 Oct 2026 07:27:00 GMT', 0.0),
+    ('soon', None),
+    ('', None),
+    (None, None),
+])
+def test_parse_retry_after(value, expected):
+    now = datetime(2026, 10, 21, 7, 28, 0, tzinfo=timezone.utc)
+    assert parse_retry_after(value, now=now) == expected
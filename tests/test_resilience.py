@@ -0,0 +1,164 @@
+import random
+
+import pytest
+
+from api_gateway.resilience import RetryPolicy, RetryBudget, CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+class UpperBoundRandom:
+    """Stands in for random.Random and always picks the top of the range"""
+    def uniform(self, low, high):
+        return high
+
+RETRY_CONFIG = {'max_attempts': 3, 'base_delay': 0.5, 'max_delay': 8.0, 'budget_ratio': 0.2, 'budget_min_per_second': 1.0}
+BREAKER_CONFIG = {'failure_threshold': 3, 'reset_timeout': 30.0, 'half_open_max_calls': 2}
+
+@pytest.mark.parametrize('method, attempt, status_code, expected', [
+    ('GET', 1, None, True),
+    ('get', 2, 503, True),
+    ('DELETE', 1, 500, True),
+    ('GET', 3, 503, False),
+    ('POST', 1, 503, False),
+    ('PATCH', 1, None, False),
+    ('GET', 1, 404, False),
+    ('GET', 1, 429, False),
+])
+def test_only_idempotent_transient_failures_are_retried(method, attempt, status_code, expected):
+    assert RetryPolicy(RETRY_CONFIG).is_retryable(method, attempt, status_code) is expected
+
+def test_backoff_ceiling_doubles_up_to_the_maximum():
+    policy = RetryPolicy(RETRY_CONFIG, rng=UpperBoundRandom())
+    assert [policy.backoff(attempt) for attempt in range(1, 8)] == [0.5, 1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+
+def test_backoff_uses_full_jitter():
+    policy = RetryPolicy(RETRY_CONFIG, rng=random.Random(7))
+    delays = [policy.backoff(4) for _ in range(2000)]
+    assert all(0 <= delay <= 4.0 for delay in delays)
+    # Full jitter spreads delays over the whole range instead of clustering near the ceiling
+    assert min(delays) < 0.1 and max(delays) > 3.9
+    assert 1.8 < sum(delays) / len(delays) < 2.2
+
+def test_retry_budget_is_exhausted_after_the_initial_balance():
+    clock = FakeClock()
+    budget = RetryBudget(RETRY_CONFIG, clock=clock)
+    assert all(budget.try_spend() for _ in range(10))
+    assert not budget.try_spend()
+    assert budget.snapshot() == {'available_retries': 0.0, 'exhausted_total': 1}
+
+def test_retry_budget_refills_with_time_and_traffic():
+    clock = FakeClock()
+    budget = RetryBudget(RETRY_CONFIG, clock=clock)
+    while budget.try_spend():
+        pass
+
+    clock.advance(0.5)
+    assert not budget.try_spend()
+    for _ in range(3):
+        budget.record_request()
+    # 0.5s at 1 retry/s plus 3 requests at 0.2 retries each
+    assert budget.snapshot()['available_retries'] == pytest.approx(1.1)
+    assert budget.try_spend()
+    assert not budget.try_spend()
+
+def test_retry_budget_balance_is_capped():
+    clock = FakeClock()
+    budget = RetryBudget(RETRY_CONFIG, clock=clock)
+    clock.advance(3600)
+    for _ in range(100):
+        budget.record_request()
+    assert budget.snapshot()['available_retries'] == 10.0
+    assert sum(budget.try_spend() for _ in range(20)) == 10
+
+def _open_breaker(clock: FakeClock) -> CircuitBreaker:
+    breaker = CircuitBreaker('api.example.com', BREAKER_CONFIG, clock=clock)
+    for _ in range(3):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    return breaker
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker('api.example.com', BREAKER_CONFIG, clock=FakeClock())
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_open_breaker_fails_fast_until_the_reset_timeout():
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+
+    clock.advance(10)
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_request()
+    assert raised.value.retry_in == pytest.approx(20)
+
+    clock.advance(19.9)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    assert breaker.snapshot() == {'state': CircuitBreaker.OPEN, 'consecutive_failures': 3, 'rejected_total': 2}
+
+def test_half_open_breaker_limits_probes_and_closes_on_success():
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+    clock.advance(30)
+
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError) as raised:
+        breaker.before_request()
+    assert raised.value.retry_in == 0
+
+    # A probe that ends without an outcome gives its slot back
+    breaker.release()
+    breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    for _ in range(5):
+        breaker.before_request()
+    assert breaker.snapshot()['consecutive_failures'] == 0
+
+def test_failed_probe_reopens_the_breaker_for_a_full_timeout():
+    clock = FakeClock()
+    breaker = _open_breaker(clock)
+    clock.advance(30)
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.advance(29)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    clock.advance(1)
+    breaker.before_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+def test_registry_keeps_one_breaker_per_host_on_the_shared_clock():
+    clock = FakeClock()
+    registry = CircuitBreakerRegistry(BREAKER_CONFIG, clock=clock)
+    assert registry.get('a.example.com') is registry.get('a.example.com')
+    for _ in range(3):
+        registry.get('a.example.com').record_failure()
+    registry.get('b.example.com').before_request()
+
+    clock.advance(30)
+    registry.get('a.example.com').before_request()
+    assert registry.snapshot()['a.example.com']['state'] == CircuitBreaker.HALF_OPEN
+    assert registry.snapshot()['b.example.com']['state'] == CircuitBreaker.CLOSED
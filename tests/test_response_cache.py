@@ -0,0 +1,129 @@
+import pytest
+
+from api_gateway.response_cache import ResponseCache, normalize_api_path, request_fingerprint
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+CONFIG = {
+    'enabled': True, 'max_entries': 100, 'max_bytes': 10000, 'default_ttl': 60,
+    'category_ttls': {'service': 30, 'system': 600, 'finance': 0}
+}
+
+def _cache(clock=None, **config) -> ResponseCache:
+    return ResponseCache({**CONFIG, **config}, clock=clock or FakeClock())
+
+@pytest.mark.parametrize('path, expected', [
+    ('/Service/Tickets/', '/service/tickets'),
+    ('service//tickets/123', '/service/tickets/123'),
+    ('/service/tickets?page=2', '/service/tickets'),
+    ('', '/'),
+])
+def test_normalize_api_path(path, expected):
+    assert normalize_api_path(path) == expected
+
+def test_keys_ignore_param_order_and_path_spelling():
+    assert request_fingerprint('get', '/Service/Tickets/', {'page': 1, 'pageSize': 25}) == \
+        request_fingerprint('GET', '/service/tickets', {'pageSize': 25, 'page': 1})
+
+    cache = _cache()
+    cache.set('/service/tickets', {'conditions': 'id>1', 'page': 2}, ['page 2'], 10)
+    assert cache.get('/Service/Tickets', {'page': 2, 'conditions': 'id>1'}) == ['page 2']
+    assert cache.get('/service/tickets', {'page': 3, 'conditions': 'id>1'}) is None
+
+@pytest.mark.parametrize('path, ttl', [
+    ('/service/tickets', 30),
+    ('/system/members', 600),
+    ('/company/companies', 60),
+])
+def test_entries_expire_after_the_category_ttl(path, ttl):
+    clock = FakeClock()
+    cache = _cache(clock)
+    assert cache.ttl_for(path) == ttl
+    cache.set(path, None, {'id': 1}, 10)
+
+    clock.advance(ttl - 0.5)
+    assert cache.get(path) == {'id': 1}
+    clock.advance(0.5)
+    assert cache.get(path) is None
+    assert cache.stats()['entries'] == 0 and cache.stats()['bytes'] == 0
+
+def test_zero_ttl_and_oversized_responses_are_not_cached():
+    cache = _cache()
+    cache.set('/finance/invoices', None, [1], 10)
+    cache.set('/service/tickets', None, [1], CONFIG['max_bytes'] + 1)
+    assert cache.stats()['entries'] == 0
+
+def test_least_recently_used_entry_is_evicted_by_count():
+    cache = _cache(max_entries=3)
+    for record_id in range(1, 4):
+        cache.set(f'/service/tickets/{record_id}', None, record_id, 10)
+    cache.get('/service/tickets/1')
+    cache.set('/service/tickets/4', None, 4, 10)
+
+    assert cache.get('/service/tickets/2') is None
+    assert [cache.get(f'/service/tickets/{record_id}') for record_id in (1, 3, 4)] == [1, 3, 4]
+    assert cache.stats()['evictions'] == 1
+
+def test_least_recently_used_entries_are_evicted_by_bytes():
+    cache = _cache(max_bytes=100)
+    cache.set('/service/tickets/1', None, 1, 40)
+    cache.set('/service/tickets/2', None, 2, 40)
+    cache.get('/service/tickets/1')
+    cache.set('/service/tickets/3', None, 3, 50)
+
+    assert cache.get('/service/tickets/2') is None
+    assert cache.get('/service/tickets/1') == 1
+    assert cache.stats()['bytes'] == 90
+
+    # Replacing an entry releases its old size
+    cache.set('/service/tickets/1', None, 'one', 10)
+    assert cache.stats()['bytes'] == 60
+
+def test_invalidate_covers_the_path_sub_paths_parent_and_parent_count():
+    cache = _cache()
+    affected = [
+        '/service/tickets/5', '/service/tickets/5/notes', '/service/tickets/5/notes/7',
+        '/service/tickets', '/service/tickets/count'
+    ]
+    unaffected = ['/service/tickets/6', '/service/tickets/50', '/service/boards', '/service/boards/count']
+    for path in affected + unaffected:
+        cache.set(path, {'page': 1}, path, 10)
+
+    assert cache.invalidate('/Service/Tickets/5/') == len(affected)
+    assert [path for path in affected if cache.get(path, {'page': 1}) is not None] == []
+    assert [cache.get(path, {'page': 1}) for path in unaffected] == unaffected
+    assert cache.stats()['invalidations'] == len(affected)
+
+def test_version_changes_only_for_paths_a_write_affects():
+    cache = _cache()
+    paths = ['/service/tickets', '/service/tickets/count', '/service/tickets/5', '/service/tickets/5/notes',
+             '/service/tickets/6', '/service/boards']
+    before = {path: cache.version(path) for path in paths}
+    cache.invalidate('/service/tickets/5')
+    changed = [path for path in paths if cache.version(path) != before[path]]
+    assert changed == ['/service/tickets', '/service/tickets/count', '/service/tickets/5', '/service/tickets/5/notes']
+
+def test_set_with_a_stale_version_is_dropped():
+    cache = _cache()
+    version = cache.version('/service/tickets')
+    cache.invalidate('/service/tickets/5')
+    cache.set('/service/tickets', None, ['stale'], 10, version=version)
+    assert cache.get('/service/tickets') is None
+    assert cache.stats()['stale_sets'] == 1
+
+    cache.set('/service/tickets', None, ['fresh'], 10, version=cache.version('/service/tickets'))
+    assert cache.get('/service/tickets') == ['fresh']
+
+def test_disabled_cache_stores_nothing():
+    cache = _cache(enabled=False)
+    cache.set('/service/tickets', None, [1], 10)
+    assert cache.get('/service/tickets') is None
+    assert cache.stats()['entries'] == 0
@@ -0,0 +1,98 @@
+import itertools
+import json
+import os
+
+import pytest
+
+from schema_resolver import SchemaResolver, schema_hash
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'fixtures', 'sample_openapi.json')
+
+def ref(name):
+    return {'$ref': f'#/components/schemas/{name}'}
+
+COMPONENTS = {
+    'Member': {'type': 'object', 'properties': {'name': {'type': 'string'}, 'company': ref('Company')}},
+    'Company': {'type': 'object', 'properties': {'owner': ref('Member'), 'parent': ref('Company'), 'site': ref('Site')}},
+    'Site': {'type': 'object', 'properties': {'name': {'type': 'string'}}},
+    'Ticket': {'type': 'object', 'properties': {'company': ref('Company'), 'items': {'type': 'array', 'items': ref('Site')}}},
+    'A': {'properties': {'b': ref('B')}},
+    'B': {'properties': {'c': ref('C')}},
+    'C': {'properties': {'d': ref('D')}},
+    'D': {'properties': {'value': {'type': 'string'}}}
+}
+
+BODIES = ['Member', 'Company', 'Ticket', 'Site', 'A', 'B', 'C']
+
+def standalone(name, max_depth=8):
+    return SchemaResolver(COMPONENTS, max_depth).resolve_body(ref(name))
+
+def test_cycle_is_marked():
+    company = standalone('Company')
+    owner = company['properties']['owner']
+    assert owner['properties']['name'] == {'type': 'string'}
+    assert owner['properties']['company'] == {'type': 'object', 'x-circular-ref': 'Company'}
+    assert company['properties']['parent'] == {'type': 'object', 'x-circular-ref': 'Company'}
+
+def test_component_keeps_fields_of_enclosing_cycle_member():
+    resolver = SchemaResolver(COMPONENTS)
+    resolver.resolve_body(ref('Member'))
+    company = resolver.resolve_body(ref('Company'))
+    # Member was resolved first, but Company still expands Member's fields
+    assert company['properties']['owner']['properties']['name'] == {'type': 'string'}
+    assert company == standalone('Company')
+
+@pytest.mark.parametrize('max_depth', [1, 2, 3, 8])
+def test_results_do_not_depend_on_resolution_order(max_depth):
+    expected = {name: schema_hash(standalone(name, max_depth)) for name in BODIES}
+    for order in itertools.permutations(BODIES, 4):
+        resolver = SchemaResolver(COMPONENTS, max_depth)
+        for name in order + tuple(BODIES):
+            assert schema_hash(resolver.resolve_body(ref(name))) == expected[name], (order, name)
+
+def test_depth_limit():
+    a = standalone('A', max_depth=2)
+    assert a == {'properties': {'b': {'properties': {'c': {'type': 'object', 'x-truncated-ref': 'C'}}}}}
+    assert standalone('A', max_depth=4)['properties']['b']['properties']['c']['properties']['d'] == COMPONENTS['D']
+
+def test_memoized_component_is_not_reused_beyond_the_depth_limit():
+    resolver = SchemaResolver(COMPONENTS, max_depth=3)
+    b = resolver.resolve_body(ref('B'))
+    assert b['properties']['c']['properties']['d'] == COMPONENTS['D']
+    a = resolver.resolve_body(ref('A'))
+    # B is complete with three levels, but inside A only two are left
+    assert a['properties']['b']['properties']['c']['properties']['d'] == {'type': 'object', 'x-truncated-ref': 'D'}
+
+def test_acyclic_components_are_resolved_once():
+    resolver = SchemaResolver(COMPONENTS)
+    for _ in range(3):
+        for name in ('A', 'B', 'C', 'D', 'Site'):
+            resolver.resolve_body(ref(name))
+    assert resolver.stats['components'] == 5
+    assert resolver.resolve_body(ref('B')) is resolver.resolve_body(ref('A'))['properties']['b']
+
+def test_array_bodies_and_unknown_references():
+    resolver = SchemaResolver(COMPONENTS)
+    body = resolver.resolve_body({'type': 'array', 'items': ref('Site')})
+    assert body == {'type': 'array', 'items': [COMPONENTS['Site']]}
+    assert resolver.resolve_body({'type': 'array', 'items': ref('Site')}) is body
+    assert resolver.resolve_body(ref('Missing'))['type'] == 'parsing-error'
+    assert resolver.stats['unresolved'] == 1
+
+def test_fixture_bodies_do_not_depend_on_order():
+    with open(FIXTURE) as f:
+        document = json.load(f)
+    bodies = [
+        media['schema']
+        for path_item in document['paths'].values()
+        for operation in path_item.values() if isinstance(operation, dict)
+        for container in [operation.get('requestBody', {})] + list(operation.get('responses', {}).values())
+        for media in container.get('content', {}).values() if 'schema' in media
+    ]
+    components = document['components']['schemas']
+
+    forward = SchemaResolver(components)
+    backward = SchemaResolver(components)
+    hashes = [forward.hash(forward.resolve_body(body)) for body in bodies]
+    reversed_hashes = [backward.hash(backward.resolve_body(body)) for body in reversed(bodies)]
+    assert hashes == list(reversed(reversed_hashes))
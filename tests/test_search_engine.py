@@ -0,0 +1,128 @@
+import re
+
+import pytest
+
+from api_gateway.search_engine import SearchEngine, KEYWORD_COLUMNS
+
+ALL = {'fulltext': True, 'websearch': True, 'trigram': True, 'terms': True}
+NO_FULLTEXT = dict(ALL, fulltext=False)
+NO_WEBSEARCH = dict(ALL, websearch=False)
+NO_TERMS = dict(ALL, terms=False)
+NOTHING = {'fulltext': False, 'websearch': False, 'trigram': False, 'terms': False}
+
+def _build(capabilities, query='open tickets', patterns=('tickets',), limit=10, **options):
+    return SearchEngine(session_factory=None).build(query, patterns, limit, capabilities, **options)
+
+def _bound_names(sql):
+    # ':name' placeholders, not '::type' casts
+    return set(re.findall(r'(?<![:\w]):(\w+)', sql))
+
+def _ctes(sql):
+    return re.findall(r'(\w+) AS \(', sql)
+
+@pytest.mark.parametrize('capabilities, options', [
+    (ALL, {}),
+    (ALL, {'terms': ['ticket']}),
+    (NO_FULLTEXT, {}),
+    (NO_WEBSEARCH, {}),
+    (NO_TERMS, {'terms': ['ticket']}),
+    (ALL, {'with_total': True, 'offset': 20}),
+    (ALL, {'limit': None, 'offset': 5}),
+    (ALL, {'highlights': True}),
+])
+def test_every_placeholder_is_bound(capabilities, options):
+    sql, params = _build(capabilities, **options)
+    # The query text is passed even when no full-text tier reads it
+    assert _bound_names(sql) == set(params) - ({'query'} if not capabilities['fulltext'] else set())
+
+def test_all_capabilities_gather_every_tier():
+    sql, params = _build(ALL)
+
+    assert _ctes(sql) == ['search_query', 'fulltext', 'plain', 'keyword', 'hits']
+    assert "websearch_to_tsquery('english', :query) AS primary_query" in sql
+    assert "plainto_tsquery('english', :query) AS plain_query" in sql
+    assert 'ts_rank_cd(e.search_vector, q.primary_query)' in sql
+    assert 'AND NOT EXISTS (SELECT 1 FROM fulltext)\n                AND NOT EXISTS (SELECT 1 FROM plain)' in sql
+    assert 'total_count' not in sql
+    assert params == {
+        'query': 'open tickets', 'window_val': 10, 'limit_val': 10,
+        'pattern_0': '%tickets%', 'keywords': 'tickets'
+    }
+
+def test_without_fulltext_only_the_keyword_tier_runs():
+    sql, params = _build(NO_FULLTEXT)
+
+    assert _ctes(sql) == ['keyword', 'hits']
+    assert 'tsquery' not in sql and 'NOT EXISTS' not in sql
+    assert 'word_similarity(:keywords' in sql
+    assert params['pattern_0'] == '%tickets%'
+
+def test_without_websearch_plainto_tsquery_is_primary_and_there_is_no_plain_tier():
+    sql, _ = _build(NO_WEBSEARCH)
+
+    assert _ctes(sql) == ['search_query', 'fulltext', 'keyword', 'hits']
+    assert "plainto_tsquery('english', :query) AS primary_query" in sql
+    assert 'websearch_to_tsquery' not in sql and 'plain_query' not in sql
+
+def test_plain_fallback_can_be_turned_off():
+    sql, _ = _build(ALL, plain_fallback=False, fulltext_rank='ts_rank')
+    assert _ctes(sql) == ['search_query', 'fulltext', 'keyword', 'hits']
+    assert 'ts_rank(e.search_vector, q.primary_query)' in sql
+
+def test_terms_use_the_inverted_index():
+    sql, params = _build(ALL, terms=['ticket', 'open'])
+
+    assert _ctes(sql) == ['search_query', 'fulltext', 'plain', 'term_stats', 'keyword', 'hits']
+    assert 'FROM endpoint_terms' in sql and 'ILIKE' not in sql
+    assert params['terms'] == ['ticket', 'open']
+    assert 'pattern_0' not in params and 'keywords' not in params
+
+@pytest.mark.parametrize('capabilities, terms', [(NO_TERMS, ['ticket']), (ALL, [])])
+def test_ilike_patterns_are_used_without_the_index_or_terms(capabilities, terms):
+    sql, params = _build(capabilities, patterns=['service tickets', '', 'open'], terms=terms)
+
+    assert 'endpoint_terms' not in sql
+    assert params['pattern_0'] == '%service tickets%' and params['pattern_1'] == '%open%'
+    assert params['keywords'] == 'service tickets open'
+    assert 'terms' not in params
+    for column in KEYWORD_COLUMNS:
+        assert f'{column} ILIKE :pattern_1' in sql
+    # Only the first pattern decides the match priority
+    assert 'WHEN summary ILIKE :pattern_0 THEN 1' in sql and 'THEN 1' not in sql.split('pattern_1')[-1]
+
+def test_with_total_counts_the_answering_tier_and_keeps_the_page_window():
+    sql, params = _build(ALL, offset=20, with_total=True)
+
+    assert _ctes(sql) == ['search_query', 'fulltext', 'plain', 'keyword', 'hits', 'total', 'page']
+    assert 'WHEN EXISTS (SELECT 1 FROM fulltext) THEN (SELECT COUNT(*)' in sql
+    assert 'FROM total\n            LEFT JOIN page ON true' in sql
+    assert params['window_val'] == 30 and params['limit_val'] == 10 and params['offset_val'] == 20
+    assert 'LIMIT :limit_val\n            OFFSET :offset_val' in sql
+
+def test_offset_without_limit_skips_rows_without_limiting_any_tier():
+    sql, params = _build(ALL, limit=None, offset=5)
+
+    assert 'LIMIT' not in sql
+    assert sql.rstrip().endswith('OFFSET :offset_val')
+    assert params == {'query': 'open tickets', 'offset_val': 5, 'pattern_0': '%tickets%', 'keywords': 'tickets'}
+
+def test_highlights_need_fulltext():
+    sql, _ = _build(ALL, highlights=True)
+    assert 'CROSS JOIN search_query q' in sql and 'AS summary_highlight' in sql
+
+    sql, _ = _build(NO_FULLTEXT, highlights=True)
+    assert 'highlight' not in sql
+
+def test_columns_always_include_the_id_once():
+    sql, _ = _build(ALL, columns=('path', 'id', 'method'))
+    assert 'SELECT e.id, e.path, e.method, hits.rank' in sql
+
+@pytest.mark.parametrize('capabilities, patterns, terms', [
+    (NO_FULLTEXT, [], None),
+    (NO_FULLTEXT, ['', ''], None),
+    (NOTHING, [], ['ticket']),
+])
+def test_nothing_to_search_returns_no_sql(capabilities, patterns, terms):
+    sql, params = _build(capabilities, patterns=patterns, terms=terms, offset=5)
+    assert sql is None
+    assert params == {'query': 'open tickets', 'window_val': 15, 'limit_val': 10, 'offset_val': 5}
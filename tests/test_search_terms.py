@@ -0,0 +1,66 @@
+import pytest
+
+from search_terms import FIELD_WEIGHTS, stem, tokenize, endpoint_terms, query_terms
+
+@pytest.mark.parametrize('text, expected', [
+    ('getCompanyCompaniesByIdContacts', ['company', 'company', 'contact']),
+    ('HTTPServer', ['http', 'server', 'httpserver']),
+    ('APIKeys', ['api', 'key', 'apikey']),
+    ('companyTypeAssociations', ['company', 'type', 'association', 'companytypeassociation']),
+    ('service_tickets-notes', ['service', 'ticket', 'note']),
+    ('Show me all the open tickets', ['open', 'ticket']),
+    ('', []),
+    (None, []),
+])
+def test_tokenize_splits_identifiers_and_drops_stopwords(text, expected):
+    assert tokenize(text) == expected
+
+@pytest.mark.parametrize('path, expected', [
+    ('/company/companies/{id}/contacts', ['company', 'company', 'contact']),
+    ('/service/tickets/{parentId}/notes/{id}', ['service', 'ticket', 'note']),
+    ('/system/{documentType}/documents', ['system', 'document']),
+])
+def test_tokenize_drops_path_placeholders(path, expected):
+    assert tokenize(path) == expected
+
+@pytest.mark.parametrize('word, expected', [
+    ('companies', 'company'),
+    ('activities', 'activity'),
+    ('addresses', 'address'),
+    ('classes', 'class'),
+    ('boxes', 'box'),
+    ('batches', 'batch'),
+    ('dishes', 'dish'),
+    ('tickets', 'ticket'),
+    ('status', 'status'),
+    ('bonus', 'bonus'),
+    ('analysis', 'analysis'),
+    ('basis', 'basis'),
+    ('access', 'access'),
+    ('ties', 'tie'),
+    ('bus', 'bus'),
+    ('ticket', 'ticket'),
+])
+def test_stem_folds_plurals(word, expected):
+    assert stem(word) == expected
+
+def test_endpoint_terms_sum_the_weights_of_every_field_a_term_appears_in():
+    terms = endpoint_terms(
+        '/service/tickets/{id}', 'Get Ticket', 'Returns one service ticket', 'getServiceTicketsById',
+        ['Service Tickets']
+    )
+    assert terms == {
+        'ticket': sum(FIELD_WEIGHTS.values()),
+        'service': FIELD_WEIGHTS['path'] + FIELD_WEIGHTS['tags'] + FIELD_WEIGHTS['operation_id'] + FIELD_WEIGHTS['description'],
+        'return': FIELD_WEIGHTS['description'],
+        'one': FIELD_WEIGHTS['description'],
+    }
+
+def test_repeated_term_counts_once_per_field():
+    terms = endpoint_terms('/time/entries', 'Time entries and time sheets', '', '', [])
+    assert terms['time'] == FIELD_WEIGHTS['summary'] + FIELD_WEIGHTS['path']
+
+def test_query_terms_match_the_indexed_terms():
+    assert query_terms('the tickets for a ticket companies') == ['ticket', 'company']
+    indexed = endpoint_terms('/company/companies/{id}/contacts', 'Get Company Contacts', '', 'getCompanyCompaniesByIdContacts', [])
+    assert set(query_terms('contacts of companies')) <= set(indexed)
@@ -0,0 +1,67 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from search_terms import tokenize
+from semantic_search import SemanticIndex, expand_query
+
+CORPUS = {
+    1: 'finance invoices: invoices billed to a company',
+    2: 'finance invoice payments',
+    3: 'company companies sites',
+    4: 'company contacts',
+    5: 'service tickets boards',
+    6: 'service tickets notes',
+    7: 'time entries for a member',
+    8: 'system members time sheets',
+    9: 'service boards',
+    10: 'finance agreements company',
+}
+
+@pytest.fixture(scope='module')
+def index():
+    return SemanticIndex.build([(endpoint_id, tokenize(text)) for endpoint_id, text in CORPUS.items()], dimensions=8)
+
+def _search(index, query, limit=3, min_score=0.0):
+    return index.search(tokenize(query), limit, min_score)
+
+def test_synonyms_are_added_without_pairing_with_query_tokens():
+    assert expand_query(['person', 'list']) == ['person', 'list', 'person_list', 'contact']
+    assert expand_query(['customer', 'person']) == ['customer', 'person', 'customer_person', 'company', 'contact']
+    # A multi-word synonym keeps its own pair
+    assert expand_query(['hour']) == ['hour', 'time', 'entry', 'time_entry']
+
+@pytest.mark.parametrize('query, expected', [
+    ('customer bills', {1}),
+    ('employee hours', {7, 8}),
+    ('issue notes', {6}),
+])
+def test_paraphrase_finds_the_endpoint(index, query, expected):
+    results = _search(index, query)
+    assert {endpoint_id for endpoint_id, _ in results[:len(expected)]} == expected
+    scores = [score for _, score in results]
+    assert scores == sorted(scores, reverse=True)
+
+def test_min_score_filters_weak_matches(index):
+    assert [endpoint_id for endpoint_id, _ in _search(index, 'issue notes')] == [6, 5, 9]
+    assert [endpoint_id for endpoint_id, _ in _search(index, 'issue notes', min_score=0.5)] == [6, 5]
+    assert _search(index, 'issue notes', min_score=1.01) == []
+
+def test_unknown_query_terms_and_zero_limit_return_nothing(index):
+    assert _search(index, 'quantum entanglement') == []
+    assert _search(index, 'customer bills', limit=0) == []
+
+def test_bytes_round_trip(index):
+    loaded = SemanticIndex.from_bytes(index.to_bytes())
+    assert loaded.vocabulary == index.vocabulary
+    for name in ('idf', 'projection', 'matrix', 'endpoint_ids'):
+        assert np.array_equal(getattr(loaded, name), getattr(index, name))
+    assert loaded.stats() == index.stats()
+    assert _search(loaded, 'customer bills') == _search(index, 'customer bills')
+
+def test_empty_vocabulary_builds_an_index_that_matches_nothing():
+    index = SemanticIndex.build([(1, []), (2, [])])
+    assert index.stats()['features'] == 0
+    assert index.stats()['endpoints'] == 2
+    assert index.search(['ticket'], 5) == []
+    assert SemanticIndex.from_bytes(index.to_bytes()).search(['ticket'], 5) == []
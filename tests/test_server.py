@@ -0,0 +1,246 @@
+import os
+import sys
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from api_gateway import server
+from api_gateway.http_client import HTTPClientManager
+from api_gateway.rate_limiter import AdaptiveRateLimiter
+from api_gateway.response_cache import ResponseCache
+from api_gateway.streaming_json import PartialList
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+from mock_connectwise import start_mock_server
+
+@pytest.fixture(scope='module')
+def mock_url():
+    process, base_url = start_mock_server({'latency-ms': 0, 'jitter-ms': 0, 'records': 5000, 'record-bytes': 512})
+    try:
+        yield base_url
+    finally:
+        process.kill()
+        process.wait()
+
+@pytest.fixture
+def gateway(monkeypatch, mock_url):
+    monkeypatch.setattr(server, 'API_URL', mock_url)
+    monkeypatch.setattr(server, 'COMPANY_ID', 'company')
+    monkeypatch.setattr(server, 'PUBLIC_KEY', 'public')
+    monkeypatch.setattr(server, 'PRIVATE_KEY', 'private')
+    monkeypatch.setattr(server, 'http_clients', HTTPClientManager())
+    monkeypatch.setattr(server, 'response_cache', ResponseCache({'enabled': True, 'default_ttl': 60, 'category_ttls': {}}))
+    monkeypatch.setattr(server, 'rate_limiter', AdaptiveRateLimiter({'enabled': False}))
+    return mock_url
+
+def _mock_stats(base_url):
+    return httpx.get(f"{base_url}/_mock/stats").json()
+
+def _run(calls):
+    async def scenario():
+        try:
+            return [await call() for call in calls]
+        finally:
+            await server.http_clients.shutdown()
+    return asyncio.run(scenario())
+
+def _display_get(path, params=None, use_cache=True):
+    return lambda: server.make_api_request(
+        'GET', path, params, use_cache=use_cache, max_items=server.DISPLAY_ITEM_LIMIT
+    )
+
+def test_small_list_reuses_the_connection_and_is_returned_whole(gateway):
+    before = _mock_stats(gateway)
+    results = _run([_display_get('/service/tickets', use_cache=False) for _ in range(5)])
+    after = _mock_stats(gateway)
+
+    assert after['requests_total'] - before['requests_total'] == 5
+    assert after['connections_total'] - before['connections_total'] == 1
+    for result in results:
+        assert len(result) == 25
+        assert not isinstance(result, PartialList)
+    assert server.format_api_result(results[0]).startswith('Retrieved 25 items. Showing first 10:')
+
+def test_small_list_is_served_from_the_response_cache(gateway):
+    before = _mock_stats(gateway)
+    first, second = _run([_display_get('/service/tickets'), _display_get('/service/tickets')])
+    after = _mock_stats(gateway)
+
+    assert after['requests_total'] - before['requests_total'] == 1
+    assert second is first
+    assert server.response_cache.stats()['hits'] == 1
+
+def test_large_list_stops_reading_early(gateway):
+    params = {'pageSize': 1000}
+    result, = _run([_display_get('/service/tickets', params)])
+
+    assert isinstance(result, PartialList)
+    assert [record['id'] for record in result] == list(range(1, 11))
+    assert server.response_cache.stats()['entries'] == 0
+
+@pytest.mark.parametrize('retry_after', ['1e9', '3600'])
+def test_retry_after_beyond_the_maximum_fails_the_request_without_pausing(gateway, monkeypatch, retry_after):
+    limiter = AdaptiveRateLimiter({'enabled': True, 'max_retry_after': 60})
+    monkeypatch.setattr(server, 'rate_limiter', limiter)
+    sent = []
+
+    async def throttled(client, method, url, headers, params=None, data=None, stream=False):
+        sent.append(url)
+        return httpx.Response(429, headers={'Retry-After': retry_after}, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(server, '_dispatch_request', throttled)
+    with pytest.raises(server.APIError) as raised:
+        _run([lambda: server.make_api_request('GET', '/service/tickets', use_cache=False)])
+
+    assert raised.value.status_code == 429
+    assert 'RATE_LIMIT_MAX_RETRY_AFTER' in raised.value.message
+    assert len(sent) == 1
+    assert limiter.snapshot()['paused_for_seconds'] == 0.0
+    assert limiter.throttled_total == 1
+
+def test_non_finite_retry_after_is_ignored(gateway, monkeypatch):
+    limiter = AdaptiveRateLimiter({'enabled': True, 'max_retry_after': 60, 'max_throttle_retries': 1})
+    monkeypatch.setattr(server, 'rate_limiter', limiter)
+    responses = [(429, {'Retry-After': 'inf'}, b''), (200, {}, b'[{"id": 1}]')]
+
+    async def dispatch(client, method, url, headers, params=None, data=None, stream=False):
+        status_code, response_headers, body = responses.pop(0)
+        return httpx.Response(status_code, headers=response_headers, content=body, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(server, '_dispatch_request', dispatch)
+    result, = _run([lambda: server.make_api_request('GET', '/service/tickets', use_cache=False)])
+
+    assert result == [{'id': 1}]
+    assert limiter.snapshot()['paused_for_seconds'] == 0.0
+
+def test_get_in_flight_during_a_write_is_not_cached(gateway, monkeypatch):
+    release = asyncio.Event()
+
+    async def dispatch(client, method, url, headers, params=None, data=None, stream=False):
+        if method.upper() == 'GET':
+            await release.wait()
+            body = b'[{"id": 1, "summary": "before the write"}]'
+        else:
+            body = b'{"id": 2}'
+        return httpx.Response(200, content=body, request=httpx.Request(method, url))
+
+    monkeypatch.setattr(server, '_dispatch_request', dispatch)
+
+    async def scenario():
+        try:
+            read = asyncio.create_task(server.make_api_request('GET', '/service/tickets'))
+            await asyncio.sleep(0)
+            await server.make_api_request('POST', '/service/tickets', data={'summary': 'new'})
+            release.set()
+            await read
+        finally:
+            await server.http_clients.shutdown()
+
+    asyncio.run(scenario())
+    assert server.response_cache.get('/service/tickets') is None
+    assert server.response_cache.stats()['stale_sets'] == 1
+
+class FakeAPIDatabase:
+    """Stands in for the AsyncDatabase-wrapped APIDatabase; every path but /unknown is documented"""
+    async def find_endpoint_by_path_method(self, path, method):
+        return None if path.startswith('/unknown') else {'id': 1, 'path': path, 'method': method.lower()}
+
+class FakeUpstream:
+    """Records make_api_request calls and how many were in flight at once"""
+    def __init__(self, delays=None, results=None):
+        self.delays = delays or {}
+        self.results = results or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.order = []
+
+    async def request(self, method, path, params=None, data=None, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.order.append(('start', method, path))
+        try:
+            await asyncio.sleep(self.delays.get(path, 0.01))
+            result = self.results.get(path, {'path': path, 'method': method})
+            if isinstance(result, Exception):
+                raise result
+            return result
+        finally:
+            self.in_flight -= 1
+            self.order.append(('end', method, path))
+
+@pytest.fixture
+def batch(monkeypatch):
+    monkeypatch.setattr(server, 'api_db', FakeAPIDatabase())
+
+    def run(calls, upstream=None, **options):
+        upstream = upstream or FakeUpstream()
+        monkeypatch.setattr(server, 'make_api_request', upstream.request)
+        return json.loads(asyncio.run(server.execute_api_calls_batch(calls, **options))), upstream
+    return run
+
+def test_batch_results_are_in_input_order(batch):
+    upstream = FakeUpstream(delays={'/service/tickets/1': 0.05, '/service/tickets/2': 0.01, '/service/tickets/3': 0.03})
+    response, _ = batch([{'path': f'/service/tickets/{record_id}'} for record_id in (1, 2, 3)], upstream)
+
+    assert [result['index'] for result in response['results']] == [0, 1, 2]
+    assert [result['result']['path'] for result in response['results']] == [
+        '/service/tickets/1', '/service/tickets/2', '/service/tickets/3'
+    ]
+    assert response['summary'] == {'total': 3, 'succeeded': 3, 'failed': 0}
+
+def test_batch_concurrency_is_capped(batch):
+    calls = [{'path': f'/service/tickets/{record_id}'} for record_id in range(12)]
+    _, upstream = batch(calls, max_concurrency=3)
+    assert upstream.max_in_flight == 3
+
+def test_batch_item_timeout_overrides_the_default(batch):
+    upstream = FakeUpstream(delays={'/service/tickets/slow': 0.5, '/service/tickets/patient': 0.1})
+    response, _ = batch([
+        {'path': '/service/tickets/slow', 'timeout': 0.05},
+        {'path': '/service/tickets/patient', 'timeout': 1},
+    ], upstream, timeout_per_item=0.01)
+
+    slow, patient = response['results']
+    assert slow['ok'] is False and slow['error'] == 'Timed out after 0.05s'
+    assert patient['ok'] is True
+    assert response['summary']['failed'] == 1
+
+def test_batch_writes_run_one_at_a_time_in_input_order(batch):
+    writes = [{'path': f'/service/tickets/{record_id}', 'method': 'PATCH', 'data': []} for record_id in (3, 1, 2)]
+    calls = [{'path': '/service/boards'}] + writes + [{'path': '/company/companies'}]
+    _, upstream = batch(calls, max_concurrency=10)
+
+    write_events = [event for event in upstream.order if event[1] == 'PATCH']
+    assert write_events == [
+        (edge, 'PATCH', f'/service/tickets/{record_id}') for record_id in (3, 1, 2) for edge in ('start', 'end')
+    ]
+
+def test_batch_writes_may_run_in_parallel(batch):
+    writes = [{'path': f'/service/tickets/{record_id}', 'method': 'DELETE'} for record_id in range(4)]
+    _, upstream = batch(writes, sequential_writes=False, max_concurrency=10)
+    assert upstream.max_in_flight == 4
+
+def test_batch_truncates_long_lists_and_reports_failures(batch):
+    upstream = FakeUpstream(results={
+        '/service/tickets': [{'id': record_id} for record_id in range(25)],
+        '/service/boards': [{'id': 1}],
+        '/service/tickets/404': server.APIError('HTTP error 404: Not Found', status_code=404),
+    })
+    response, _ = batch([
+        {'path': '/service/tickets'},
+        {'path': '/service/boards'},
+        {'path': '/service/tickets/404'},
+        {'path': '/unknown/path'},
+        {'method': 'GET'},
+    ], upstream, max_items_per_result=5)
+
+    tickets, boards, missing, undocumented, invalid = response['results']
+    assert tickets['truncated'] is True and tickets['total_items'] == 25
+    assert tickets['result'] == [{'id': record_id} for record_id in range(5)]
+    assert boards == {'index': 1, 'method': 'GET', 'path': '/service/boards', 'ok': True, 'result': [{'id': 1}]}
+    assert missing['ok'] is False and missing['status_code'] == 404
+    assert undocumented['ok'] is False and 'No documented API endpoint' in undocumented['error']
+    assert invalid == {'index': 4, 'ok': False, 'error': "Invalid call specification: 'path' is required"}
+    assert response['summary'] == {'total': 5, 'succeeded': 2, 'failed': 3}
@@ -0,0 +1,115 @@
+import asyncio
+import gc
+
+import pytest
+
+from api_gateway.single_flight import SingleFlight
+
+class UpstreamError(Exception):
+    pass
+
+def test_concurrent_callers_share_one_call():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return {'id': 1}
+
+        callers = [asyncio.create_task(flight.do('GET /service/tickets/1', fetch)) for _ in range(5)]
+        await asyncio.sleep(0)
+        assert flight.in_flight == 1
+        release.set()
+        results = await asyncio.gather(*callers)
+        return flight, calls, results
+
+    flight, calls, results = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {'in_flight': 0, 'started': 1, 'coalesced': 4}
+
+def test_exception_reaches_every_waiter_and_is_not_cached():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await release.wait()
+            raise UpstreamError('503 from upstream')
+
+        callers = [asyncio.create_task(flight.do('key', failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*callers, return_exceptions=True)
+        assert flight.in_flight == 0
+
+        async def succeeding():
+            calls.append(1)
+            return 'ok'
+
+        return outcomes, await flight.do('key', succeeding), calls
+
+    outcomes, retried, calls = asyncio.run(scenario())
+    assert all(isinstance(outcome, UpstreamError) for outcome in outcomes)
+    assert all(outcome is outcomes[0] for outcome in outcomes)
+    assert retried == 'ok'
+    assert len(calls) == 2
+
+def test_cancelling_the_leader_does_not_cancel_the_shared_call():
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+        finished = []
+
+        async def fetch():
+            await release.wait()
+            finished.append(1)
+            return 'result'
+
+        leader = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do('key', fetch))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        await asyncio.sleep(0)
+        assert leader.cancelled()
+        assert flight.in_flight == 1
+
+        release.set()
+        return await follower, finished, flight
+
+    result, finished, flight = asyncio.run(scenario())
+    assert result == 'result'
+    assert finished == [1]
+    assert flight.stats() == {'in_flight': 0, 'started': 1, 'coalesced': 1}
+
+def test_failure_after_every_waiter_was_cancelled_is_retrieved(caplog):
+    async def scenario():
+        flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise UpstreamError('timeout')
+
+        caller = asyncio.create_task(flight.do('key', failing))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert flight.in_flight == 0
+
+    with caplog.at_level('ERROR', logger='asyncio'):
+        asyncio.run(scenario())
+        gc.collect()
+    assert 'exception was never retrieved' not in caplog.text
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+from api_gateway.streaming_json import JSONStreamReader, PartialList, read_json_items
+
+DOCUMENTS = [
+    '[15000000000.0, -0.0, 123456789]',
+    '[1e5, 2E-3, -12.5e+2, 0]',
+    '[true, false, null, "x", 7]',
+    '[{"id": 1, "rate": 12.75}, {"id": 2, "tags": ["a", "b"]}, 3.25]',
+    ' [ 1 ,\n 2 ,\t 3 ] ',
+    '["café ✓", "escaped \\" quote", 10]',
+    '[]',
+    '{"id": 5, "value": 1.5}',
+    '42.5',
+]
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+async def _split(data: bytes, offset: int):
+    yield data[:offset]
+    yield data[offset:]
+
+async def _decode(chunks):
+    reader = JSONStreamReader()
+    values = [value async for value in reader.values(chunks)]
+    if reader.is_array:
+        return values
+    return values[0] if values else {}
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+def test_split_at_every_byte_offset(document):
+    data = document.encode('utf-8')
+    expected = json.loads(document)
+    for offset in range(len(data) + 1):
+        assert asyncio.run(_decode(_split(data, offset))) == expected, offset
+
+@pytest.mark.parametrize('document', DOCUMENTS)
+@pytest.mark.parametrize('size', [1, 2, 3, 7, 13, 19])
+def test_fixed_chunk_sizes(document, size):
+    data = document.encode('utf-8')
+    assert asyncio.run(_decode(_chunks(data, size))) == json.loads(document)
+
+def test_invalid_array_raises():
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(_decode(_chunks(b'[1, 2', 1)))
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(_decode(_chunks(b'[1., 2]', 2)))
+
+def test_read_json_items_truncates_and_counts():
+    data = json.dumps(list(range(10))).encode('utf-8')
+    items = asyncio.run(read_json_items(_chunks(data, 3), 4, count_total=True, full_read_bytes=0))
+    assert isinstance(items, PartialList)
+    assert items == [0, 1, 2, 3]
+    assert items.total_count == 10
+
+    items = asyncio.run(read_json_items(_chunks(data, 3), 10, full_read_bytes=0))
+    assert items == list(range(10))
+    assert not isinstance(items, PartialList)
+
+def test_read_json_items_reads_small_bodies_in_full():
+    data = json.dumps([{'id': record_id} for record_id in range(25)]).encode('utf-8')
+    read = []
+
+    async def chunks():
+        for start in range(0, len(data), 64):
+            read.append(start)
+            yield data[start:start + 64]
+
+    items = asyncio.run(read_json_items(chunks(), 10, full_read_bytes=len(data)))
+    assert items == json.loads(data)
+    assert not isinstance(items, PartialList)
+    assert len(read) == -(-len(data) // 64)
+
+def test_read_json_items_stops_early_on_large_bodies():
+    data = json.dumps([{'id': record_id, 'notes': 'x' * 100} for record_id in range(1000)]).encode('utf-8')
+    read = []
+
+    async def chunks():
+        for start in range(0, len(data), 1024):
+            read.append(start)
+            yield data[start:start + 1024]
+
+    items = asyncio.run(read_json_items(chunks(), 10, full_read_bytes=4096))
+    assert isinstance(items, PartialList)
+    assert [item['id'] for item in items] == list(range(10))
+    assert items.total_count is None
+    assert len(read) <= 6
+
+def test_large_element_split_across_many_chunks_is_rescanned_a_few_times():
+    element = {'rows': [{'id': row_id, 'text': 'x' * 30} for row_id in range(20000)]}
+    document = [element, {'id': 2}, 3]
+    data = json.dumps(document).encode('utf-8')
+    reader = JSONStreamReader()
+    decode = reader._decoder.raw_decode
+    attempts = []
+
+    def counting_decode(text, index):
+        attempts.append(len(text) - index)
+        return decode(text, index)
+
+    reader._decoder.raw_decode = counting_decode
+
+    async def collect():
+        return [value async for value in reader.values(_chunks(data, 1024))]
+
+    assert asyncio.run(collect()) == document
+    # About 1100 chunks, but the buffer doubles between attempts on the first element
+    assert len(data) // 1024 > 1000
+    assert len(attempts) < 20
+    assert sum(attempts) < 4 * len(data)